@@ -15,7 +15,11 @@
 # Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
 """Expose package-wide elements."""
 
+from __future__ import annotations
+
 import sys
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 __version__ = "4.5.0"
 """Examples of valid version strings according :pep:`440#version-scheme`:
@@ -56,49 +60,141 @@ from click import *  # noqa: E402, F403
 from click.core import ParameterSource  # noqa: E402
 from cloup import *  # type: ignore[no-redef] # noqa: E402, F403
 
-from .colorize import (  # noqa: E402
-    ColorOption,
-    HelpExtraFormatter,
-    HelpExtraTheme,
-    HelpOption,
-)
-from .commands import (  # noqa: E402
-    ExtraCommand,
-    ExtraContext,
-    ExtraGroup,
-)
-from .config import ConfigOption  # noqa: E402
-from .decorators import (  # type: ignore[no-redef] # noqa: E402
-    color_option,
-    command,
-    config_option,
-    extra_command,
-    extra_group,
-    group,
-    help_option,
-    show_params_option,
-    table_format_option,
-    telemetry_option,
-    timer_option,
-    verbosity_option,
-    version_option,
+# Remove the Click and Cloup members we override with our own, so they can be served
+# lazily by ``__getattr__`` below. That includes the ``click.decorators`` module, leaked
+# by the star import, which would otherwise shadow our own ``decorators`` submodule.
+del (  # type: ignore[name-defined] # noqa: E402, F821
+    HelpOption,  # noqa: F405
+    command,  # noqa: F405
+    decorators,  # noqa: F405
+    group,  # noqa: F405
+    help_option,  # noqa: F405
+    version_option,  # noqa: F405
 )
-from .logging import (  # noqa: E402
-    ExtraLogFormatter,
-    ExtraLogHandler,
-    VerbosityOption,
-    extra_basic_config,
-)
-from .parameters import (  # noqa: E402
-    ExtraOption,
-    ParamStructure,
-    ShowParamsOption,
-)
-from .tabulate import TableFormatOption  # noqa: E402
-from .telemetry import TelemetryOption  # noqa: E402
-from .testing import ExtraCliRunner  # noqa: E402
-from .timer import TimerOption  # noqa: E402
-from .version import VersionOption  # noqa: E402
+
+if TYPE_CHECKING:
+    from .colorize import (
+        ColorOption,
+        HelpExtraFormatter,
+        HelpExtraTheme,
+        HelpOption,
+    )
+    from .commands import (
+        ExtraCommand,
+        ExtraContext,
+        ExtraGroup,
+        ExtraLazyGroup,
+    )
+    from .config import ConfigCacheOption, ConfigOption
+    from .decorators import (  # type: ignore[no-redef]
+        color_option,
+        command,
+        config_cache_option,
+        config_option,
+        extra_command,
+        extra_group,
+        group,
+        help_option,
+        show_params_option,
+        table_format_option,
+        telemetry_option,
+        timer_option,
+        verbosity_option,
+        version_option,
+    )
+    from .logging import (
+        ExtraLogFormatter,
+        ExtraLogHandler,
+        VerbosityOption,
+        extra_basic_config,
+    )
+    from .parameters import (
+        ExtraOption,
+        ParamStructure,
+        ShowParamsOption,
+    )
+    from .tabulate import TableFormatOption
+    from .telemetry import TelemetryOption
+    from .testing import ExtraCliRunner
+    from .timer import TimerOption
+    from .version import VersionOption
+
+
+_LAZY_MEMBERS: dict[str, str] = {
+    "ColorOption": "colorize",
+    "HelpExtraFormatter": "colorize",
+    "HelpExtraTheme": "colorize",
+    "HelpOption": "colorize",
+    "ExtraCommand": "commands",
+    "ExtraContext": "commands",
+    "ExtraGroup": "commands",
+    "ExtraLazyGroup": "commands",
+    "ConfigCacheOption": "config",
+    "ConfigOption": "config",
+    "color_option": "decorators",
+    "command": "decorators",
+    "config_cache_option": "decorators",
+    "config_option": "decorators",
+    "extra_command": "decorators",
+    "extra_group": "decorators",
+    "group": "decorators",
+    "help_option": "decorators",
+    "show_params_option": "decorators",
+    "table_format_option": "decorators",
+    "telemetry_option": "decorators",
+    "timer_option": "decorators",
+    "verbosity_option": "decorators",
+    "version_option": "decorators",
+    "ExtraLogFormatter": "logging",
+    "ExtraLogHandler": "logging",
+    "VerbosityOption": "logging",
+    "extra_basic_config": "logging",
+    "ExtraOption": "parameters",
+    "ParamStructure": "parameters",
+    "ShowParamsOption": "parameters",
+    "TableFormatOption": "tabulate",
+    "TelemetryOption": "telemetry",
+    "ExtraCliRunner": "testing",
+    "TimerOption": "timer",
+    "VersionOption": "version",
+}
+"""Map Click Extra's own members to the submodule implementing them.
+
+These members are not imported with the package, but resolved on first access by
+``__getattr__``. This spares CLIs the cost of loading heavy dependencies (``requests``,
+``yaml``, ``tabulate``, ...) they might never use.
+"""
+
+
+_SUBMODULES = frozenset((*_LAZY_MEMBERS.values(), "platforms"))
+"""Submodules exposed as attributes of the package, imported on first access."""
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazy members and submodules on first access.
+
+    Resolved members are then cached in the module's namespace, so ``__getattr__`` is
+    only called once per member.
+
+    Implements :pep:`562`.
+    """
+    if name in _SUBMODULES:
+        # Importing a submodule sets it as an attribute of the package.
+        return import_module(f".{name}", __name__)
+    module_name = _LAZY_MEMBERS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    member = getattr(import_module(f".{module_name}", __name__), name)
+    # XXX ``globals`` is shadowed by ``click.globals`` module from the star import.
+    setattr(sys.modules[__name__], name, member)
+    return member
+
+
+def __dir__() -> list[str]:
+    """Expose lazy members to introspection, along the ones already loaded."""
+    return sorted(set(vars(sys.modules[__name__])).union(_LAZY_MEMBERS, _SUBMODULES))
+
 
 __all__ = [  # noqa: F405
     "Abort",
@@ -124,7 +220,9 @@ __all__ = [  # noqa: F405
     "Command",
     "command",
     "CommandCollection",
+    "config_cache_option",
     "config_option",
+    "ConfigCacheOption",
     "ConfigOption",
     "confirm",
     "confirmation_option",
@@ -144,6 +242,7 @@ __all__ = [  # noqa: F405
     "ExtraCommand",
     "ExtraContext",
     "ExtraGroup",
+    "ExtraLazyGroup",
     "ExtraLogFormatter",
     "ExtraLogHandler",
     "ExtraOption",
@@ -223,4 +322,8 @@ __all__ = [  # noqa: F405
 
 .. note::
     The content of ``__all__` is checked and enforced in unittests.
+
+.. note::
+    ``from click_extra import *`` still works as expected: each member of ``__all__``
+    provided by Click Extra is resolved by ``__getattr__``, which loads all submodules.
 """
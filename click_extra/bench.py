@@ -0,0 +1,788 @@
+# Copyright Kevin Deldycke <kevin@deldycke.com> and contributors.
+#
+# This program is Free Software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+"""Benchmarks to track Click Extra performances.
+
+.. tip::
+    When the module is called directly, it exposes a CLI to run the benchmarks:
+
+    .. code-block:: shell-session
+
+        $ python -m click_extra.bench imports --runs 10 --budget 150
+        $ python -m click_extra.bench invoke --runs 50
+        $ python -m click_extra.bench config --entries 1000
+        $ python -m click_extra.bench yaml --entries 5000
+        $ python -m click_extra.bench snapshot --entries 1000
+        $ python -m click_extra.bench trees --runs 5
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import platform
+import re
+import subprocess
+import sys
+from contextlib import redirect_stderr, redirect_stdout
+from importlib.util import find_spec
+from io import StringIO
+from pathlib import Path
+from statistics import median
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Collection, NamedTuple, Sequence
+
+from . import (
+    ClickException,
+    Command,
+    ConfigOption,
+    FloatRange,
+    Group,
+    IntRange,
+    Option,
+    UsageError,
+    cache,
+    echo,
+    extra_group,
+    option,
+    pass_context,
+    table_format_option,
+)
+from . import Path as PathType
+from .commands import default_extra_params
+from .config import Formats
+
+IMPORTTIME_REGEX = re.compile(
+    r"^import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \|"
+    r" (?P<indent> *)(?P<module>\S+)$",
+)
+"""Parse a line produced by ``python -X importtime``.
+
+Nesting level of imports is rendered with 2 spaces of indentation per level.
+"""
+
+
+class ImportRecord(NamedTuple):
+    """Timings of a single module import, in microseconds."""
+
+    module: str
+    level: int
+    self_us: int
+    cumulative_us: int
+    parent: str | None = None
+
+
+def parse_importtime(output: str) -> list[ImportRecord]:
+    """Parse the ``<stderr>`` output of ``python -X importtime``.
+
+    Returns the list of imports in the order they were completed, i.e. children before
+    their parents. Each record is tagged with the module that triggered its import.
+    """
+    records: list[ImportRecord] = []
+    # Index of records whose parent has not been reached yet.
+    orphans: list[int] = []
+    for line in output.splitlines():
+        match = IMPORTTIME_REGEX.match(line)
+        if not match:
+            continue
+        record = ImportRecord(
+            module=match["module"],
+            level=len(match["indent"]) // 2,
+            self_us=int(match["self"]),
+            cumulative_us=int(match["cumulative"]),
+        )
+        # All orphans deeper than the current record are its children.
+        while orphans and records[orphans[-1]].level > record.level:
+            index = orphans.pop()
+            records[index] = records[index]._replace(parent=record.module)
+        orphans.append(len(records))
+        records.append(record)
+    return records
+
+
+def top_level(module: str) -> str:
+    """Returns the top-level package of a dotted module path."""
+    return module.split(".", 1)[0]
+
+
+@cache
+def is_stdlib(package: str) -> bool:
+    """Returns ``True`` if the top-level ``package`` is part of Python's standard
+    library."""
+    if package in sys.builtin_module_names:
+        return True
+    stdlib_names = getattr(sys, "stdlib_module_names", None)
+    if stdlib_names is not None:
+        return package in stdlib_names
+    # Python < 3.10 fallback: anything not installed in site-packages is stdlib.
+    spec = find_spec(package)
+    if spec is None or spec.origin is None:
+        return True
+    return "site-packages" not in spec.origin
+
+
+def aggregate_imports(
+    records: list[ImportRecord],
+    module: str = "click_extra",
+    loaded: Collection[str] | None = None,
+) -> dict[str, int]:
+    """Aggregate import records of ``module`` into cumulative timings, in
+    microseconds.
+
+    Only the imports triggered by ``module`` are considered. Modules loaded at
+    interpreter startup (by ``site`` and ``.pth`` hooks) are ignored.
+
+    Produces one entry per submodule of the package ``module`` belongs to, and one
+    entry per top-level third-party dependency. The cost of a dependency is the sum of
+    the cumulative timings of its imports that were triggered from outside itself.
+
+    Standard library modules are not reported on their own, and are accounted for in
+    the cumulative timings of the modules importing them.
+
+    ``loaded`` are the names of the modules found in ``sys.modules`` after the import
+    of ``module``. If provided, records of other modules are ignored: these are failed
+    imports, like optional dependencies probed with ``try``/``except ImportError``.
+    """
+    package = top_level(module)
+    parents = {record.module: record.parent for record in records}
+
+    def triggered_by_module(name: str | None) -> bool:
+        while name is not None:
+            if name == module:
+                return True
+            name = parents.get(name)
+        return False
+
+    timings: dict[str, int] = {}
+    for record in records:
+        if not triggered_by_module(record.module):
+            continue
+        if loaded is not None and record.module not in loaded:
+            continue
+
+        if top_level(record.module) == package:
+            timings[record.module] = record.cumulative_us
+            continue
+
+        dependency = top_level(record.module)
+        if is_stdlib(dependency):
+            continue
+        if record.parent and top_level(record.parent) == dependency:
+            continue
+        timings[dependency] = timings.get(dependency, 0) + record.cumulative_us
+    return timings
+
+
+def measure_imports(module: str = "click_extra", runs: int = 5) -> dict[str, int]:
+    """Import ``module`` in ``runs`` fresh interpreters and returns the median of
+    aggregated timings, in microseconds.
+
+    A first, discarded run warms up the bytecode cache. Each run also prints the
+    content of ``sys.modules``, to tell failed imports apart.
+    """
+    code = f"import sys, {module}; print(*sys.modules, sep='\\n')"
+    samples: list[dict[str, int]] = []
+    for index in range(runs + 1):
+        result = subprocess.run(
+            (sys.executable, "-X", "importtime", "-c", code),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        if index:
+            loaded = frozenset(result.stdout.splitlines())
+            samples.append(
+                aggregate_imports(parse_importtime(result.stderr), module, loaded),
+            )
+
+    keys = {key for sample in samples for key in sample}
+    return {
+        key: int(median(sample.get(key, 0) for sample in samples))
+        for key in sorted(keys)
+    }
+
+
+def read_baseline(path: Path) -> dict[str, int]:
+    """Load timings from a JSON baseline file."""
+    return json.loads(path.read_text())["timings"]  # type: ignore[no-any-return]
+
+
+def load_reference(baseline: Path | None, save_baseline: bool) -> dict[str, int]:
+    """Returns the timings of the ``baseline`` file to compare against.
+
+    Returns an empty ``dict`` if no baseline is provided, if the file doesn't exist
+    yet, or if it is about to be overwritten by ``--save-baseline``.
+
+    Raises ``UsageError`` if ``--save-baseline`` is set without a ``baseline``.
+    """
+    if save_baseline and not baseline:
+        msg = "--save-baseline requires --baseline."
+        raise UsageError(msg)
+    if not baseline or not baseline.exists() or save_baseline:
+        return {}
+    logging.getLogger("click_extra").debug(f"Baseline loaded from {baseline}")
+    return read_baseline(baseline)
+
+
+def baseline_columns(
+    value: int,
+    ref_value: int | None,
+    precision: int = 2,
+) -> tuple[str | None, str | None]:
+    """Returns the ``Baseline (ms)`` and ``Delta`` columns of a row, comparing the
+    ``value`` timing to its ``ref_value`` reference, both in microseconds."""
+    if ref_value is None:
+        return None, None
+    delta = f"{(value - ref_value) / ref_value:+.1%}" if ref_value else None
+    return f"{ref_value / 1000:.{precision}f}", delta
+
+
+def write_baseline(path: Path, module: str, timings: dict[str, int]) -> None:
+    """Save timings to a JSON baseline file, along with the environment they were
+    measured in."""
+    path.write_text(
+        json.dumps(
+            {
+                "module": module,
+                "python": platform.python_version(),
+                "platform": sys.platform,
+                "timings": timings,
+            },
+            indent=2,
+            sort_keys=True,
+        )
+        + "\n",
+    )
+
+
+INVOKE_CASES: tuple[tuple[str, ...], ...] = (
+    ("--help",),
+    ("--version",),
+    ("--color", "--version"),
+    ("subcommand", "--help"),
+    ("subcommand",),
+)
+"""Arguments the demo CLI is invoked with by the ``invoke`` benchmark."""
+
+
+def demo_cli(config_path: Path) -> Command:
+    """Build a CLI with a subcommand and all default options, whose configuration is
+    read from ``config_path``."""
+    params = [
+        ConfigOption(default=str(config_path)) if isinstance(p, ConfigOption) else p
+        for p in default_extra_params()
+    ]
+
+    @extra_group(version="1.0.0", params=params)
+    @option("--level", default=1)
+    def demo(level):
+        pass
+
+    @demo.command()
+    @option("--name", default="foo")
+    def subcommand(name):
+        echo(name)
+
+    return demo  # type: ignore[no-any-return]
+
+
+def measure_invocations(
+    cli: Command,
+    cases: Sequence[Sequence[str]] = INVOKE_CASES,
+    runs: int = 20,
+) -> dict[str, int]:
+    """Invoke ``cli`` in-process ``runs`` times with each set of arguments, and
+    returns the median timings, in microseconds.
+
+    Output of the CLI is discarded. A first, discarded run warms up caches.
+    """
+    timings = {}
+    for args in cases:
+        samples = []
+        for index in range(runs + 1):
+            with redirect_stdout(StringIO()), redirect_stderr(StringIO()):
+                start = perf_counter()
+                cli.main(args=list(args), prog_name="demo", standalone_mode=False)
+                elapsed = perf_counter() - start
+            if index:
+                samples.append(elapsed)
+        timings[" ".join(args)] = int(median(samples) * 1_000_000)
+    return timings
+
+
+def config_fixture(conf_format: Formats, entries: int) -> str:
+    """Produce the content of a configuration file in ``conf_format``, with ``entries``
+    string parameters for the ``demo`` CLI."""
+    items = [(f"key_{index}", f"value {index}") for index in range(entries)]
+    if conf_format == Formats.TOML:
+        lines = ["[demo]"] + [f'{key} = "{value}"' for key, value in items]
+    elif conf_format == Formats.YAML:
+        lines = ["demo:"] + [f"  {key}: {value}" for key, value in items]
+    elif conf_format == Formats.JSON:
+        return json.dumps({"demo": dict(items)}, indent=2)
+    elif conf_format == Formats.INI:
+        lines = ["[demo]"] + [f"{key} = {value}" for key, value in items]
+    else:
+        lines = ["<demo>"] + [f"  <{key}>{value}</{key}>" for key, value in items]
+        lines.append("</demo>")
+    return "\n".join(lines) + "\n"
+
+
+def measure_config_loads(
+    entries: int = 1000,
+    runs: int = 5,
+) -> dict[str, dict[str, int]]:
+    """Parse a configuration file of each format, and returns the median timings, in
+    microseconds.
+
+    Each file is parsed twice: once with the format picked from its extension, then
+    with formats picked from its content, as is done for extension-less sources.
+    """
+    cli = demo_cli(Path("demo.toml"))
+    ctx = cli.context_class(cli, info_name="demo")
+    conf_option = ConfigOption()
+    timings: dict[str, dict[str, int]] = {"extension": {}, "content": {}}
+    with ctx.scope():
+        for conf_format in Formats:
+            content = config_fixture(conf_format, entries)
+            location = f"demo.{conf_format.value[0]}"
+            for mode, target in (("extension", location), ("content", None)):
+                samples = []
+                for _ in range(runs):
+                    start = perf_counter()
+                    conf = conf_option.parse_conf(content, target)
+                    samples.append(perf_counter() - start)
+                    assert conf is not None
+                timings[mode][conf_format.name] = int(median(samples) * 1_000_000)
+    return timings
+
+
+YAML_LOADERS: tuple[str, ...] = (
+    "SafeLoader",
+    "CSafeLoader",
+    "FullLoader",
+    "CFullLoader",
+)
+"""``PyYAML`` loaders compared by the ``yaml`` benchmark."""
+
+
+def measure_yaml_loaders(entries: int = 5000, runs: int = 5) -> dict[str, int]:
+    """Parse a YAML configuration file with each of the available ``YAML_LOADERS``,
+    and returns the median timings, in microseconds.
+
+    C loaders are missing from the results if ``PyYAML`` was not built with
+    ``libyaml``.
+    """
+    import yaml
+
+    content = config_fixture(Formats.YAML, entries)
+    timings = {}
+    for name in YAML_LOADERS:
+        loader = getattr(yaml, name, None)
+        if loader is None:
+            continue
+        samples = []
+        for _ in range(runs):
+            start = perf_counter()
+            yaml.load(content, Loader=loader)  # noqa: S506
+            samples.append(perf_counter() - start)
+        timings[name] = int(median(samples) * 1_000_000)
+    return timings
+
+
+COLD_START_SCRIPT = """
+import sys
+
+from click import Command, Option
+
+from click_extra.config import ConfigOption
+
+path, entries, snapshot = sys.argv[1], int(sys.argv[2]), sys.argv[3] == "on"
+params = [Option([f"--key-{index}"]) for index in range(entries)]
+params.append(ConfigOption(default=path, snapshot=snapshot))
+Command("demo", params=params, callback=lambda **kwargs: None).main(
+    args=[], standalone_mode=False
+)
+"""
+"""Script run in a fresh interpreter by ``measure_cold_starts()``. It invokes a CLI
+with one option per entry of the configuration file."""
+
+
+def measure_cold_starts(
+    entries: int = 1000,
+    runs: int = 5,
+) -> dict[str, dict[str, int]]:
+    """Invoke a CLI reading a configuration file of each format in ``runs`` fresh
+    interpreters, and returns the median timings, in microseconds.
+
+    The CLI is invoked with and without configuration snapshots. A first, discarded
+    run warms up the bytecode cache and compiles the snapshot.
+    """
+    timings: dict[str, dict[str, int]] = {"source": {}, "snapshot": {}}
+    with TemporaryDirectory() as temp_dir:
+        for conf_format in Formats:
+            config_path = Path(temp_dir) / f"demo.{conf_format.value[0]}"
+            config_path.write_text(config_fixture(conf_format, entries))
+            for mode in timings:
+                samples = []
+                for index in range(runs + 1):
+                    start = perf_counter()
+                    subprocess.run(
+                        (
+                            sys.executable,
+                            "-c",
+                            COLD_START_SCRIPT,
+                            str(config_path),
+                            str(entries),
+                            "on" if mode == "snapshot" else "off",
+                        ),
+                        capture_output=True,
+                        check=True,
+                    )
+                    if index:
+                        samples.append(perf_counter() - start)
+                timings[mode][conf_format.name] = int(median(samples) * 1_000_000)
+    return timings
+
+
+TREE_SIZES: tuple[int, ...] = (10, 100, 1000, 10000)
+"""Number of parameters of the synthetic CLIs measured by the ``trees`` benchmark."""
+
+
+def synthetic_cli(params: int) -> Command:
+    """Build a group whose ``params`` options are spread over subcommands of 10 options
+    each, cycling through string, integer, float and boolean types."""
+    types = (str, int, float, bool)
+    commands = [
+        Command(
+            f"cmd-{cmd_index}",
+            params=[
+                Option([f"--opt-{index}"], type=types[index % len(types)])
+                for index in range(cmd_index * 10, min(params, cmd_index * 10 + 10))
+            ],
+        )
+        for cmd_index in range((params + 9) // 10)
+    ]
+    return Group(
+        "synthetic",
+        params=[ConfigOption()],
+        commands={cmd.name: cmd for cmd in commands},
+    )
+
+
+def measure_param_trees(
+    sizes: Sequence[int] = TREE_SIZES,
+    runs: int = 5,
+) -> dict[int, int]:
+    """Build the parameter trees of a synthetic CLI of each size, and returns the
+    median timings, in microseconds."""
+    timings = {}
+    for size in sizes:
+        cli = synthetic_cli(size)
+        conf_option = next(p for p in cli.params if isinstance(p, ConfigOption))
+        ctx = cli.context_class(cli, info_name="synthetic")
+        samples = []
+        with ctx.scope():
+            for _ in range(runs):
+                start = perf_counter()
+                conf_option.build_param_trees()
+                samples.append(perf_counter() - start)
+        timings[size] = int(median(samples) * 1_000_000)
+    return timings
+
+
+@extra_group
+def bench():
+    """Benchmarks of Click Extra."""
+
+
+@bench.command()
+@option(
+    "--module",
+    default="click_extra",
+    help="Module to import.",
+)
+@option(
+    "--runs",
+    type=IntRange(min=1),
+    default=5,
+    help="Number of fresh interpreters to measure. The median is reported.",
+)
+@option(
+    "--baseline",
+    type=PathType(dir_okay=False, path_type=Path),
+    help="JSON file of reference timings to compare against.",
+)
+@option(
+    "--save-baseline",
+    is_flag=True,
+    default=False,
+    help="Save the measured timings as the new baseline.",
+)
+@option(
+    "--budget",
+    type=FloatRange(min=0),
+    help="Maximum cumulative import time of the module, in milliseconds.",
+)
+@option(
+    "--tolerance",
+    type=FloatRange(min=0),
+    default=10,
+    help="Maximum regression of the module's import time against the baseline, "
+    "in percent.",
+)
+@table_format_option
+@pass_context
+def imports(ctx, module, runs, baseline, save_baseline, budget, tolerance):
+    """Measure import time of a module, its submodules and its dependencies."""
+    reference = load_reference(baseline, save_baseline)
+
+    timings = measure_imports(module, runs)
+    if module not in timings:
+        msg = f"No import time measured for {module}."
+        raise ClickException(msg)
+
+    table = [
+        (
+            key,
+            "submodule" if top_level(key) == top_level(module) else "dependency",
+            f"{value / 1000:.1f}",
+            *baseline_columns(value, reference.get(key), precision=1),
+        )
+        for key, value in sorted(timings.items(), key=lambda i: i[1], reverse=True)
+    ]
+    ctx.print_table(
+        table,
+        headers=("Module", "Kind", "Time (ms)", "Baseline (ms)", "Delta"),
+    )
+
+    if baseline and save_baseline:
+        write_baseline(baseline, module, timings)
+        echo(f"Baseline saved to {baseline}")
+
+    total_ms = timings[module] / 1000
+    errors = []
+    if budget is not None and total_ms > budget:
+        errors.append(f"{module} import takes {total_ms:.1f} ms, over {budget} ms.")
+    if reference.get(module):
+        limit = reference[module] * (1 + tolerance / 100)
+        if timings[module] > limit:
+            errors.append(
+                f"{module} import takes {total_ms:.1f} ms, regressing by more than "
+                f"{tolerance}% over the {reference[module] / 1000:.1f} ms baseline.",
+            )
+    if errors:
+        raise ClickException(" ".join(errors))
+
+
+@bench.command()
+@option(
+    "--runs",
+    type=IntRange(min=1),
+    default=20,
+    help="Number of invocations to measure per case. The median is reported.",
+)
+@option(
+    "--baseline",
+    type=PathType(dir_okay=False, path_type=Path),
+    help="JSON file of reference timings to compare against.",
+)
+@option(
+    "--save-baseline",
+    is_flag=True,
+    default=False,
+    help="Save the measured timings as the new baseline.",
+)
+@table_format_option
+@pass_context
+def invoke(ctx, runs, baseline, save_baseline):
+    """Measure in-process invocation time of a demo CLI reading a configuration
+    file."""
+    reference = load_reference(baseline, save_baseline)
+
+    with TemporaryDirectory() as temp_dir:
+        config_path = Path(temp_dir) / "demo.toml"
+        config_path.write_text("[demo]\nlevel = 2\n\n[demo.subcommand]\nname = 'bar'\n")
+        timings = measure_invocations(demo_cli(config_path), runs=runs)
+
+    table = [
+        (
+            f"demo {key}",
+            f"{value / 1000:.2f}",
+            *baseline_columns(value, reference.get(key)),
+        )
+        for key, value in timings.items()
+    ]
+    ctx.print_table(
+        table,
+        headers=("Invocation", "Time (ms)", "Baseline (ms)", "Delta"),
+    )
+
+    if baseline and save_baseline:
+        write_baseline(baseline, "demo", timings)
+        echo(f"Baseline saved to {baseline}")
+
+
+@bench.command()
+@option(
+    "--entries",
+    type=IntRange(min=1),
+    default=1000,
+    help="Number of parameters in each configuration file.",
+)
+@option(
+    "--runs",
+    type=IntRange(min=1),
+    default=5,
+    help="Number of parsings to measure per file. The median is reported.",
+)
+@option(
+    "--baseline",
+    type=PathType(dir_okay=False, path_type=Path),
+    help="JSON file of reference timings to compare against.",
+)
+@option(
+    "--save-baseline",
+    is_flag=True,
+    default=False,
+    help="Save the measured timings as the new baseline.",
+)
+@table_format_option
+@pass_context
+def config(ctx, entries, runs, baseline, save_baseline):
+    """Measure parsing time of large configuration files in each format."""
+    reference = load_reference(baseline, save_baseline)
+
+    timings = measure_config_loads(entries, runs)
+
+    table = [
+        (
+            key,
+            f"{value / 1000:.2f}",
+            f"{timings['content'][key] / 1000:.2f}",
+            *baseline_columns(value, reference.get(key)),
+        )
+        for key, value in timings["extension"].items()
+    ]
+    ctx.print_table(
+        table,
+        headers=(
+            "Format",
+            "By extension (ms)",
+            "By content (ms)",
+            "Baseline (ms)",
+            "Delta",
+        ),
+    )
+
+    if baseline and save_baseline:
+        write_baseline(baseline, "config", timings["extension"])
+        echo(f"Baseline saved to {baseline}")
+
+
+@bench.command("yaml")
+@option(
+    "--entries",
+    type=IntRange(min=1),
+    default=5000,
+    help="Number of parameters in the configuration file.",
+)
+@option(
+    "--runs",
+    type=IntRange(min=1),
+    default=5,
+    help="Number of parsings to measure per loader. The median is reported.",
+)
+@table_format_option
+@pass_context
+def yaml_loaders(ctx, entries, runs):
+    """Compare parsing time of a large YAML configuration file with each PyYAML
+    loader."""
+    timings = measure_yaml_loaders(entries, runs)
+    loader = ConfigOption().yaml_loader.__name__
+    reference = timings["SafeLoader"]
+    table = [
+        (
+            name,
+            f"{value / 1000:.2f}",
+            f"{reference / value:.1f}x",
+            "✓" if name == loader else None,
+        )
+        for name, value in timings.items()
+    ]
+    ctx.print_table(table, headers=("Loader", "Time (ms)", "Speedup", "Default"))
+
+
+@bench.command()
+@option(
+    "--entries",
+    type=IntRange(min=1),
+    default=1000,
+    help="Number of parameters in the CLI and its configuration file.",
+)
+@option(
+    "--runs",
+    type=IntRange(min=1),
+    default=5,
+    help="Number of fresh interpreters to measure per case. The median is reported.",
+)
+@table_format_option
+@pass_context
+def snapshot(ctx, entries, runs):
+    """Compare cold-start time of a CLI reading a large configuration file, with and
+    without its compiled snapshot."""
+    timings = measure_cold_starts(entries, runs)
+    table = [
+        (
+            key,
+            f"{value / 1000:.2f}",
+            f"{timings['snapshot'][key] / 1000:.2f}",
+            f"{value / timings['snapshot'][key]:.1f}x",
+        )
+        for key, value in timings["source"].items()
+    ]
+    ctx.print_table(
+        table,
+        headers=(
+            "Format",
+            "Without snapshot (ms)",
+            "With snapshot (ms)",
+            "Speedup",
+        ),
+    )
+
+
+@bench.command()
+@option(
+    "--runs",
+    type=IntRange(min=1),
+    default=5,
+    help="Number of builds to measure per CLI. The median is reported.",
+)
+@table_format_option
+@pass_context
+def trees(ctx, runs):
+    """Measure build time of the parameter trees of synthetic CLIs of growing size."""
+    timings = measure_param_trees(TREE_SIZES, runs)
+    table = [
+        (size, f"{value / 1000:.2f}", f"{value / size:.2f}")
+        for size, value in timings.items()
+    ]
+    ctx.print_table(table, headers=("Parameters", "Time (ms)", "Per parameter (µs)"))
+
+
+if __name__ == "__main__":
+    bench()
@@ -42,6 +42,7 @@ from . import (
     echo,
     get_current_context,
 )
+from .config import ConfigCacheOption, ConfigOption
 from .parameters import ExtraOption
 
 
@@ -317,6 +318,10 @@ class ColorOption(ExtraOption):
 
 
 class HelpOption(ExtraOption):
+    fast_path_dependencies = (ColorOption, ConfigCacheOption, ConfigOption)
+    """Help screen depends on ``ColorOption`` to be rendered, and on the configuration
+    options to display the defaults provided by configuration files."""
+
     @staticmethod
     def print_help(ctx: Context, param: Parameter, value: bool) -> None:
         """Prints help text and exits."""
@@ -388,8 +393,14 @@ class ExtraHelpColorsMixin:
         # Get subcommands and their aliases.
         if hasattr(command, "list_commands"):
             subcommands.update(command.list_commands(ctx))
+            # Sections may hold snapshots or placeholders of subcommands, which saves
+            # us from resolving them all.
+            known = {}
+            if hasattr(command, "list_sections"):
+                for section in command.list_sections(ctx):
+                    known.update(section.commands)
             for sub_id in subcommands:
-                sub_cmd = command.get_command(ctx, sub_id)
+                sub_cmd = known.get(sub_id) or command.get_command(ctx, sub_id)
                 command_aliases.update(getattr(sub_cmd, "aliases", []))
 
         # Add user defined help options.
@@ -23,22 +23,34 @@ leverage the mixins in here to build up your own custom variants.
 from __future__ import annotations
 
 import logging
+from copy import copy
+from importlib import import_module
+from pathlib import Path
 from typing import Any
 
 import click
 import cloup
 
-from . import Command, Group
+from . import Command, Group, cache
 from .colorize import ColorOption, ExtraHelpColorsMixin, HelpOption
 from .config import ConfigOption
-from .logging import VerbosityOption
+from .logging import VerbosityOption, configure_root_logger
 from .parameters import (
     ExtraOption,
+    ParamStructure,
     ShowParamsOption,
     all_envvars,
     normalize_envvar,
     search_params,
 )
+from .platforms import get_cache_dir
+from .snapshot import (
+    CommandSnapshot,
+    fingerprint,
+    load_snapshot,
+    save_snapshot,
+    source_files,
+)
 from .timer import TimerOption
 from .version import VersionOption
 
@@ -63,7 +75,24 @@ class ExtraContext(cloup.Context):
         return meta
 
 
-def default_extra_params():
+@cache
+def _default_extra_params_prototypes() -> tuple[ExtraOption, ...]:
+    """Instantiate the default extra options once per process.
+
+    These prototypes are never attached to a command: only their copies are.
+    """
+    return (
+        TimerOption(),
+        ColorOption(),
+        ConfigOption(),
+        ShowParamsOption(),
+        VerbosityOption(),
+        VersionOption(),
+        HelpOption(),
+    )
+
+
+def default_extra_params() -> list[click.Parameter]:
     """Default additional options added to ``extra_command`` and ``extra_group``.
 
     .. caution::
@@ -99,16 +128,56 @@ def default_extra_params():
         Sensitivity to order still remains to be proven. With the code of Click Extra
         and its dependencies moving fast, there is a non-zero chance that all the
         options are now sound enough to be re-ordered in a more natural way.
+
+    .. note::
+        Options are only instantiated once per process. Each call returns fresh copies
+        of these prototypes, produced by ``ExtraOption.__copy__()``. This keeps the
+        import of CLIs with lots of subcommands cheap, while each command still gets
+        its own options to customize.
     """
-    return [
-        TimerOption(),
-        ColorOption(),
-        ConfigOption(),
-        ShowParamsOption(),
-        VerbosityOption(),
-        VersionOption(),
-        HelpOption(),
-    ]
+    return [copy(param) for param in _default_extra_params_prototypes()]
+
+
+def search_fast_path(
+    cmd: click.Command,
+    info_name: str | None,
+    args: list[str],
+    parent: click.Context | None = None,
+) -> tuple[type[click.Parameter], ...] | None:
+    """Pre-parse the raw ``args`` to search for an informational option, like
+    ``--help`` or ``--version``, that will print something and exit.
+
+    The search descends into the subcommands targeted by ``args``. Returns the types of
+    the options the informational option depends on, or ``None`` if none is found.
+
+    Arguments are parsed for real, with the parser of each command, so option values
+    are never mistaken for flags. Parsing errors end the search, to let the regular
+    processing report them.
+    """
+    settings = {**cmd.context_settings, "resilient_parsing": True}
+    ctx = cmd.context_class(cmd, info_name=info_name, parent=parent, **settings)
+    try:
+        opts, remaining, order = cmd.make_parser(ctx).parse_args(args=args.copy())
+    except click.UsageError:
+        return None
+
+    help_option = cmd.get_help_option(ctx)
+    for param in order:
+        if not opts.get(param.name):  # type: ignore[arg-type]
+            continue
+        if isinstance(param, ExtraOption) and param.fast_path_dependencies is not None:
+            return param.fast_path_dependencies
+        if param is help_option:
+            return HelpOption.fast_path_dependencies
+
+    if isinstance(cmd, click.MultiCommand) and remaining:
+        try:
+            cmd_name, sub_cmd, sub_args = cmd.resolve_command(ctx, remaining)
+        except click.UsageError:
+            return None
+        if sub_cmd is not None:
+            return search_fast_path(sub_cmd, cmd_name, sub_args, ctx)
+    return None
 
 
 class ExtraCommand(ExtraHelpColorsMixin, Command):
@@ -303,9 +372,47 @@ class ExtraCommand(ExtraHelpColorsMixin, Command):
         .. seealso::
             This workaround is being discussed upstream in `click#1279
             <https://github.com/pallets/click/issues/1279#issuecomment-1493348208>`_.
+
+        Arguments of groups are also pre-parsed by ``search_fast_path()``. If an
+        informational option like ``--help`` or ``--version`` is found in a
+        subcommand, the context gets a ``click_extra.fast_path`` meta entry. This skips
+        eager options not needed to print the information, like the loading of
+        configuration files or the setup of loggers.
+
+        .. note::
+            Simple commands do not need this: Click already processes the options
+            found on the command line before the others. For the same reason, groups
+            are only pre-parsed if an informational flag follows a positional
+            argument, which might be a subcommand.
+
+        The ``root`` logger targeted by a ``VerbosityOption`` is configured here, as
+        eager options processed before it, like ``ConfigOption``, may already log.
         """
+        if any(
+            isinstance(param, VerbosityOption) and param.setup_root_logger
+            for param in self.params
+        ):
+            configure_root_logger()
+
         # ``args`` needs to be copied: its items are consummed by the parsing process.
-        extra.update({"meta": {"click_extra.raw_args": args.copy()}})
+        meta: dict[str, Any] = {"click_extra.raw_args": args.copy()}
+
+        # Cheap check for informational flags placed after a potential subcommand,
+        # before pre-parsing the arguments.
+        first_arg = next(
+            (i for i, arg in enumerate(args) if not arg.startswith("-")),
+            len(args),
+        )
+        if isinstance(self, click.MultiCommand) and first_arg < len(args) - 1:
+            flags = set(self.context_settings.get("help_option_names", ("--help",)))
+            for param in self.params:
+                if getattr(param, "fast_path_dependencies", None) is not None:
+                    flags.update(param.opts)
+            if flags.intersection(args[first_arg + 1 :]):
+                fast_path = search_fast_path(self, info_name, args, parent)
+                if fast_path is not None:
+                    meta["click_extra.fast_path"] = fast_path
+        extra.update({"meta": meta})
         return super().make_context(info_name, args, parent, **extra)
 
     def invoke(self, ctx):
@@ -349,6 +456,120 @@ class ExtraGroup(ExtraCommand, Group):
     #
     # command_class = ExtraCommand
 
+    snapshot: bool | str | Path = False
+    """Persistence of the resolved command tree, only supported by ``ExtraLazyGroup``.
+
+    Groups nested in a CLI whose root is an ``ExtraLazyGroup`` with a snapshot are
+    served from it.
+    """
+
+    _command_tree: CommandSnapshot | None = None
+    _building_tree: bool = False
+
+    @property
+    def snapshot_path(self) -> Path | None:
+        """Location of the command tree snapshot, or ``None`` if not enabled."""
+        if not self.snapshot:
+            return None
+        if self.snapshot is True:
+            return Path(get_cache_dir(self.name or "click-extra")) / "command-tree.json"
+        return Path(self.snapshot)
+
+    def command_tree(self, ctx: click.Context) -> CommandSnapshot | None:
+        """Returns the snapshot of the current group's command tree.
+
+        The snapshot is owned by the root group of the CLI. It is loaded from disk on
+        first call, and rebuilt from the live commands if missing or stale.
+
+        Returns ``None`` if snapshots are not enabled, or if the root group has no
+        lazy subcommand left to import. In which case live commands are already
+        available, and cheaper to inspect than the snapshot is to load.
+        """
+        root_ctx = ctx.find_root()
+        root = root_ctx.command
+        if not isinstance(root, ExtraLazyGroup) or root.snapshot_path is None:
+            return None
+        if not root.unloaded_commands:
+            return None
+        # Live commands are being inspected to produce the snapshot.
+        if root._building_tree:
+            return None
+
+        if root._command_tree is None:
+            path = root.snapshot_path
+            digest = fingerprint(root)
+            tree = load_snapshot(path, digest)
+            if tree is None:
+                root._building_tree = True
+                try:
+                    tree = CommandSnapshot.from_command(root, root_ctx)
+                    sources = list(source_files(root, root_ctx))
+                finally:
+                    root._building_tree = False
+                save_snapshot(path, digest, tree, sources)
+            root._command_tree = tree
+
+        # Descend the tree down to the current group.
+        node: CommandSnapshot | None = root._command_tree
+        lineage = []
+        while ctx.parent is not None:
+            lineage.append(ctx.info_name)
+            ctx = ctx.parent
+        for name in reversed(lineage):
+            node = node.find(name) if node and name else None
+        return node
+
+    def list_sections(
+        self,
+        ctx: click.Context,
+        include_default_section: bool = True,
+    ) -> list[cloup.Section]:
+        """Serve sections of subcommands from the command tree snapshot, if any.
+
+        Snapshots of subcommands stand in for live commands, so they are not resolved
+        to render the help screen.
+        """
+        tree = self.command_tree(ctx)
+        if tree is None or not tree.sections:
+            return super().list_sections(  # type: ignore[no-any-return]
+                ctx,
+                include_default_section=include_default_section,
+            )
+        return [
+            cloup.Section(
+                title,
+                {name: tree.commands[name] for name in names},  # type: ignore[misc]
+                is_sorted=is_sorted,
+            )
+            for title, is_sorted, names in tree.sections
+        ]
+
+    def shell_complete(self, ctx: click.Context, incomplete: str):
+        """Complete subcommand names.
+
+        Subcommands found in sections are served from there, as sections may hold
+        snapshots or placeholders of subcommands, which don't need to be resolved.
+        The others, like the ones provided by an overridden ``list_commands()``, are
+        resolved with ``get_command()``, as Click does.
+        """
+        from click.shell_completion import CompletionItem
+
+        known = {
+            name: sub_cmd
+            for section in self.list_sections(ctx)
+            for name, sub_cmd in section.commands.items()
+        }
+        results = []
+        for name in self.list_commands(ctx):
+            if not name.startswith(incomplete):
+                continue
+            sub_cmd = known.get(name) or self.get_command(ctx, name)
+            if sub_cmd is None or sub_cmd.hidden:
+                continue
+            results.append(CompletionItem(name, help=sub_cmd.get_short_help_str()))
+        results.extend(click.Command.shell_complete(self, ctx, incomplete))
+        return results
+
     def command(self, *args, **kwargs):
         """Returns a decorator that creates a new subcommand for this ``Group``.
 
@@ -366,6 +587,129 @@ class ExtraGroup(ExtraCommand, Group):
         return super().command(*args, **kwargs)
 
 
+class ExtraLazyGroup(ExtraGroup):
+    """An ``ExtraGroup`` whose subcommands are only imported when needed.
+
+    .. code-block:: python
+
+        from click_extra import ExtraLazyGroup, extra_group
+
+
+        @extra_group(
+            cls=ExtraLazyGroup,
+            lazy_subcommands={
+                "backup": "my_cli.backup:backup",
+                "restore": "my_cli.restore:restore",
+            },
+            lazy_short_help={"backup": "Backup all the things."},
+        )
+        def my_cli():
+            pass
+    """
+
+    def __init__(
+        self,
+        *args,
+        lazy_subcommands: dict[str, str] | None = None,
+        lazy_short_help: dict[str, str] | None = None,
+        snapshot: bool | str | Path = False,
+        **kwargs: Any,
+    ) -> None:
+        """List of extra parameters:
+
+        :param lazy_subcommands: mapping of subcommand names to the ``module:attribute``
+            import path of their command object. A subcommand is only imported when it
+            is invoked, or otherwise resolved with ``get_command()``.
+        :param lazy_short_help: short help of lazy subcommands, displayed in the
+            help screen and shell completion while they are not imported.
+        :param snapshot: opt-in persistence of the resolved command tree. If ``True``,
+            the snapshot is stored in the user's cache folder. A path to the snapshot
+            file can also be provided. Only used on the root group of the CLI. See
+            :mod:`click_extra.snapshot`.
+        """
+        self.snapshot = snapshot
+        self.lazy_subcommands: dict[str, str] = lazy_subcommands or {}
+        for name, import_path in self.lazy_subcommands.items():
+            if ":" not in import_path:
+                msg = (
+                    f"Import path {import_path!r} of {name!r} lazy subcommand is not "
+                    "of the module:attribute form."
+                )
+                raise ValueError(msg)
+        self.lazy_short_help: dict[str, str] = lazy_short_help or {}
+        super().__init__(*args, **kwargs)
+
+    @property
+    def unloaded_commands(self) -> list[str]:
+        """Names of lazy subcommands that are not imported yet."""
+        return [name for name in self.lazy_subcommands if name not in self.commands]
+
+    def load_command(self, cmd_name: str) -> click.Command:
+        """Import the lazy subcommand ``cmd_name``."""
+        logger = logging.getLogger("click_extra")
+        import_path = self.lazy_subcommands[cmd_name]
+        module_name, _, attr_name = import_path.partition(":")
+        logger.debug(f"Import {cmd_name!r} subcommand from {import_path}")
+        cmd = getattr(import_module(module_name), attr_name)
+        if not isinstance(cmd, click.Command):
+            msg = f"{import_path} is not a command: {cmd!r}"
+            raise TypeError(msg)
+        return cmd
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Returns the names of all subcommands, lazy or not."""
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Import and register lazy subcommands on first access.
+
+        Parameter trees already built by the CLI's ``ParamStructure`` options, like
+        ``ConfigOption``, are built again to include the new subcommand.
+        """
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            self.add_command(self.load_command(cmd_name), cmd_name)
+            root_ctx = ctx.find_root()
+            for param in root_ctx.command.params:
+                if isinstance(param, ParamStructure) and "params_template" in vars(
+                    param,
+                ):
+                    param.build_param_trees(root_ctx)
+        return super().get_command(ctx, cmd_name)  # type: ignore[no-any-return]
+
+    def list_sections(
+        self,
+        ctx: click.Context,
+        include_default_section: bool = True,
+    ) -> list[cloup.Section]:
+        """Adds placeholders of unloaded lazy subcommands to the default section.
+
+        Placeholders are ``CommandSnapshot`` instances carrying the declared short
+        help, so lazy subcommands are not imported to render the help screen.
+        """
+        unloaded = self.unloaded_commands
+        if not unloaded or self.command_tree(ctx) is not None:
+            return super().list_sections(
+                ctx,
+                include_default_section=include_default_section,
+            )
+
+        sections = super().list_sections(ctx, include_default_section=False)
+        if include_default_section:
+            default_commands = dict(self._default_section.commands)
+            for name in unloaded:
+                default_commands[name] = CommandSnapshot(  # type: ignore[assignment]
+                    name=name,
+                    short_help=self.lazy_short_help.get(name),
+                )
+            sections.append(
+                cloup.Section.sorted(
+                    "Other commands" if sections else "Commands",
+                    default_commands,
+                ),
+            )
+        return sections
+
+
 # -0, --zero-exit
 # rospector will exit with a code of 1 (one) if any messages are found. This makes
 # automation easier; if there are any problems at all, the exit code is non-zero.
@@ -17,49 +17,55 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import marshal
 import os
+import pickle
+import posixpath
+import re
 import sys
+import threading
+import time
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 from configparser import ConfigParser, ExtendedInterpolation
 from enum import Enum
+from functools import partial
 from gettext import gettext as _
-from pathlib import Path
-from typing import Iterable, Sequence
-from unittest.mock import patch
-
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    import tomli as tomllib  # type: ignore[import]
-
-import commentjson as json
-import requests
-import xmltodict
-import yaml
-from boltons.iterutils import flatten, remap
+from pathlib import Path, PurePosixPath
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+
+from boltons.iterutils import flatten
 from boltons.pathutils import shrinkuser
 from boltons.urlutils import URL
 from mergedeep import merge
-from wcmatch.glob import (
-    BRACE,
-    DOTGLOB,
-    FOLLOW,
-    GLOBSTAR,
-    GLOBTILDE,
-    IGNORECASE,
-    NODIR,
-    iglob,
-)
+from wcmatch.glob import BRACE, DOTGLOB, GLOBSTAR, IGNORECASE, globmatch
 
 from . import (
     STRING,
+    BadParameter,
+    Context,
     ParameterSource,
+    __version__,
     echo,
     get_app_dir,
     get_current_context,
 )
-from .parameters import ExtraOption, ParamStructure
-from .platforms import is_windows
+from .parameters import ExtraOption, ParamStructure, search_params
+from .platforms import get_cache_dir, is_windows
+
+if TYPE_CHECKING:
+    import requests
 
 
 class Formats(Enum):
@@ -76,6 +82,362 @@ class Formats(Enum):
     XML = ("xml",)
 
 
+CONTENT_SNIFFS: dict[str, Formats] = {
+    "<": Formats.XML,
+    "{": Formats.JSON,
+}
+"""Formats whose content is expected to start with a specific character."""
+
+FIRST_CHAR_REGEX = re.compile(r"\s*(\S)")
+
+
+JSON_COMMENT_REGEX = re.compile(r'"(?:\\.|[^"\\])*"|(?:#|//)[^\n]*')
+"""Matches JSON strings, and single-line comments starting with ``#`` or ``//``.
+
+Strings are matched so comment markers within them are left untouched.
+"""
+
+
+def strip_json_comment(match: re.Match) -> str:
+    """Replace comments matched by ``JSON_COMMENT_REGEX`` with nothing, and leave
+    strings as-is."""
+    token = match.group()
+    return token if token.startswith('"') else ""
+
+
+_http_sessions = threading.local()
+
+
+def http_session() -> requests.Session:
+    """Returns the HTTP session shared by the remote configuration downloads of the
+    current thread, so connections to the same server are reused.
+
+    Each thread gets its own session, as ``requests.Session`` is not thread-safe.
+    """
+    session = getattr(_http_sessions, "session", None)
+    if session is None:
+        import requests
+
+        session = _http_sessions.session = requests.Session()
+    return session  # type: ignore[no-any-return]
+
+
+SNAPSHOT_SUFFIX = ".snapshot"
+"""Suffix of the files compiled by ``ConfigOption`` in ``snapshot`` mode, next to the
+configuration file they are produced from."""
+
+
+GLOB_MAGIC_REGEX = re.compile(r"[*?[{]")
+"""Matches the first character of a glob pattern having a special meaning."""
+
+_dir_listings: dict[
+    str,
+    tuple[int, tuple[tuple[str, tuple[int, int] | None], ...]],
+] = {}
+"""Per-process cache of directory listings, indexed by path."""
+
+
+def list_dir(path: str) -> tuple[tuple[str, tuple[int, int] | None], ...]:
+    """Returns the ``(name, dir_id)`` pairs of the files and folders in ``path``,
+    sorted by name.
+
+    ``dir_id`` is the ``(device, inode)`` pair identifying a folder, symlinks
+    followed, and ``None`` for files. Other entries, like broken symlinks, are skipped.
+
+    Listings are cached for the life of the process, and are only refreshed when the
+    modification time of the folder changes.
+    """
+    try:
+        mtime = os.stat(path or ".").st_mtime_ns
+    except OSError:
+        return ()
+    cached = _dir_listings.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    entries = []
+    try:
+        with os.scandir(path or ".") as scan:
+            for entry in scan:
+                try:
+                    if entry.is_dir():
+                        stat = os.stat(entry.path)
+                        entries.append((entry.name, (stat.st_dev, stat.st_ino)))
+                    elif entry.is_file():
+                        entries.append((entry.name, None))
+                except OSError:
+                    continue
+    except OSError:
+        return ()
+    listing = tuple(sorted(entries))
+    _dir_listings[path] = (mtime, listing)
+    return listing
+
+
+def search_files(pattern: str, max_depth: int, max_files: int) -> Iterator[str]:
+    """Returns a lazy iterator over the files matching the glob ``pattern``.
+
+    The search starts from the longest folder path of ``pattern`` free of any special
+    character. From there it walks down the file system, symlinks included, and only
+    yields files matched by ``wcmatch.glob.globmatch``, with the ``GLOBSTAR``,
+    ``DOTGLOB``, ``BRACE`` and ``IGNORECASE`` flags. A leading ``~`` is expanded to the
+    user's home.
+
+    The walk is bounded:
+
+    - it does not go deeper than ``max_depth`` folders below its starting point, and
+      not deeper than the pattern itself if it has no ``**``;
+    - it stops after ``max_files`` files have been checked against the pattern;
+    - folders already visited on the current path are skipped, so symlink loops are
+      never followed.
+
+    Files are yielded as soon as they are found. The search stops as soon as the
+    caller stops iterating.
+    """
+    logger = logging.getLogger("click_extra")
+    flags = GLOBSTAR | DOTGLOB | BRACE | IGNORECASE
+
+    pattern = os.path.expanduser(pattern)
+    magic = GLOB_MAGIC_REGEX.search(pattern)
+    if not magic:
+        if os.path.isfile(pattern):
+            yield pattern
+        return
+
+    # Start the walk from the folder containing the first special character.
+    sep_index = pattern.rfind("/", 0, magic.start())
+    base, rest = pattern[: sep_index + 1], pattern[sep_index + 1 :]
+    if "**" not in rest:
+        # Alternatives of braces can't have more separators than the whole pattern.
+        max_depth = min(max_depth, rest.count("/"))
+
+    try:
+        stat = os.stat(base or ".")
+    except OSError:
+        return
+    checked = 0
+    # Each item of the stack is a folder to list, its depth and the IDs of the folders
+    # leading to it. Sub-folders are stacked in reverse so they are listed in order.
+    stack = [(base, 0, frozenset({(stat.st_dev, stat.st_ino)}))]
+    while stack:
+        folder, depth, ancestors = stack.pop()
+        sub_folders = []
+        for name, dir_id in list_dir(folder):
+            path = posixpath.join(folder, name)
+            if dir_id is None:
+                checked += 1
+                if checked > max_files:
+                    logger.warning(
+                        f"Stop searching for {pattern}: more than {max_files} files "
+                        "checked.",
+                    )
+                    return
+                if globmatch(path, pattern, flags=flags):
+                    yield path
+            elif depth < max_depth and dir_id not in ancestors:
+                sub_folders.append((path, depth + 1, ancestors | {dir_id}))
+        stack.extend(reversed(sub_folders))
+
+
+def prune_blanks(value: Any) -> Any:
+    """Returns a copy of ``value`` in which ``None`` items and empty ``dict`` are
+    recursively removed from lists and ``dict``.
+
+    Values that are not containers are returned as-is.
+    """
+    if isinstance(value, dict):
+        items = ((k, prune_blanks(v)) for k, v in value.items())
+        return {k: v for k, v in items if v is not None and v != {}}
+    if isinstance(value, list):
+        items = (prune_blanks(v) for v in value)
+        return [v for v in items if v is not None and v != {}]
+    return value
+
+
+def is_url(location: str) -> bool:
+    """Returns ``True`` if ``location`` is parseable as an URL and starts with
+    ``http://`` or ``https://``."""
+    url = URL(location)
+    return bool(url) and url.scheme.lower() in ("http", "https")
+
+
+class LazyDefaultMap(MutableMapping):
+    """A ``default_map`` whose entries can be computed on first access.
+
+    Click looks up the section of a subcommand in the ``default_map`` of its parent
+    context only when it creates the context of that subcommand. Deferring the
+    computation of these sections spares the work for all the subcommands that are
+    not invoked.
+    """
+
+    def __init__(self, data: Mapping[str, Any] | None = None) -> None:
+        self.data: dict[str, Any] = dict(data) if data else {}
+        self.pending: dict[str, Callable[[], Any]] = {}
+
+    def defer(self, key: str, loader: Callable[[], Any]) -> None:
+        """Set the value of ``key`` to the result of ``loader``, called on first
+        access."""
+        self.data.pop(key, None)
+        self.pending[key] = loader
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.pending:
+            self.data[key] = self.pending.pop(key)()
+        return self.data[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.pending.pop(key, None)
+        self.data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if self.pending.pop(key, None) is None:
+            del self.data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.data
+        yield from self.pending
+
+    def __len__(self) -> int:
+        return len(self.data) + len(self.pending)
+
+    def __repr__(self) -> str:
+        """Render pending entries without computing them."""
+        items = [f"{k!r}: {v!r}" for k, v in self.data.items()]
+        items.extend(f"{k!r}: <not loaded>" for k in self.pending)
+        return f"{{{', '.join(items)}}}"
+
+
+class ConfigCacheOption(ExtraOption):
+    """A pre-configured ``--config-cache``/``--no-config-cache`` option.
+
+    Adding this option to a command enables an on-disk cache of the configuration
+    files parsed by its ``ConfigOption``. Users can then bypass the cache on a
+    particular invocation with ``--no-config-cache``.
+
+    Parsed configurations are pickled to the ``config`` subfolder of the application's
+    cache directory, as returned by ``click_extra.platforms.get_cache_dir()``. Each
+    entry is keyed by the absolute path, modification time and size of the
+    configuration file, and by the formats it can be parsed with. So editing a file
+    invalidates its entry.
+
+    Remote configurations are never cached.
+    """
+
+    max_size: int
+    """Maximum size of the cache folder, in bytes.
+
+    Least recently used entries are evicted once the cache grows beyond that size.
+    """
+
+    def __init__(
+        self,
+        param_decls: Sequence[str] | None = None,
+        is_flag=True,
+        default=True,
+        is_eager=True,
+        expose_value=False,
+        max_size: int = 16 * 1024 * 1024,
+        help=_("Cache parsed configuration files."),
+        **kwargs,
+    ) -> None:
+        if not param_decls:
+            param_decls = ("--config-cache/--no-config-cache",)
+
+        self.max_size = max_size
+
+        super().__init__(
+            param_decls=param_decls,
+            is_flag=is_flag,
+            default=default,
+            is_eager=is_eager,
+            expose_value=expose_value,
+            help=help,
+            **kwargs,
+        )
+
+    @staticmethod
+    def cache_dir(ctx: Context) -> Path:
+        """Returns the folder in which parsed configurations are cached."""
+        return Path(get_cache_dir(ctx.find_root().info_name)) / "config"
+
+    @staticmethod
+    def entry_path(cache_dir: Path, location: str, conf_option: ConfigOption) -> Path:
+        """Returns the path of the cache entry of the configuration file at
+        ``location``, as parsed by ``conf_option``.
+
+        The entry is identified by the path, modification time and size of the file,
+        and all the settings of ``conf_option`` identifying its snapshots.
+
+        .. seealso::
+            ``ConfigOption.snapshot_key()``.
+
+        Raises ``OSError`` if the file cannot be accessed.
+        """
+        path = Path(location).resolve()
+        stat = path.stat()
+        key = conf_option.snapshot_key(f"{path}|{stat.st_mtime_ns}|{stat.st_size}")
+        return cache_dir / f"{key}.pickle"
+
+    def load(self, entry: Path) -> dict | None:
+        """Returns the parsed configuration cached in ``entry``, or ``None`` if there
+        is no usable entry.
+
+        A successful read marks the entry as recently used.
+        """
+        logger = logging.getLogger("click_extra")
+        try:
+            conf = pickle.loads(entry.read_bytes())
+            os.utime(entry)
+        except FileNotFoundError:
+            return None
+        except Exception as ex:
+            logger.debug(f"Cannot load cached configuration {entry}: {ex}")
+            return None
+        logger.debug(f"Parsed configuration loaded from cache {entry}")
+        return conf if isinstance(conf, dict) else None
+
+    def save(self, entry: Path, conf: dict) -> None:
+        """Save the parsed configuration to ``entry``, then evict least recently used
+        entries until the cache fits in ``max_size``.
+
+        The entry is written atomically. Failures are logged and ignored, as the cache
+        is only an optimization.
+        """
+        logger = logging.getLogger("click_extra")
+        # Sources are cached concurrently by the threads of read_and_parse_sources().
+        tmp_path = entry.with_name(
+            f"{entry.name}.{os.getpid()}.{threading.get_ident()}.tmp",
+        )
+        try:
+            content = pickle.dumps(conf, protocol=pickle.HIGHEST_PROTOCOL)
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, entry)
+        except Exception as ex:
+            logger.debug(f"Cannot cache parsed configuration to {entry}: {ex}")
+            return
+        logger.debug(f"Parsed configuration cached to {entry}")
+        self.evict(entry.parent)
+
+    def evict(self, cache_dir: Path) -> None:
+        """Remove least recently used entries of ``cache_dir`` until its total size is
+        below ``max_size``."""
+        entries = []
+        for entry in cache_dir.glob("*.pickle"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            entry.unlink(missing_ok=True)
+            total_size -= size
+            logging.getLogger("click_extra").debug(f"Evict cached configuration {entry}")
+
+
 class ConfigOption(ExtraOption, ParamStructure):
     """A pre-configured option adding ``--config``/``-C`` option."""
 
@@ -86,6 +448,41 @@ class ConfigOption(ExtraOption, ParamStructure):
 
     strict: bool
 
+    remote_timeout: float
+    remote_cache: bool
+    remote_ttl: float
+
+    search_max_depth: int
+    search_max_files: int
+
+    snapshot: bool
+
+    source_workers: int = 4
+    """Maximum number of threads used to read and parse multiple sources."""
+
+    parsers: dict[Formats, str] = {
+        Formats.TOML: "load_toml_config",
+        Formats.YAML: "load_yaml_config",
+        Formats.JSON: "load_json_config",
+        Formats.INI: "load_ini_config",
+        Formats.XML: "load_xml_config",
+    }
+    """Registry mapping each format to the name of the method parsing it.
+
+    Each parser method takes the raw content as a string and returns the parsed data
+    structure. Parsers are expected to import their third-party backend on call, so
+    only the formats actually tried by ``parse_conf()`` pay the cost of their import.
+
+    Subclasses can override this registry to plug their own parsers.
+    """
+
+    yaml_safe: bool = True
+    """Restrict YAML parsing to standard tags, which only produce plain data types.
+
+    Set it to ``False`` in a subclass to allow the Python-specific tags supported by
+    ``PyYAML``'s ``FullLoader``, like ``!!python/tuple``.
+    """
+
     def __init__(
         self,
         param_decls: Sequence[str] | None = None,
@@ -102,6 +499,12 @@ class ConfigOption(ExtraOption, ParamStructure):
         force_posix=False,
         excluded_params=None,
         strict=False,
+        remote_timeout: float = 10,
+        remote_cache: bool = False,
+        remote_ttl: float = 0,
+        search_max_depth: int = 10,
+        search_max_files: int = 10_000,
+        snapshot: bool = False,
         **kwargs,
     ) -> None:
         """Takes as input a glob pattern or an URL.
@@ -128,6 +531,31 @@ class ConfigOption(ExtraOption, ParamStructure):
             - If ``True``, raise an error if the configuration file contain
               unrecognized content.
             - If ``False``, silently ignore unsupported configuration option.
+
+        - ``remote_timeout`` is the maximum number of seconds to wait for a remote
+          server to accept the connection, then to send data.
+
+        - ``remote_cache`` keeps a local copy of the last configuration fetched from
+          each remote URL. Copies are revalidated with the ``ETag`` and
+          ``Last-Modified`` headers sent by the server, and are used as a fallback if
+          the server is unreachable.
+
+        - ``remote_ttl`` is the number of seconds during which a cached copy is used
+          without contacting the server at all. Only applies if ``remote_cache`` is
+          active.
+
+        - ``search_max_depth`` is the maximum number of folders the search of local
+          files can descend into, from the first folder of the pattern having a
+          special character.
+
+        - ``search_max_files`` is the maximum number of local files checked against
+          the pattern, after which the search is abandoned.
+
+        - ``snapshot`` compiles the configuration, once merged and validated, to a
+          binary file next to the local file it was read from. That snapshot is then
+          used as-is as long as the configuration file and the CLI are unchanged,
+          saving their parsing and merging. Only applies to options with a single
+          pattern.
         """
         if not param_decls:
             param_decls = ("--config", "-C")
@@ -140,13 +568,25 @@ class ConfigOption(ExtraOption, ParamStructure):
         # Setup the configuration default folder.
         self.roaming = roaming
         self.force_posix = force_posix
-        kwargs.setdefault("default", self.default_pattern)
+        if kwargs.get("multiple"):
+            kwargs.setdefault("default", self.default_patterns)
+        else:
+            kwargs.setdefault("default", self.default_pattern)
 
         if excluded_params is not None:
             self.excluded_params = excluded_params
 
         self.strict = strict
 
+        self.remote_timeout = remote_timeout
+        self.remote_cache = remote_cache
+        self.remote_ttl = remote_ttl
+
+        self.search_max_depth = search_max_depth
+        self.search_max_files = search_max_files
+
+        self.snapshot = snapshot
+
         kwargs.setdefault("callback", self.load_conf)
 
         super().__init__(
@@ -190,36 +630,54 @@ class ConfigOption(ExtraOption, ParamStructure):
             ext_pattern = f"{{{','.join(extensions)}}}"
         return f"{app_dir}{os.path.sep}*.{ext_pattern}"
 
+    def default_patterns(self) -> tuple[str, ...]:
+        """Returns the default patterns of options accepting multiple sources.
+
+        That's the single pattern produced by ``default_pattern()``.
+        """
+        return (self.default_pattern(),)
+
     def get_help_record(self, ctx):
         """Replaces the default value by the pretty version of the configuration
         matching pattern."""
         # Pre-compute pretty_path to bypass infinite recursive loop on get_default.
-        pretty_path = shrinkuser(Path(self.get_default(ctx)))
+        # unittest.mock is imported here as it is only needed to render the help screen.
+        from unittest.mock import patch
+
+        default = self.get_default(ctx)
+        if self.multiple:
+            pretty_path = tuple(shrinkuser(Path(pattern)) for pattern in default)
+        else:
+            pretty_path = shrinkuser(Path(default))
         with patch.object(ConfigOption, "get_default") as mock_method:
             mock_method.return_value = pretty_path
             return super().get_help_record(ctx)
 
-    def search_and_read_conf(self, pattern: str) -> Iterable[str]:
+    def search_and_read_conf(
+        self,
+        pattern: str,
+        ctx: Context | None = None,
+    ) -> Iterable[tuple[str, str]]:
         """Search on local file system or remote URL files matching the provided
         pattern.
 
         ``pattern`` is considered as an URL only if it is parseable as such and starts
         with ``http://`` or ``https://``.
 
-        Returns an iterator of raw content for each file/URL matching the
-        pattern.
+        ``ctx`` defaults to the current context.
+
+        Returns an iterator of ``(location, raw content)`` pairs for each file/URL
+        matching the pattern.
         """
         logger = logging.getLogger("click_extra")
 
         # Check if the pattern is an URL.
-        location = URL(pattern)
-        if location and location.scheme.lower() in ("http", "https"):
+        if is_url(pattern):
             logger.debug("Fetch configuration from remote URL.")
-            with requests.get(location) as response:
-                if response.ok:
-                    yield from (response.text,)
-                    return
-                logger.warning(f"Can't download {location}: {response.reason}")
+            content = self.fetch_remote_conf(pattern, ctx)
+            if content is not None:
+                yield from ((pattern, content),)
+                return
         else:
             logger.debug("Pattern is not an URL.")
 
@@ -230,43 +688,161 @@ class ConfigOption(ExtraOption, ParamStructure):
         # https://github.com/facelessuser/wcmatch/issues/194
         if is_windows():
             pattern = pattern.replace("\\", "/")
-        for file in iglob(
+        for file in search_files(
             pattern,
-            flags=NODIR | GLOBSTAR | DOTGLOB | GLOBTILDE | BRACE | FOLLOW | IGNORECASE,
+            max_depth=self.search_max_depth,
+            max_files=self.search_max_files,
         ):
+            if file.endswith(SNAPSHOT_SUFFIX):
+                continue
             file_path = Path(file)
             logger.debug(f"Configuration file found at {file_path}")
-            yield file_path.read_text()
+            yield file, file_path.read_text()
+
+    def remote_cache_entry(self, url: str, ctx: Context | None = None) -> Path:
+        """Returns the path of the file caching the content fetched from ``url``.
+
+        ``ctx`` defaults to the current context.
+        """
+        if ctx is None:
+            ctx = get_current_context()
+        cache_dir = Path(get_cache_dir(ctx.find_root().info_name)) / "remote"
+        return cache_dir / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+    def fetch_remote_conf(self, url: str, ctx: Context | None = None) -> str | None:
+        """Download the configuration at ``url``.
+
+        If ``remote_cache`` is active, the cached copy is returned as-is while younger
+        than ``remote_ttl``. Past that, it is revalidated with a conditional request,
+        and returned if the server is unreachable or fails.
+
+        ``ctx`` defaults to the current context.
+
+        Returns ``None`` if no content can be fetched nor found in cache.
+        """
+        logger = logging.getLogger("click_extra")
+        # requests is imported here as it is only needed to fetch remote content.
+        import requests
+
+        entry = None
+        cached: dict[str, Any] = {}
+        if self.remote_cache:
+            entry = self.remote_cache_entry(url, ctx)
+            try:
+                cached = json.loads(entry.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as ex:
+                logger.debug(f"Cannot read cached copy {entry}: {ex}")
+            if cached and time.time() - cached["fetched_at"] < self.remote_ttl:
+                logger.debug(f"Use fresh cached copy of {url}")
+                return cached["content"]  # type: ignore[no-any-return]
+
+        headers = {}
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        try:
+            response = http_session().get(
+                url,
+                headers=headers,
+                timeout=self.remote_timeout,
+            )
+        except requests.RequestException as ex:
+            reason = str(ex)
+        else:
+            with response:
+                if response.status_code == 304 and cached:
+                    logger.debug(f"Cached copy of {url} is still valid")
+                    cached["fetched_at"] = time.time()
+                    self.save_remote_copy(entry, cached)  # type: ignore[arg-type]
+                    return cached["content"]  # type: ignore[no-any-return]
+                if response.ok:
+                    if entry:
+                        self.save_remote_copy(
+                            entry,
+                            {
+                                "url": url,
+                                "etag": response.headers.get("ETag"),
+                                "last_modified": response.headers.get("Last-Modified"),
+                                "fetched_at": time.time(),
+                                "content": response.text,
+                            },
+                        )
+                    return response.text  # type: ignore[no-any-return]
+                reason = response.reason
+
+        logger.warning(f"Can't download {url}: {reason}")
+        if cached:
+            logger.warning(f"Use cached copy of {url}")
+            return cached["content"]  # type: ignore[no-any-return]
+        return None
 
-    def parse_conf(self, conf_content: str) -> dict | None:
-        """Try to parse the provided content with each format in the order provided by
-        the user.
+    @staticmethod
+    def save_remote_copy(entry: Path, data: dict[str, Any]) -> None:
+        """Save the content fetched from a remote URL and its metadata to ``entry``.
+
+        The file is written atomically. Failures are logged and ignored, as the cache
+        is only an optimization.
+        """
+        tmp_path = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp_path, entry)
+        except OSError as ex:
+            logging.getLogger("click_extra").debug(
+                f"Cannot cache remote configuration to {entry}: {ex}",
+            )
+
+    def candidate_formats(
+        self,
+        conf_content: str,
+        location: str | None = None,
+    ) -> list[Formats]:
+        """Returns the formats to try on ``conf_content``, by order of likelihood.
+
+        - If the extension of ``location`` is associated with one of the formats
+          supported by the option, this format is returned alone.
+        - Else, formats are returned in the order provided by the user, but those
+          matching the first non-blank character of the content are moved to the front:
+          ``<`` for XML, ``{`` for JSON.
+        """
+        if location:
+            if is_url(location):
+                location = URL(location).path
+            extension = PurePosixPath(location).suffix.lstrip(".").lower()
+            for conf_format in self.formats:
+                if extension in conf_format.value:
+                    return [conf_format]
+
+        candidates = list(self.formats)
+        match = FIRST_CHAR_REGEX.match(conf_content)
+        sniffed = CONTENT_SNIFFS.get(match.group(1)) if match else None
+        if sniffed in candidates:
+            candidates.remove(sniffed)
+            candidates.insert(0, sniffed)
+        return candidates
+
+    def parse_conf(self, conf_content: str, location: str | None = None) -> dict | None:
+        """Parse the provided content with the formats returned by
+        ``candidate_formats()``.
 
         A successful parsing in any format is supposed to return a ``dict``. Any other
         result, including any raised exception, is considered a failure and the next
         format is tried.
+
+        Parsers are fetched from the ``parsers`` registry.
         """
         user_conf = None
-        for conf_format in self.formats:
+        for conf_format in self.candidate_formats(conf_content, location):
             logger = logging.getLogger("click_extra")
             logger.debug(f"Parse configuration as {conf_format.name}...")
 
             try:
-                if conf_format == Formats.TOML:
-                    user_conf = tomllib.loads(conf_content)
-
-                elif conf_format == Formats.YAML:
-                    user_conf = yaml.full_load(conf_content)
-
-                elif conf_format == Formats.JSON:
-                    user_conf = json.loads(conf_content)
-
-                elif conf_format == Formats.INI:
-                    user_conf = self.load_ini_config(conf_content)
-
-                elif conf_format == Formats.XML:
-                    user_conf = xmltodict.parse(conf_content)
-
+                user_conf = getattr(self, self.parsers[conf_format])(conf_content)
             except Exception as ex:
                 logger.debug(ex)
                 continue
@@ -278,106 +854,443 @@ class ConfigOption(ExtraOption, ParamStructure):
 
         return None
 
-    def read_and_parse_conf(self, pattern: str) -> dict | None:
-        for conf_content in self.search_and_read_conf(pattern):
-            user_conf = self.parse_conf(conf_content)
+    def read_and_parse_conf(
+        self,
+        pattern: str,
+        ctx: Context | None = None,
+    ) -> dict | None:
+        """Returns the first configuration matching ``pattern`` that can be parsed.
+
+        Parsed local files are cached on disk if the command has an active
+        ``ConfigCacheOption``.
+
+        ``ctx`` defaults to the current context.
+        """
+        if ctx is None:
+            ctx = get_current_context()
+        cache_option = ctx.meta.get("click_extra.config_cache")
+        cache_dir = cache_option.cache_dir(ctx) if cache_option else None
+
+        for location, conf_content in self.search_and_read_conf(pattern, ctx):
+            user_conf = None
+            entry = None
+            if cache_option and not is_url(location):
+                try:
+                    entry = cache_option.entry_path(cache_dir, location, self)
+                except OSError:
+                    pass
+                else:
+                    user_conf = cache_option.load(entry)
+
+            if user_conf is None:
+                user_conf = self.parse_conf(conf_content, location)
+                if user_conf is not None and entry:
+                    cache_option.save(entry, user_conf)
+
             if user_conf is not None:
+                # Keep track of the location for ConfigWatcher.
+                # XXX ctx.meta doesn't cut it, we need to target ctx._meta.
+                ctx._meta.setdefault("click_extra.config_locations", {})[
+                    pattern
+                ] = location
                 return user_conf
         return None
 
-    def load_ini_config(self, content):
-        """Utility method to parse INI configuration file.
+    def snapshot_key(self, content: str) -> str:
+        """Returns the hash identifying the snapshot of the configuration ``content``.
 
-        Internal convention is to use a dot (``.``, as set by ``self.SEP``) in
-        section IDs as a separator between levels. This is a workaround
-        the limitation of ``INI`` format which doesn't allow for sub-sections.
+        It depends on the content, but also on everything changing how it is parsed
+        and merged by ``merge_conf()``: the version of Click Extra, the class of the
+        option and its ``parsers``, the enabled ``formats``, ``yaml_safe``,
+        ``strict``, the parameters of the CLI and the converter of each of them.
+        """
+        # Converters are identified by name, as their repr() changes across processes.
+        converters = {
+            path: (
+                f"{converter.__module__}.{converter.__qualname__}"
+                if hasattr(converter, "__qualname__")
+                else repr(converter)
+            )
+            for path, converter in self.conversion_plan.items()
+        }
+        key = hashlib.sha256()
+        for part in (
+            __version__,
+            f"{type(self).__module__}.{type(self).__qualname__}",
+            repr(sorted((fmt.name, name) for fmt, name in self.parsers.items())),
+            repr([fmt.name for fmt in self.formats]),
+            repr(self.yaml_safe),
+            repr(self.strict),
+            repr(self.params_types),
+            repr(converters),
+            content,
+        ):
+            key.update(part.encode())
+            key.update(b"\0")
+        return key.hexdigest()
+
+    @staticmethod
+    def load_snapshot(entry: Path, key: str) -> dict | None:
+        """Returns the configuration compiled in the ``entry`` snapshot, if it was
+        produced with ``key``.
+        """
+        try:
+            snapshot_key, conf = marshal.loads(entry.read_bytes())
+        except (OSError, EOFError, TypeError, ValueError):
+            return None
+        if snapshot_key != key:
+            logging.getLogger("click_extra").debug(f"Snapshot {entry} is outdated.")
+            return None
+        return conf  # type: ignore[no-any-return]
+
+    @staticmethod
+    def save_snapshot(entry: Path, key: str, conf: dict) -> None:
+        """Compile ``conf`` to the ``entry`` snapshot, along with its ``key``.
+
+        The file is written atomically. Failures are logged and ignored, as the
+        snapshot is only an optimization.
+        """
+        logger = logging.getLogger("click_extra")
+        try:
+            data = marshal.dumps((key, conf))
+        except ValueError as ex:
+            logger.debug(f"Cannot compile configuration: {ex}")
+            return
+        tmp_path = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, entry)
+        except OSError as ex:
+            logger.debug(f"Cannot save configuration snapshot to {entry}: {ex}")
+        else:
+            logger.debug(f"Configuration compiled to {entry}")
 
-        Returns a ready-to-use data structure.
+    def read_snapshot_conf(self, pattern: str) -> dict | None:
+        """Same as ``read_and_parse_conf()``, but returns the configuration merged by
+        ``merge_conf()``, from its snapshot if it is up to date.
+
+        The snapshot of local files is refreshed if missing or outdated.
         """
-        ini_config = ConfigParser(interpolation=ExtendedInterpolation())
-        ini_config.read_string(content)
+        ctx = get_current_context()
+        for location, conf_content in self.search_and_read_conf(pattern):
+            entry = key = None
+            if not is_url(location):
+                entry = Path(f"{location}{SNAPSHOT_SUFFIX}")
+                key = self.snapshot_key(conf_content)
+                conf = self.load_snapshot(entry, key)
+                if conf is not None:
+                    logging.getLogger("click_extra").debug(f"Use snapshot {entry}")
+                    ctx._meta.setdefault("click_extra.config_locations", {})[
+                        pattern
+                    ] = location
+                    return conf
+
+            user_conf = self.parse_conf(conf_content, location)
+            if user_conf is not None:
+                if self.strict:
+                    self.load_lazy_sections(user_conf, ctx)
+                conf = self.merge_conf(user_conf)
+                if entry and key:
+                    self.save_snapshot(entry, key, conf)
+                ctx._meta.setdefault("click_extra.config_locations", {})[
+                    pattern
+                ] = location
+                return conf
+        return None
 
-        conf = {}
-        for section_id in ini_config.sections():
-            # Extract all options of the section.
-            sub_conf = {}
-            for option_id in ini_config.options(section_id):
-                target_type = self.get_tree_value(
-                    self.params_types,
-                    section_id,
-                    option_id,
+    def read_source(self, ctx: Context, pattern: str) -> dict | None:
+        """Returns the first configuration matching ``pattern`` that can be parsed,
+        with the time it takes to search, read and parse it printed in debug logs.
+
+        Like ``read_and_parse_conf()``, candidates are read one at a time, and the
+        search stops at the first parseable one.
+
+        Can be called from any thread: ``ctx`` is never pushed on the context stack of
+        the calling thread.
+        """
+        start = time.perf_counter()
+        user_conf = self.read_and_parse_conf(pattern, ctx=ctx)
+        logging.getLogger("click_extra").debug(
+            f"{'Read' if user_conf is not None else 'Nothing found at'} "
+            f"{pattern} in {time.perf_counter() - start:.3f} seconds.",
+        )
+        return user_conf
+
+    def read_and_parse_sources(
+        self,
+        patterns: Sequence[str],
+        ctx: Context | None = None,
+    ) -> dict | None:
+        """Read and parse the configuration of each of the ``patterns``, then merge
+        them.
+
+        Multiple sources are searched, read and parsed concurrently, by up to
+        ``source_workers`` threads, with the time each of them takes printed in debug
+        logs. They are then merged in the order of ``patterns``, so values of the last
+        sources take precedence.
+
+        ``ctx`` defaults to the current context.
+
+        Returns ``None`` if no source produced any configuration.
+        """
+        if ctx is None:
+            ctx = get_current_context()
+        if len(patterns) == 1:
+            user_confs = [self.read_and_parse_conf(patterns[0], ctx=ctx)]
+        else:
+            # Keys of cached configurations depend on the parameter trees, which can
+            # only be built where the context is known.
+            if ctx.meta.get("click_extra.config_cache"):
+                if "params_index" not in vars(self):
+                    self.build_param_trees(ctx)
+                self.snapshot_key("")
+            workers = min(len(patterns), self.source_workers)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                user_confs = list(
+                    executor.map(partial(self.read_source, ctx), patterns),
                 )
 
-                if target_type in (None, str):
-                    value = ini_config.get(section_id, option_id)
+        user_confs = [user_conf for user_conf in user_confs if user_conf is not None]
+        if not user_confs:
+            return None
+        if len(user_confs) == 1:
+            return user_confs[0]
+        return merge({}, *user_confs)  # type: ignore[no-any-return]
+
+    def load_toml_config(self, content: str) -> Any:
+        """Parse TOML content with ``tomllib``, or ``tomli`` before Python 3.11."""
+        if sys.version_info >= (3, 11):
+            import tomllib
+        else:
+            import tomli as tomllib  # type: ignore[import]
 
-                elif target_type == int:
-                    value = ini_config.getint(section_id, option_id)
+        return tomllib.loads(content)
 
-                elif target_type == float:
-                    value = ini_config.getfloat(section_id, option_id)
+    @property
+    def yaml_loader(self) -> type:
+        """Returns the ``PyYAML`` loader class used to parse YAML content.
 
-                elif target_type == bool:
-                    value = ini_config.getboolean(section_id, option_id)
+        That's ``SafeLoader``, or ``FullLoader`` if ``yaml_safe`` is ``False``. Their
+        ``libyaml``-based C implementation is preferred, if ``PyYAML`` has been built
+        with it.
+        """
+        import yaml
 
-                # Types not natively supported by INI format are loaded as
-                # JSON-serialized strings.
-                elif target_type in (list, tuple, set, frozenset, dict):
-                    value = json.loads(ini_config.get(section_id, option_id))
+        name = "SafeLoader" if self.yaml_safe else "FullLoader"
+        return getattr(yaml, f"C{name}", None) or getattr(yaml, name)
 
-                else:
-                    msg = (
-                        f"Conversion of {target_type} type for "
-                        f"[{section_id}]:{option_id} INI config option."
-                    )
-                    raise ValueError(msg)
+    def load_yaml_config(self, content: str) -> Any:
+        """Parse YAML content with ``PyYAML``, using the ``yaml_loader`` class."""
+        import yaml
 
-                sub_conf[option_id] = value
+        loader = self.yaml_loader
+        logging.getLogger("click_extra").debug(
+            f"Parse YAML with {loader.__module__}.{loader.__name__}",
+        )
+        return yaml.load(content, Loader=loader)  # noqa: S506
+
+    def load_json_config(self, content: str) -> Any:
+        """Parse JSON content, tolerating ``#`` and ``//`` comments.
+
+        Content is first parsed with the standard library's ``json`` module, as-is then
+        stripped of its comments. Only content rejected by both attempts is parsed with
+        ``commentjson``, whose grammar-based parser is orders of magnitude slower, but
+        produces better error messages.
+        """
+        try:
+            return json.loads(content)
+        except ValueError:
+            pass
+        try:
+            return json.loads(JSON_COMMENT_REGEX.sub(strip_json_comment, content))
+        except ValueError:
+            pass
+
+        import commentjson
+
+        return commentjson.loads(content)
+
+    def load_xml_config(self, content: str) -> Any:
+        """Parse XML content with ``xmltodict``."""
+        import xmltodict
+
+        return xmltodict.parse(content)
+
+    def load_ini_config(self, content):
+        """Utility method to parse INI configuration file.
+
+        Internal convention is to use a dot (``.``, as set by ``self.SEP``) in
+        section IDs as a separator between levels. This is a workaround
+        the limitation of ``INI`` format which doesn't allow for sub-sections.
+
+        Returns a data structure whose values are all strings, to be converted to
+        the type of their parameter by ``merge_conf()``.
+        """
+        ini_config = ConfigParser(interpolation=ExtendedInterpolation())
+        ini_config.read_string(content)
+
+        conf: dict[str, Any] = {}
+        for section_id in ini_config.sections():
+            # Extract all options of the section. Their values are all strings, left
+            # to merge_conf() to convert.
+            sub_conf = {
+                option_id: ini_config.get(section_id, option_id)
+                for option_id in ini_config.options(section_id)
+            }
 
             # Place collected options at the right level of the dict tree.
             merge(conf, self.init_tree_dict(*section_id.split(self.SEP), leaf=sub_conf))
 
         return conf
 
-    def recursive_update(self, a, b):
-        """Like standard ``dict.update()``, but recursive so sub-dict gets updated.
+    def filter_conf(self, template: Mapping, conf: Mapping) -> dict:
+        """Returns a new ``dict`` with the content of ``conf`` whose keys are in the
+        ``template`` structure.
 
-        Ignore elements present in ``b`` but not in ``a``.
+        Blank values, i.e. ``None`` and empty ``dict``, are pruned along the way.
+        Neither ``template`` nor ``conf`` are modified, and only the branches of
+        ``conf`` that are kept are copied.
         """
-        for k, v in b.items():
-            if isinstance(v, dict) and isinstance(a.get(k), dict):
-                a[k] = self.recursive_update(a[k], v)
+        valid_conf = {}
+        for key, value in conf.items():
             # Ignore elements unregistered in the template structure.
-            elif k in a:
-                a[k] = b[k]
-            elif self.strict:
-                msg = f"Parameter {k!r} is not allowed in configuration file."
-                raise ValueError(
-                    msg,
-                )
-        return a
+            if key not in template:
+                if self.strict:
+                    msg = f"Parameter {key!r} is not allowed in configuration file."
+                    raise ValueError(msg)
+                continue
+            sub_template = template[key]
+            if isinstance(value, dict) and isinstance(sub_template, Mapping):
+                value = self.filter_conf(sub_template, value)
+            else:
+                value = prune_blanks(value)
+            if value is None or (isinstance(value, dict) and not value):
+                continue
+            valid_conf[key] = value
+        return valid_conf
 
-    def merge_conf(self, user_conf):
-        """Try-out configuration formats againts file's content and returns a ``dict``.
+    def merge_conf(self, user_conf: dict, path: tuple[str, ...] = ()) -> dict:
+        """Returns the subset of the user's configuration that targets the CLI.
 
         The returned ``dict`` will only contain options and parameters defined on the
-        CLI. All others will be filtered out.
+        CLI. All others will be filtered out. Values are converted to the Python type
+        of their parameter, and all values that can't be are reported at once.
+
+        ``path`` is the location of ``user_conf`` in the parameter structure, if it is
+        only the section of a subcommand.
+        """
+        template = self.get_tree_value(self.params_template, *path)
+        valid_conf = self.filter_conf(template, user_conf)
+        try:
+            return self.convert_conf(valid_conf, path)
+        except ValueError as ex:
+            raise BadParameter(str(ex), param=self) from ex
+
+    def load_lazy_sections(self, user_conf: dict, ctx: Context) -> None:
+        """Import the lazy subcommands of ``ExtraLazyGroup`` having a section in
+        ``user_conf``, so their parameters are known to validate it.
+
+        Only used in ``strict`` mode, as it defeats the lazy import of subcommands.
         """
-        # Merge configuration file's content into the template structure, but
-        # ignore all unrecognized options.
-        valid_conf = self.recursive_update(self.params_template, user_conf)
+        root = ctx.find_root().command
+        root_conf = user_conf.get(root.name)
+        if not isinstance(root_conf, dict):
+            return
+        for cmd_id in getattr(root, "unloaded_commands", ()):
+            if cmd_id in root_conf:
+                root.get_command(ctx.find_root(), cmd_id)
+
+    def merge_default_map(
+        self,
+        default_map: Mapping[str, Any] | None,
+        user_conf: dict,
+        ctx: Context | None = None,
+    ) -> LazyDefaultMap:
+        """Returns a copy of the ``default_map`` of the root context, updated with the
+        section of the user's configuration targeting the CLI.
+
+        Only the options of the root command are merged right away. Sections of
+        subcommands are merged by ``merge_conf()`` on first access, i.e. when Click
+        creates the context of the invoked subcommand. Except in ``strict`` mode, in
+        which all sections are merged and validated upfront.
+
+        ``ctx`` defaults to the current context.
+        """
+        if ctx is None:
+            ctx = get_current_context()
+        root = ctx.find_root().command
+        root_id = root.name
+        root_conf = user_conf.get(root_id)
+        if self.strict:
+            self.load_lazy_sections(user_conf, ctx)
+        root_template = self.params_template.get(root_id, {})
+        unloaded = getattr(root, "unloaded_commands", ())
+
+        sections = {}
+        # Strict mode validates the whole configuration before running anything.
+        if isinstance(root_conf, dict) and not self.strict:
+            # Sections of lazy subcommands are merged once imported, i.e. when Click
+            # creates their context, so their parameters are known by then.
+            sections = {
+                cmd_id: section
+                for cmd_id, section in root_conf.items()
+                if isinstance(section, dict)
+                and (
+                    isinstance(root_template.get(cmd_id), Mapping)
+                    or cmd_id in unloaded
+                )
+            }
+            root_conf = {k: v for k, v in root_conf.items() if k not in sections}
+            user_conf = {**user_conf, root_id: root_conf}
 
-        # Clean-up blank values left-over by the template structure.
+        new_map = LazyDefaultMap(default_map)
+        new_map.update(self.merge_conf(user_conf).get(root_id, {}))
+        for cmd_id, section in sections.items():
+            new_map.defer(cmd_id, partial(self.merge_conf, section, (root_id, cmd_id)))
+        return new_map
 
-        def visit(path, key, value):
-            """Skip None values and empty dicts."""
-            if value is None:
-                return False
-            if isinstance(value, dict) and not len(value):
-                return False
-            return True
+    def watch(
+        self,
+        callback: Callable[[Mapping[str, Any] | None], Any],
+        interval: float = 1,
+        debounce: float = 0.5,
+    ) -> ConfigWatcher:
+        """Start watching the configuration files loaded for the current context, and
+        returns the ``ConfigWatcher`` thread in charge of it.
+
+        See ``ConfigWatcher`` for the meaning of the parameters.
+        """
+        watcher = ConfigWatcher(
+            get_current_context(),
+            self,
+            callback,
+            interval=interval,
+            debounce=debounce,
+        )
+        watcher.start()
+        return watcher
 
-        return remap(valid_conf, visit=visit)
+    def handle_parse_result(
+        self,
+        ctx: Context,
+        opts: Mapping[str, Any],
+        args: list[str],
+    ) -> tuple[Any, list[str]]:
+        """Resolve the state of the command's ``ConfigCacheOption`` before loading the
+        configuration.
+
+        The cache option might be processed after this one, so its value is consumed
+        here from the command line, environment or defaults. The active cache option
+        is then saved in the ``click_extra.config_cache`` entry of the context's meta.
+        """
+        cache_option = search_params(ctx.command.params, ConfigCacheOption)
+        enabled = False
+        if cache_option:
+            value, _ = cache_option.consume_value(ctx, opts)
+            enabled = bool(cache_option.type_cast_value(ctx, value))
+        # XXX ctx.meta doesn't cut it, we need to target ctx._meta.
+        ctx._meta["click_extra.config_cache"] = cache_option if enabled else None
+        return super().handle_parse_result(ctx, opts, args)
 
     def load_conf(self, ctx, param, path_pattern):
         """Fetch parameters values from configuration file and merge them with the
@@ -389,6 +1302,10 @@ class ConfigOption(ExtraOption, ParamStructure):
         This allow user's config to only overrides defaults. Values sets from direct
         command line parameters, environment variables or interactive prompts, takes
         precedence over any values from the config file.
+
+        If the option accepts ``multiple`` values, each pattern is a distinct source.
+        All the configurations found are merged, values of the last sources taking
+        precedence.
         """
         logger = logging.getLogger("click_extra")
 
@@ -397,19 +1314,28 @@ class ConfigOption(ExtraOption, ParamStructure):
             ParameterSource.ENVIRONMENT,
             ParameterSource.PROMPT,
         )
-        # Always print a message if the user explicitly set the configuration location.
-        # We can't use logger.info because the default have not been loaded yet
-        # and the logger is stuck to its default WARNING level.
-        message = f"Load configuration matching {path_pattern}"
-        if explicit_conf:
-            echo(message, err=True)
-        # Fallback on default configuration file location.
-        else:
-            logger.debug(message)
+        patterns = (path_pattern,) if isinstance(path_pattern, str) else path_pattern
+        for pattern in patterns:
+            # Always print a message if the user explicitly set the configuration
+            # location. We can't use logger.info because the default have not been
+            # loaded yet and the logger is stuck to its default WARNING level.
+            message = f"Load configuration matching {pattern}"
+            if explicit_conf:
+                echo(message, err=True)
+            # Fallback on default configuration file location.
+            else:
+                logger.debug(message)
+
+        # Keep track of the sources and the original defaults for ConfigWatcher.
+        ctx._meta["click_extra.config_patterns"] = patterns
+        ctx._meta["click_extra.config_defaults"] = ctx.default_map
 
-        # Read configuration file.
-        conf = {}
-        user_conf = self.read_and_parse_conf(path_pattern)
+        # Read configuration files, or their snapshot which is already merged.
+        merged = self.snapshot and len(patterns) == 1
+        if merged:
+            user_conf = self.read_snapshot_conf(patterns[0])
+        else:
+            user_conf = self.read_and_parse_sources(patterns)
         # Exit the CLI if the user-provided config file is bad.
         if user_conf is None:
             message = "No configuration file found."
@@ -423,14 +1349,130 @@ class ConfigOption(ExtraOption, ParamStructure):
             else:
                 logger.debug(message)
 
-        else:
-            conf = self.merge_conf(user_conf)
-            logger.debug(f"Loaded configuration: {conf}")
+        elif merged:
+            ctx.default_map = LazyDefaultMap(ctx.default_map)
+            ctx.default_map.update(user_conf.get(ctx.find_root().command.name, {}))
+            logger.debug(f"New defaults: {ctx.default_map}")
 
+        else:
             # Merge config to the default_map.
-            if ctx.default_map is None:
-                ctx.default_map = {}
-            ctx.default_map.update(conf.get(ctx.find_root().command.name, {}))
+            ctx.default_map = self.merge_default_map(ctx.default_map, user_conf)
             logger.debug(f"New defaults: {ctx.default_map}")
 
         return path_pattern
+
+
+class ConfigWatcher(threading.Thread):
+    """A background thread reloading the configuration when its files change.
+
+    Long-running commands can get one with ``ConfigOption.watch()``, to pick up the
+    new configuration without restarting.
+
+    The watcher polls every ``interval`` seconds the modification time and size of
+    the local files the configuration was loaded from. Remote URLs are not watched.
+    Once a change has settled for ``debounce`` seconds, configuration sources are
+    searched, read, parsed and merged again, with the context of the command passed
+    explicitly: the watcher thread never enters it, so it can't race with the thread
+    running the command.
+
+    The section of the new configuration targeting the watched context, i.e. the
+    root ``default_map`` for the CLI itself or the section of a subcommand, replaces
+    the ``default_map`` of the context in a single assignment, then is passed to
+    ``callback``. If the new configuration can't be loaded, a warning is logged and the
+    current one is kept.
+    """
+
+    def __init__(
+        self,
+        ctx: Context,
+        config_option: ConfigOption,
+        callback: Callable[[Mapping[str, Any] | None], Any],
+        interval: float = 1,
+        debounce: float = 0.5,
+    ) -> None:
+        super().__init__(name=f"{ctx.info_name}-config-watcher", daemon=True)
+        self.ctx = ctx
+        self.config_option = config_option
+        # Search the context in which the configuration was loaded, to locate the
+        # section of the watched context within the reloaded configuration.
+        self.section_path: list[str] = []
+        loader_ctx = ctx
+        while loader_ctx.parent and config_option not in loader_ctx.command.params:
+            self.section_path.insert(0, loader_ctx.info_name)
+            loader_ctx = loader_ctx.parent
+        self.callback = callback
+        self.interval = interval
+        self.debounce = debounce
+        self.stopped = threading.Event()
+        # Take the reference state right away, so changes made as soon as the
+        # watcher is created are not missed.
+        self.known = self.signature()
+
+    def stop(self) -> None:
+        """Stop watching, and wait for the thread to end."""
+        self.stopped.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join()
+
+    def watched_files(self) -> list[str]:
+        """Returns the local files the current configuration was loaded from."""
+        locations = self.ctx.meta.get("click_extra.config_locations", {})
+        return [location for location in locations.values() if not is_url(location)]
+
+    def signature(self) -> dict[str, tuple[int, int] | None]:
+        """Returns the modification time and size of each watched file, or ``None``
+        for missing files."""
+        signature: dict[str, tuple[int, int] | None] = {}
+        for location in self.watched_files():
+            try:
+                stat = os.stat(location)
+            except OSError:
+                signature[location] = None
+            else:
+                signature[location] = (stat.st_mtime_ns, stat.st_size)
+        return signature
+
+    def reload(self) -> None:
+        """Load the configuration again and publish the new ``default_map``."""
+        logger = logging.getLogger("click_extra")
+        patterns = self.ctx.meta["click_extra.config_patterns"]
+        defaults = self.ctx.meta["click_extra.config_defaults"]
+        try:
+            user_conf = self.config_option.read_and_parse_sources(patterns, self.ctx)
+            if user_conf is None:
+                logger.warning("Can't reload configuration: no file found.")
+                return
+            section: Mapping[str, Any] | None = self.config_option.merge_default_map(
+                defaults,
+                user_conf,
+                self.ctx,
+            )
+            # Descend to the section of the watched context, like Click does when it
+            # creates the context of a subcommand.
+            for name in self.section_path:
+                section = section.get(name) if section is not None else None
+        except (BadParameter, OSError, ValueError) as ex:
+            logger.warning(f"Can't reload configuration: {ex}")
+            return
+        self.ctx.default_map = section
+        logger.debug(f"Reloaded defaults: {section}")
+        self.callback(section)
+
+    def run(self) -> None:
+        changed = None
+        changed_since = 0.0
+        while not self.stopped.wait(self.interval):
+            current = self.signature()
+            if current == self.known:
+                changed = None
+                continue
+            # Wait for the files to stop changing.
+            if current != changed:
+                changed = current
+                changed_since = time.monotonic()
+                continue
+            if time.monotonic() - changed_since < self.debounce:
+                continue
+            self.reload()
+            self.known = self.signature()
+            changed = None
@@ -21,7 +21,7 @@ import cloup
 
 from .colorize import ColorOption, HelpOption
 from .commands import ExtraCommand, ExtraGroup, default_extra_params
-from .config import ConfigOption
+from .config import ConfigCacheOption, ConfigOption
 from .logging import VerbosityOption
 from .parameters import ShowParamsOption
 from .tabulate import TableFormatOption
@@ -99,6 +99,7 @@ extra_group = decorator_factory(
 
 # Option decorators.
 color_option = decorator_factory(dec=cloup.option, cls=ColorOption)
+config_cache_option = decorator_factory(dec=cloup.option, cls=ConfigCacheOption)
 config_option = decorator_factory(dec=cloup.option, cls=ConfigOption)
 help_option = decorator_factory(dec=cloup.option, cls=HelpOption)
 show_params_option = decorator_factory(dec=cloup.option, cls=ShowParamsOption)
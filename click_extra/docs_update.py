@@ -13,7 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
-"""Automation to keep click-extra documentation up-to-date.
+"""Automation to keep click-extra documentation and generated code up-to-date.
 
 .. tip::
 
@@ -31,11 +31,12 @@ from __future__ import annotations
 
 import html
 import sys
+from importlib import metadata
 from pathlib import Path
 from textwrap import indent
 
 from .platforms import ALL_GROUPS, EXTRA_GROUPS, NON_OVERLAPPING_GROUPS, Group
-from .pygments import lexer_map
+from .pygments import find_session_lexers, lexer_map
 from .tabulate import tabulate
 
 
@@ -91,6 +92,22 @@ def generate_lexer_table() -> str:
     )
 
 
+def generate_session_lexers_index() -> str:
+    """Generate the Python source of the ``click_extra.pygments.SESSION_LEXERS`` index,
+    stamped with the version of Pygments it was produced from."""
+    index = sorted(
+        (lexer.__name__, lexer.__module__) for lexer in find_session_lexers()
+    )
+    lines = [
+        f'SESSION_LEXERS_PYGMENTS_VERSION = "{metadata.version("pygments")}"',
+        "",
+        "SESSION_LEXERS: dict[str, str] = {",
+        *(f'    "{name}": "{module}",' for name, module in index),
+        "}",
+    ]
+    return "\n".join(lines)
+
+
 def generate_platforms_graph(
     graph_id: str,
     description: str,
@@ -150,6 +167,14 @@ def update_docs() -> None:
         generate_lexer_table(),
     )
 
+    # Regenerate the index of session lexers against the installed Pygments.
+    replace_content(
+        project_root.joinpath("click_extra/pygments.py"),
+        "# session-lexers-index-start\n",
+        "\n# session-lexers-index-end",
+        generate_session_lexers_index(),
+    )
+
     # TODO: Replace this hard-coded dict by allowing Group dataclass to group
     # other groups.
     all_groups = (
@@ -32,7 +32,7 @@ from typing import TYPE_CHECKING, Literal, TypeVar
 
 import click
 
-from . import Choice
+from . import Choice, cache
 from .colorize import default_theme
 from .parameters import ExtraOption
 
@@ -202,6 +202,16 @@ def extra_basic_config(
     return logger
 
 
+@cache
+def configure_root_logger() -> Logger:
+    """Setup Python's ``root`` logger with ``extra_basic_config()``, once per process.
+
+    Subsequent calls are no-op, so handlers are not torn down and re-created on each
+    invocation of the CLI.
+    """
+    return extra_basic_config()
+
+
 class VerbosityOption(ExtraOption):
     """A pre-configured ``--verbosity``/``-v`` option.
 
@@ -225,6 +235,10 @@ class VerbosityOption(ExtraOption):
     build hierarchical loggers.
     """
 
+    setup_root_logger: bool
+    """Whether the option is responsible for the configuration of the ``root`` logger.
+    """
+
     @property
     def all_loggers(self) -> Generator[Logger, None, None]:
         """Returns the list of logger IDs affected by the verbosity option.
@@ -256,12 +270,18 @@ class VerbosityOption(ExtraOption):
 
         Save the verbosity level name in the context.
 
+        If the option targets the default ``root`` logger, it is configured here on
+        first use with ``configure_root_logger()``.
+
         Also prints the chosen value as a debug message via the internal
         ``click_extra`` logger.
         """
         # XXX ctx.meta doesn't cut it, we need to target ctx._meta.
         ctx._meta["click_extra.verbosity"] = value
 
+        if self.setup_root_logger:
+            configure_root_logger()
+
         for logger in self.all_loggers:
             logger.setLevel(LOG_LEVELS[value])
             logging.getLogger("click_extra").debug(f"Set {logger} to {value}.")
@@ -290,9 +310,10 @@ class VerbosityOption(ExtraOption):
             <https://github.com/python/cpython/blob/2b5dbd1/Lib/logging/__init__.py#L1945>`_
             is used.
 
-        .. todo::
-            Write more documentation to detail in which case the user is responsible
-            for setting up the logger, and when ``extra_basic_config`` is used.
+        The default ``root`` logger is not configured at instantiation, but on the
+        first call to the ``set_levels()`` callback. So importing a CLI never alters
+        the logging configuration of the host application. Loggers passed with
+        ``default_logger`` are used as-is, and are never configured by the option.
         """
         if not param_decls:
             param_decls = ("--verbosity", "-v")
@@ -303,12 +324,13 @@ class VerbosityOption(ExtraOption):
         # If a string is provided, use it as the logger name.
         elif isinstance(default_logger, str):
             logger = logging.getLogger(default_logger)
-        # ``None`` will produce a default root logger.
+        # ``None`` targets the root logger, whose setup is deferred to the callback.
         else:
-            logger = extra_basic_config(default_logger)
+            logger = logging.getLogger()
 
         # Store the logger name for later use.
         self.logger_name = logger.name
+        self.setup_root_logger = default_logger is None
 
         kwargs.setdefault("callback", self.set_levels)
 
@@ -21,17 +21,19 @@ Also implements environment variable utilities.
 from __future__ import annotations
 
 import inspect
+import json
 import logging
 import re
-from collections.abc import MutableMapping
+from collections.abc import Mapping, MutableMapping
+from configparser import ConfigParser
 from functools import cached_property, reduce
 from gettext import gettext as _
 from operator import getitem, methodcaller
-from typing import Any, Iterable, Sequence
+from types import MappingProxyType, MethodType
+from typing import Any, Callable, Iterable, NamedTuple, Sequence
 
 import click
 from boltons.iterutils import unique
-from mergedeep import merge
 from tabulate import tabulate
 
 from . import (
@@ -166,6 +168,116 @@ def search_params(
     return param_list
 
 
+def convert_to_str(value: Any) -> Any:
+    """Convert numbers and booleans to strings. Other values are returned as-is, for
+    Click to convert them, like the ``datetime`` objects produced by TOML and YAML."""
+    if isinstance(value, (list, dict)):
+        msg = f"{value!r} is not a valid string."
+        raise ValueError(msg)
+    if isinstance(value, (bool, int, float)):
+        return str(value)
+    return value
+
+
+def convert_to_int(value: Any) -> int:
+    """Convert integers, integral floats like ``3.0``, and the string representation of
+    integers to ``int``."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            pass
+    msg = f"{value!r} is not a valid integer."
+    raise ValueError(msg)
+
+
+def convert_to_float(value: Any) -> float:
+    """Convert numbers and their string representation to ``float``."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.strip())
+        except ValueError:
+            pass
+    msg = f"{value!r} is not a valid float."
+    raise ValueError(msg)
+
+
+def convert_to_bool(value: Any) -> bool:
+    """Convert booleans, the ``0`` and ``1`` integers, and the strings recognized by
+    ``configparser``, like ``yes``, ``off`` or ``1``, to ``bool``."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        state = ConfigParser.BOOLEAN_STATES.get(value.strip().lower())
+        if state is not None:
+            return state
+    msg = f"{value!r} is not a valid boolean."
+    raise ValueError(msg)
+
+
+def convert_to_list(value: Any) -> list:
+    """Convert sequences and JSON-serialized arrays to ``list``.
+
+    Formats like INI or XML have no native way to express a list, so their lists are
+    expected to be serialized in JSON.
+    """
+    if isinstance(value, list):
+        return value
+    if isinstance(value, tuple):
+        return list(value)
+    if isinstance(value, str):
+        try:
+            decoded = json.loads(value)
+        except ValueError:
+            pass
+        else:
+            if isinstance(decoded, list):
+                return decoded
+    msg = f"{value!r} is not a valid list."
+    raise ValueError(msg)
+
+
+def convert_to_tuple(value: Any) -> tuple:
+    """Convert sequences and JSON-serialized arrays to ``tuple``."""
+    return tuple(convert_to_list(value))
+
+
+def convert_to_set(value: Any) -> set:
+    """Convert sequences, sets and JSON-serialized arrays to ``set``."""
+    if isinstance(value, (set, frozenset)):
+        return set(value)
+    return set(convert_to_list(value))
+
+
+def convert_to_frozenset(value: Any) -> frozenset:
+    """Convert sequences, sets and JSON-serialized arrays to ``frozenset``."""
+    return frozenset(convert_to_set(value))
+
+
+def convert_to_dict(value: Any) -> dict:
+    """Convert mappings and JSON-serialized objects to ``dict``."""
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, str):
+        try:
+            decoded = json.loads(value)
+        except ValueError:
+            pass
+        else:
+            if isinstance(decoded, dict):
+                return decoded
+    msg = f"{value!r} is not a valid dict."
+    raise ValueError(msg)
+
+
 class ExtraOption(Option):
     """All new options implemented by ``click-extra`` inherits this class.
 
@@ -175,6 +287,57 @@ class ExtraOption(Option):
     Also contains Option-specific code that should be contributed upstream to Click.
     """
 
+    fast_path_dependencies: tuple[type[click.Parameter], ...] | None = None
+    """Marks informational options, which print something and exit, like ``--help`` or
+    ``--version``.
+
+    If such an option is found on the command line, the CLI takes a fast path on which
+    the eager callbacks of other options are skipped, unless they are instances of the
+    types listed here. Defaults to ``None``, for options that are not informational.
+    """
+
+    def __copy__(self) -> ExtraOption:
+        """Produce a clone of the option, way cheaper than a new instantiation.
+
+        Attributes are shared with the original, except:
+
+        - mutable containers, like the list of ``opts``, which are shallow-copied,
+        - methods of the original bound to attributes, like the ``callback`` or the
+          ``default`` value, which are fetched again from the clone.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        for name, value in self.__dict__.items():
+            if isinstance(value, (list, dict, set)):
+                value = value.copy()
+            elif isinstance(value, MethodType) and value.__self__ is self:
+                value = getattr(clone, value.__func__.__name__)
+            clone.__dict__[name] = value
+        return clone
+
+    def handle_parse_result(
+        self,
+        ctx: click.Context,
+        opts: Mapping[str, Any],
+        args: list[str],
+    ) -> tuple[Any, list[str]]:
+        """Skip the processing of eager options on the fast path to an informational
+        option that does not depend on them.
+
+        Options set on the command line, or exposing their value to the command, are
+        always processed.
+        """
+        fast_path = ctx.meta.get("click_extra.fast_path")
+        if (
+            fast_path is not None
+            and self.is_eager
+            and not self.expose_value
+            and self.name not in opts
+            and not isinstance(self, fast_path)
+        ):
+            logging.getLogger("click_extra").debug(f"Fast path skips {self!r}")
+            return None, args
+        return super().handle_parse_result(ctx, opts, args)
+
     @staticmethod
     def get_help_default(option: click.Option, ctx: click.Context) -> str | None:
         """Produce the string to be displayed in the help as option's default.
@@ -256,6 +419,14 @@ class ExtraOption(Option):
         return None
 
 
+class IndexedParam(NamedTuple):
+    """Entry of the ``ParamStructure.params_index`` flat index."""
+
+    param: click.Parameter
+    python_type: type
+    envvars: tuple[str, ...]
+
+
 class ParamStructure:
     """Utilities to introspect CLI options and commands structure.
 
@@ -276,6 +447,7 @@ class ParamStructure:
 
     DEFAULT_EXCLUDED_PARAMS: Iterable[str] = (
         "config",
+        "config_cache",
         "help",
         "show_params",
         "version",
@@ -284,6 +456,8 @@ class ParamStructure:
 
     - ``-C``/``--config`` option, which cannot be used to recursively load another
       configuration file.
+    - ``--config-cache``/``--no-config-cache`` flag, which is resolved before the
+      configuration file is loaded.
     - ``--help``, as it makes no sense to have the configurable file always
       forces a CLI to show the help and exit.
     - ``--show-params`` flag, which is like ``--help`` and stops the CLI execution.
@@ -319,6 +493,17 @@ class ParamStructure:
 
         return dive(path)
 
+    @staticmethod
+    def freeze_tree_dict(tree_dict: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Returns a read-only copy of the tree-like ``tree_dict``, made of nested
+        ``types.MappingProxyType``."""
+        return MappingProxyType(
+            {
+                k: ParamStructure.freeze_tree_dict(v) if isinstance(v, Mapping) else v
+                for k, v in tree_dict.items()
+            },
+        )
+
     @staticmethod
     def get_tree_value(tree_dict: dict[str, Any], *path: str) -> Any | None:
         """Get in the ``tree_dict`` the value located at the ``path``."""
@@ -348,17 +533,20 @@ class ParamStructure:
         """
         return dict(self._flatten_tree_dict_gen(tree_dict, parent_key))
 
-    def walk_params(self):
+    def walk_params(self, ctx: click.Context | None = None):
         """Generates an unfiltered list of all CLI parameters.
 
         Everything is included, from top-level groups to subcommands, and from options
-        to arguments.
+        to arguments. Except lazy subcommands that have not been imported yet.
+
+        ``ctx`` defaults to the current context.
 
         Returns a 2-elements tuple:
             - the first being a tuple of keys leading to the parameter
             - the second being the parameter object itself
         """
-        ctx = get_current_context()
+        if ctx is None:
+            ctx = get_current_context()
         cli = ctx.find_root().command
 
         # Keep track of top-level CLI parameter IDs to check conflict with command
@@ -403,11 +591,107 @@ class ParamStructure:
     """Mapping of Click types to their Python equivalent.
 
     Keys can be a mix of instances or subclasses of ``click.types.ParamType``. Values
-    are expected to be simple Python types.
+    are expected to be simple Python types. Instances stand for their whole class.
 
     This mapping can be seen as a reverse of the ``click.types.convert_type()`` method.
+
+    .. tip::
+        Use ``register_param_type()`` to add your own custom types to this mapping.
+    """
+
+    TYPE_CONVERTERS: dict[type, Callable[[Any], Any]] = {
+        str: convert_to_str,
+        int: convert_to_int,
+        float: convert_to_float,
+        bool: convert_to_bool,
+        list: convert_to_list,
+        tuple: convert_to_tuple,
+        set: convert_to_set,
+        frozenset: convert_to_frozenset,
+        dict: convert_to_dict,
+    }
+    """Mapping of the Python types of ``TYPE_MAP`` to the function converting
+    configuration values to them.
+
+    Converters raise a ``ValueError`` if the value can't be converted.
     """
 
+    PARAM_TYPE_CONVERTERS: dict[type[click.ParamType], Callable[[Any], Any]] = {}
+    """Mapping of Click types to their own configuration value converter.
+
+    Takes precedence over ``TYPE_CONVERTERS`` for the parameters of these types. Only
+    populated by ``register_param_type()``.
+    """
+
+    _type_dispatch: dict[
+        tuple[type, type[click.ParamType]],
+        tuple[type, Callable[[Any], Any] | None],
+    ] = {}
+    """Cache of the Python type and converter resolved for each Click type class."""
+
+    @classmethod
+    def register_param_type(
+        cls,
+        click_type: type[click.ParamType],
+        python_type: type,
+        converter: Callable[[Any], Any] | None = None,
+    ) -> None:
+        """Register the Python type of a custom Click type, and optionally the function
+        converting its configuration values.
+
+        Subclasses of ``click_type`` inherit its registration, unless registered on
+        their own.
+
+        If no ``converter`` is provided, the one of ``python_type`` in
+        ``TYPE_CONVERTERS`` is used. Converters are expected to raise a ``ValueError``
+        if the value can't be converted.
+
+        .. caution::
+            Registration is global: it affects all ``ParamStructure`` subclasses
+            sharing the same ``TYPE_MAP``.
+        """
+        cls.TYPE_MAP[click_type] = python_type
+        if converter is None:
+            cls.PARAM_TYPE_CONVERTERS.pop(click_type, None)
+        else:
+            cls.PARAM_TYPE_CONVERTERS[click_type] = converter
+        # Previous resolutions might now be shadowed by the new registration.
+        cls._type_dispatch.clear()
+
+    def dispatch_param_type(
+        self,
+        click_type: type[click.ParamType],
+    ) -> tuple[type, Callable[[Any], Any] | None]:
+        """Returns the Python type and the specific configuration converter (if any)
+        registered for the ``click_type`` class.
+
+        The first registered class found in the method resolution order of
+        ``click_type`` wins. Resolutions are cached per class, so the ``TYPE_MAP`` is
+        only searched once for each Click type.
+        """
+        key = (type(self), click_type)
+        resolved = self._type_dispatch.get(key)
+        if resolved is None:
+            registered = {
+                k if inspect.isclass(k) else type(k): py_type
+                for k, py_type in self.TYPE_MAP.items()
+            }
+            for klass in click_type.__mro__:
+                if klass in registered:
+                    resolved = (
+                        registered[klass],
+                        self.PARAM_TYPE_CONVERTERS.get(klass),
+                    )
+                    break
+            else:
+                msg = (
+                    f"Can't guess the appropriate Python type of {click_type!r}. "
+                    "Register it with ParamStructure.register_param_type()."
+                )
+                raise ValueError(msg)
+            self._type_dispatch[key] = resolved
+        return resolved
+
     def get_param_type(self, param):
         """Get the Python type of a Click parameter.
 
@@ -420,14 +704,23 @@ class ParamStructure:
         if hasattr(param, "is_bool_flag") and param.is_bool_flag:
             return bool
 
-        for click_type, py_type in self.TYPE_MAP.items():
-            if param.type == click_type:
-                return py_type
-            if inspect.isclass(click_type) and isinstance(param.type, click_type):
-                return py_type
+        try:
+            return self.dispatch_param_type(type(param.type))[0]
+        except ValueError:
+            msg = f"Can't guess the appropriate Python type of {param!r} parameter."
+            raise ValueError(msg) from None
 
-        msg = f"Can't guess the appropriate Python type of {param!r} parameter."
-        raise ValueError(msg)
+    def get_param_converter(self, param) -> Callable[[Any], Any] | None:
+        """Get the function converting configuration values of a Click parameter.
+
+        Returns ``None`` if there is no converter for the parameter's Python type.
+        """
+        # Lists and flags are not of the type of their Click type.
+        if param.multiple or param.nargs != 1 or getattr(param, "is_bool_flag", False):
+            return self.TYPE_CONVERTERS.get(self.get_param_type(param))
+
+        python_type, converter = self.dispatch_param_type(type(param.type))
+        return converter or self.TYPE_CONVERTERS.get(python_type)
 
     @cached_property
     def excluded_params(self) -> Iterable[str]:
@@ -448,33 +741,64 @@ class ParamStructure:
         cli = ctx.find_root().command
         return [f"{cli.name}{self.SEP}{p}" for p in self.DEFAULT_EXCLUDED_PARAMS]
 
-    def build_param_trees(self) -> None:
+    def build_param_trees(self, ctx: click.Context | None = None) -> None:
         """Build all parameters tree structure in one go and cache them.
 
-        This removes parameters whose fully-qualified IDs are in the ``excluded_params``
+        Trees are built in a single walk over the parameters, in linear time. This
+        removes parameters whose fully-qualified IDs are in the ``excluded_params``
         blocklist.
+
+        Lazy subcommands of ``ExtraLazyGroup`` are not imported. Their parameters are
+        missing from the trees, and the template accepts any value for them. The
+        trees are built again by ``ExtraLazyGroup`` each time it imports one of them.
+
+        ``ctx`` defaults to the current context.
         """
         template: dict[str, Any] = {}
         types: dict[str, Any] = {}
         objects: dict[str, Any] = {}
-
-        for keys, param in self.walk_params():
-            if self.SEP.join(keys) in self.excluded_params:
+        index: dict[tuple[str, ...], IndexedParam] = {}
+        excluded = frozenset(self.excluded_params)
+        if ctx is None:
+            ctx = get_current_context()
+
+        # Insert each parameter in the three trees at once, by descending along its
+        # path and only creating the missing levels.
+        for keys, param in self.walk_params(ctx):
+            if self.SEP.join(keys) in excluded:
                 continue
-            merge(template, self.init_tree_dict(*keys))
-            merge(types, self.init_tree_dict(*keys, leaf=self.get_param_type(param)))
-            merge(objects, self.init_tree_dict(*keys, leaf=param))
+            *parents, param_id = keys
+            template_node, types_node, objects_node = template, types, objects
+            for key in parents:
+                template_node = template_node.setdefault(key, {})
+                types_node = types_node.setdefault(key, {})
+                objects_node = objects_node.setdefault(key, {})
+            python_type = self.get_param_type(param)
+            template_node[param_id] = None
+            types_node[param_id] = python_type
+            objects_node[param_id] = param
+            index[keys] = IndexedParam(param, python_type, all_envvars(param, ctx))
+
+        # Parameters of lazy subcommands not imported yet are unknown: let their whole
+        # configuration through.
+        cli = ctx.find_root().command
+        for cmd_id in getattr(cli, "unloaded_commands", ()):
+            template.setdefault(cli.name, {}).setdefault(cmd_id, None)
 
-        self.params_template = template
+        self.params_template = self.freeze_tree_dict(template)
         self.params_types = types
         self.params_objects = objects
+        self.params_index = index
+        # Derived from the index, so computed again on next access.
+        self.__dict__.pop("conversion_plan", None)
 
     @cached_property
     def params_template(self):
         """Returns a tree-like dictionnary whose keys shadows the CLI options and
         subcommands and values are ``None``.
 
-        Perfect to serve as a template for configuration files.
+        Perfect to serve as a template for configuration files. It is read-only, so it
+        can be shared by all invocations of the CLI in the same process.
         """
         self.build_param_trees()
         return self.params_template
@@ -499,6 +823,75 @@ class ParamStructure:
         self.build_param_trees()
         return self.params_objects
 
+    @cached_property
+    def params_index(self) -> dict[tuple[str, ...], IndexedParam]:
+        """Returns a flat ``dict`` mapping the path of each parameter to its
+        ``IndexedParam`` entry: the parameter object, its Python type and its
+        environment variables.
+
+        Paths are tuples of the keys leading to the parameter in the other trees.
+        Parameters are ordered as they are found in the CLI, i.e. top-level
+        parameters first, followed by the parameters of each subcommand.
+
+        Perfect for direct access to a parameter without walking down the trees.
+        """
+        self.build_param_trees()
+        return self.params_index
+
+    @cached_property
+    def conversion_plan(self) -> dict[tuple[str, ...], Callable[[Any], Any]]:
+        """Returns a flat ``dict`` mapping the path of each parameter to the function
+        converting its configuration value to the expected Python type.
+
+        Computed once from ``params_index``, ``PARAM_TYPE_CONVERTERS`` and
+        ``TYPE_CONVERTERS``. Parameters whose type has no converter are left out.
+        """
+        plan = {}
+        for path, entry in self.params_index.items():
+            converter = self.get_param_converter(entry.param)
+            if converter:
+                plan[path] = converter
+        return plan
+
+    def convert_conf(
+        self,
+        conf: Mapping[str, Any],
+        path: tuple[str, ...] = (),
+    ) -> dict[str, Any]:
+        """Returns a copy of the tree-like ``conf`` with its values converted to the
+        Python type of their parameter, following ``conversion_plan``.
+
+        ``path`` is the location of ``conf`` in the parameter structure, if it is only
+        a branch of the whole configuration.
+
+        Values not targeting a known parameter are left untouched. All values are
+        converted in a single pass, before raising a ``ValueError`` listing every
+        value that couldn't be converted.
+        """
+        plan = self.conversion_plan
+        errors = []
+
+        def convert(tree, path):
+            converted = {}
+            for key, value in tree.items():
+                key_path = (*path, key)
+                converter = plan.get(key_path)
+                if converter:
+                    try:
+                        value = converter(value)
+                    except ValueError as ex:
+                        errors.append(f"{self.SEP.join(key_path)}: {ex}")
+                        continue
+                elif isinstance(value, Mapping):
+                    value = convert(value, key_path)
+                converted[key] = value
+            return converted
+
+        converted_conf = convert(conf, path)
+        if errors:
+            raise ValueError("\n".join(errors))
+        return converted_conf
+
 
 class ShowParamsOption(ExtraOption, ParamStructure):
     """A pre-configured option adding a ``--show-params`` option.
@@ -607,21 +1000,21 @@ class ShowParamsOption(ExtraOption, ParamStructure):
         # Inspect the CLI to search for any --config option.
         config_option = search_params(ctx.command.params, ConfigOption)
 
-        table = []
-        for path, param_type in self.flatten_tree_dict(self.params_types).items():
-            # Get the parameter instance.
-            tree_keys = path.split(self.SEP)
-            param = self.get_tree_value(self.params_objects, *tree_keys)
-            assert param.name == tree_keys[-1]
+        excluded_params = (
+            frozenset(config_option.excluded_params) if config_option else frozenset()
+        )
 
+        table = []
+        for keys, (param, param_type, envvars) in self.params_index.items():
+            path = self.SEP.join(keys)
             param_value, source = get_param_value(param)
-            param_class = self.get_tree_value(self.params_objects, *tree_keys).__class__
+            param_class = param.__class__
             param_spec = param.get_help_record(ctx)[0]
 
             # Check if the parameter is allowed in the configuration file.
             allowed_in_conf = None
             if config_option:
-                allowed_in_conf = KO if path in config_option.excluded_params else OK
+                allowed_in_conf = KO if path in excluded_params else OK
 
             line = (
                 default_theme.invoked_command(path),
@@ -630,7 +1023,7 @@ class ShowParamsOption(ExtraOption, ParamStructure):
                 param_type.__name__,
                 allowed_in_conf,
                 OK if param.expose_value is True else KO,
-                ", ".join(map(default_theme.envvar, all_envvars(param, ctx))),
+                ", ".join(map(default_theme.envvar, envvars)),
                 default_theme.default(param.get_default(ctx)),
                 param_value,
                 source._name_ if source else None,
@@ -28,14 +28,66 @@ platform-dependent values.
 
 from __future__ import annotations
 
+import os
 import platform
 import sys
 from dataclasses import dataclass, field
+from functools import cached_property, wraps
 from itertools import combinations
-from typing import Iterable
+from typing import Callable, Iterable
 
 from . import cache
 
+PLATFORM_ENVVAR = "CLICK_EXTRA_PLATFORM"
+"""Environment variable forcing the ID of the current platform.
+
+If set, no heuristics are run to identify the current platform. This is useful to
+skip probing in CI, or to simulate another platform.
+"""
+
+
+@cache
+def uname() -> platform.uname_result:
+    """Single, cached snapshot of the system identification.
+
+    All heuristics below derive from it, so the OS is only probed once.
+    """
+    return platform.uname()
+
+
+@cache
+def system_alias() -> str:
+    """Returns the marketing name of the system, as ``platform.platform(aliased=True)``
+    does."""
+    snapshot = uname()
+    return platform.system_alias(snapshot.system, snapshot.release, snapshot.version)[
+        0
+    ]
+
+
+def heuristic(func: Callable[[], bool]) -> Callable[[], bool]:
+    """Decorates the heuristic identifying a platform, to honor the
+    ``CLICK_EXTRA_PLATFORM`` environment variable.
+
+    If a platform is forced, the heuristic is not run: it returns whether its
+    platform is the forced one. So all heuristics agree with ``current_os()``, and
+    everything depending on them, like ``get_cache_dir()``, follows the forced
+    platform.
+
+    The result is cached, like the one of ``current_os()``.
+    """
+    platform_id = func.__name__[len("is_") :]
+
+    @wraps(func)
+    def wrapper() -> bool:
+        forced_id = forced_platform_id()
+        if forced_id:
+            return forced_id == platform_id
+        return func()
+
+    return cache(wrapper)
+
+
 """ Below is the collection of heuristics used to identify each platform.
 
 All these heuristics can be hard-cached as the underlying system is not suppose to
@@ -43,31 +95,31 @@ change between code execution.
 """
 
 
-@cache
+@heuristic
 def is_aix() -> bool:
     """Return `True` only if current platform is of the AIX family."""
     return sys.platform.startswith("aix")
 
 
-@cache
+@heuristic
 def is_cygwin() -> bool:
     """Return `True` only if current platform is of the Cygwin family."""
     return sys.platform.startswith("cygwin")
 
 
-@cache
+@heuristic
 def is_freebsd() -> bool:
     """Return `True` only if current platform is of the FreeBSD family."""
     return sys.platform.startswith(("freebsd", "midnightbsd"))
 
 
-@cache
+@heuristic
 def is_hurd() -> bool:
     """Return `True` only if current platform is of the GNU/Hurd family."""
     return sys.platform.startswith("GNU")
 
 
-@cache
+@heuristic
 def is_linux() -> bool:
     """Return `True` only if current platform is of the Linux family.
 
@@ -77,43 +129,43 @@ def is_linux() -> bool:
     return sys.platform.startswith("linux") and not is_wsl1() and not is_wsl2()
 
 
-@cache
+@heuristic
 def is_macos() -> bool:
     """Return `True` only if current platform is of the macOS family."""
-    return platform.platform(terse=True).startswith(("macOS", "Darwin"))
+    return uname().system == "Darwin"
 
 
-@cache
+@heuristic
 def is_netbsd() -> bool:
     """Return `True` only if current platform is of the NetBSD family."""
     return sys.platform.startswith("netbsd")
 
 
-@cache
+@heuristic
 def is_openbsd() -> bool:
     """Return `True` only if current platform is of the OpenBSD family."""
     return sys.platform.startswith("openbsd")
 
 
-@cache
+@heuristic
 def is_solaris() -> bool:
     """Return `True` only if current platform is of the Solaris family."""
-    return platform.platform(aliased=True, terse=True).startswith("Solaris")
+    return system_alias() == "Solaris"
 
 
-@cache
+@heuristic
 def is_sunos() -> bool:
     """Return `True` only if current platform is of the SunOS family."""
-    return platform.platform(aliased=True, terse=True).startswith("SunOS")
+    return system_alias() == "SunOS"
 
 
-@cache
+@heuristic
 def is_windows() -> bool:
     """Return `True` only if current platform is of the Windows family."""
     return sys.platform.startswith("win32")
 
 
-@cache
+@heuristic
 def is_wsl1() -> bool:
     """Return `True` only if current platform is Windows Subsystem for Linux v1.
 
@@ -135,13 +187,13 @@ def is_wsl1() -> bool:
                 $ uname -r
                 5.10.102.1-microsoft-standard-WSL2
     """
-    return "Microsoft" in platform.release()
+    return "Microsoft" in uname().release
 
 
-@cache
+@heuristic
 def is_wsl2() -> bool:
     """Return `True` only if current platform is Windows Subsystem for Linux v2."""
-    return "microsoft" in platform.release()
+    return "microsoft" in uname().release
 
 
 @dataclass(frozen=True)
@@ -158,14 +210,18 @@ class Platform:
     name: str
     """User-friendly name of the platform."""
 
-    current: bool = field(init=False)
-    """`True` if current environment runs on this platform."""
-
     def __post_init__(self):
-        """Set the ``current`` attribute to identifying the current platform."""
-        check_func_id = f"is_{self.id}"
-        assert check_func_id in globals()
-        object.__setattr__(self, "current", globals()[check_func_id]())
+        """Check the heuristic identifying the platform exists."""
+        assert f"is_{self.id}" in globals()
+
+    @cached_property
+    def current(self) -> bool:
+        """`True` if current environment runs on this platform.
+
+        Evaluated on first access. If the ``CLICK_EXTRA_PLATFORM`` environment variable
+        is set, it is trusted as the current platform ID and no heuristic is run.
+        """
+        return globals()[f"is_{self.id}"]()  # type: ignore[no-any-return]
 
 
 AIX = Platform("aix", "AIX")
@@ -572,9 +628,35 @@ def os_label(os_id: str) -> str | None:
     return None
 
 
+def forced_platform_id() -> str | None:
+    """Returns the platform ID forced by the ``CLICK_EXTRA_PLATFORM`` environment
+    variable, if any.
+
+    Raises ``ValueError`` if the ID is not one of a recognized platform.
+    """
+    forced_id = os.environ.get(PLATFORM_ENVVAR, "").strip().lower()
+    if not forced_id:
+        return None
+    if forced_id not in (p.id for p in ALL_PLATFORMS.platforms):
+        msg = (
+            f"Unrecognized {forced_id!r} platform ID in {PLATFORM_ENVVAR}. Must be one "
+            f"of: {', '.join(sorted(p.id for p in ALL_PLATFORMS.platforms))}."
+        )
+        raise ValueError(msg)
+    return forced_id
+
+
 @cache
 def current_os() -> Platform:
-    """Return the current platform."""
+    """Return the current platform.
+
+    Honors the ``CLICK_EXTRA_PLATFORM`` environment variable, in which case no
+    heuristic is run.
+    """
+    forced_id = forced_platform_id()
+    if forced_id:
+        return next(p for p in ALL_PLATFORMS.platforms if p.id == forced_id)
+
     matching = []
     for p in ALL_PLATFORMS.platforms:
         if p.current:
@@ -585,16 +667,44 @@ def current_os() -> Platform:
         raise RuntimeError(msg)
 
     if not matching:
-        msg = (
-            f"Unrecognized {sys.platform} / "
-            f"{platform.platform(aliased=True, terse=True)} platform."
-        )
+        msg = f"Unrecognized {sys.platform} / {system_alias()} platform."
         raise SystemError(msg)
 
     assert len(matching) == 1
     return matching.pop()
 
 
-CURRENT_OS_ID: str = current_os().id
-CURRENT_OS_LABEL: str = current_os().name
-"""Constants about the current platform."""
+def get_cache_dir(app_name: str) -> str:
+    """Returns the user's cache folder of an application.
+
+    Follows the conventions of each platform:
+
+    - Windows: ``%LOCALAPPDATA%\\<app_name>\\Cache``
+    - macOS: ``~/Library/Caches/<app_name>``
+    - Unix: ``$XDG_CACHE_HOME/<app_name>``, defaults to ``~/.cache/<app_name>``
+
+    This is the cache equivalent of `click.get_app_dir()
+    <https://click.palletsprojects.com/en/8.1.x/api/#click.get_app_dir>`_. The folder
+    is not created.
+    """
+    if is_windows():
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+        return os.path.join(base, app_name, "Cache")
+    if is_macos():
+        return os.path.join(os.path.expanduser("~/Library/Caches"), app_name)
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, app_name)
+
+
+def __getattr__(name: str) -> str:
+    """Compute ``CURRENT_OS_ID`` and ``CURRENT_OS_LABEL`` constants about the current
+    platform on first access.
+
+    Implements :pep:`562`.
+    """
+    if name == "CURRENT_OS_ID":
+        return current_os().id
+    if name == "CURRENT_OS_LABEL":
+        return current_os().name
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
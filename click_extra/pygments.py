@@ -17,24 +17,16 @@
 
 from __future__ import annotations
 
+from importlib import import_module
+from typing import Iterator
+
+import pygments
 from pygments import lexers
 from pygments.filter import Filter
 from pygments.filters import TokenMergeFilter
 from pygments.formatter import _lookup_style  # type: ignore[attr-defined]
 from pygments.formatters import HtmlFormatter
 from pygments.lexer import Lexer, LexerMeta
-from pygments.lexers.algebra import GAPConsoleLexer
-from pygments.lexers.dylan import DylanConsoleLexer
-from pygments.lexers.erlang import ElixirConsoleLexer, ErlangShellLexer
-from pygments.lexers.julia import JuliaConsoleLexer
-from pygments.lexers.matlab import MatlabSessionLexer
-from pygments.lexers.php import PsyshConsoleLexer
-from pygments.lexers.python import PythonConsoleLexer
-from pygments.lexers.r import RConsoleLexer
-from pygments.lexers.ruby import RubyConsoleLexer
-from pygments.lexers.shell import ShellSessionBaseLexer
-from pygments.lexers.special import OutputLexer
-from pygments.lexers.sql import PostgresConsoleLexer, SqliteConsoleLexer
 from pygments.style import StyleMeta
 from pygments.token import Generic, string_to_tokentype
 from pygments_ansi_color import (
@@ -43,6 +35,8 @@ from pygments_ansi_color import (
     color_tokens,
 )
 
+from . import cache
+
 DEFAULT_TOKEN_TYPE = Generic.Output
 """Default Pygments' token type to render with ANSI support.
 
@@ -117,18 +111,70 @@ class AnsiLexerFiltersMixin(Lexer):
         self.filters.append(AnsiFilter())
 
 
-def collect_session_lexers():
+# session-lexers-index-start
+SESSION_LEXERS_PYGMENTS_VERSION = "2.19.2"
+
+SESSION_LEXERS: dict[str, str] = {
+    "BashSessionLexer": "pygments.lexers.shell",
+    "DylanConsoleLexer": "pygments.lexers.dylan",
+    "ElixirConsoleLexer": "pygments.lexers.erlang",
+    "ErlangShellLexer": "pygments.lexers.erlang",
+    "GAPConsoleLexer": "pygments.lexers.algebra",
+    "JuliaConsoleLexer": "pygments.lexers.julia",
+    "MSDOSSessionLexer": "pygments.lexers.shell",
+    "MatlabSessionLexer": "pygments.lexers.matlab",
+    "OutputLexer": "pygments.lexers.special",
+    "PostgresConsoleLexer": "pygments.lexers.sql",
+    "PowerShellSessionLexer": "pygments.lexers.shell",
+    "PsyshConsoleLexer": "pygments.lexers.php",
+    "PythonConsoleLexer": "pygments.lexers.python",
+    "RConsoleLexer": "pygments.lexers.r",
+    "RubyConsoleLexer": "pygments.lexers.ruby",
+    "SqliteConsoleLexer": "pygments.lexers.sql",
+    "TcshSessionLexer": "pygments.lexers.shell",
+}
+# session-lexers-index-end
+"""Index of shell-like session lexers from Pygments, mapped to their module.
+
+This index is generated from ``find_session_lexers()`` by the
+``click_extra.docs_update`` automation, against the version of Pygments set in
+``SESSION_LEXERS_PYGMENTS_VERSION``. It allows ANSI variants to be created without
+importing all of Pygments' lexers.
+
+It is ignored if another version of Pygments is installed: see
+``session_lexers_index()``.
+"""
+
+
+def find_session_lexers() -> Iterator[type[Lexer]]:
     """Retrieve all lexers producing shell-like sessions in Pygments.
 
     This function contain a manually-maintained list of lexers, to which we dynamiccaly
     adds lexers inheriting from ``ShellSessionBaseLexer``.
 
+    .. caution::
+        This is slow, as it imports all lexers from Pygments. It is only used to
+        generate the ``SESSION_LEXERS`` index.
+
     .. hint::
 
         To help maintain this list, there is `a test that will fail
         <https://github.com/kdeldycke/click-extra/blob/main/click_extra/tests/test_pygments.py>`_
         if a new REPL/terminal-like lexer is added to Pygments but not referenced here.
     """
+    from pygments.lexers.algebra import GAPConsoleLexer
+    from pygments.lexers.dylan import DylanConsoleLexer
+    from pygments.lexers.erlang import ElixirConsoleLexer, ErlangShellLexer
+    from pygments.lexers.julia import JuliaConsoleLexer
+    from pygments.lexers.matlab import MatlabSessionLexer
+    from pygments.lexers.php import PsyshConsoleLexer
+    from pygments.lexers.python import PythonConsoleLexer
+    from pygments.lexers.r import RConsoleLexer
+    from pygments.lexers.ruby import RubyConsoleLexer
+    from pygments.lexers.shell import ShellSessionBaseLexer
+    from pygments.lexers.special import OutputLexer
+    from pygments.lexers.sql import PostgresConsoleLexer, SqliteConsoleLexer
+
     yield from [
         DylanConsoleLexer,
         ElixirConsoleLexer,
@@ -150,16 +196,76 @@ def collect_session_lexers():
             yield lexer
 
 
-lexer_map = {}
-"""Map original lexer to their ANSI variant."""
+@cache
+def session_lexers_index() -> dict[str, str]:
+    """Returns the index of session lexers of the installed Pygments, mapped to their
+    module.
+
+    That's ``SESSION_LEXERS`` if it was generated for the installed version of
+    Pygments. Else the index is rebuilt with ``find_session_lexers()``, which imports
+    all lexers.
+    """
+    if pygments.__version__ == SESSION_LEXERS_PYGMENTS_VERSION:
+        return SESSION_LEXERS
+    return {lexer.__name__: lexer.__module__ for lexer in find_session_lexers()}
+
+
+def collect_session_lexers() -> Iterator[type[Lexer]]:
+    """Retrieve all lexers referenced in the index returned by
+    ``session_lexers_index()``.
+
+    Only the modules of these lexers are imported.
+    """
+    for lexer_name, module_name in session_lexers_index().items():
+        yield getattr(import_module(module_name), lexer_name)
 
 
-# Auto-generate the ANSI variant of all lexers we collected.
-for original_lexer in collect_session_lexers():
+def get_ansi_lexer(original_lexer: type[Lexer]) -> LexerMeta:
+    """Returns the ANSI variant of the provided session lexer.
+
+    The ANSI variant is created on first call, then cached in the module namespace.
+    """
     new_name = f"Ansi{original_lexer.__name__}"
-    new_lexer = AnsiSessionLexer(new_name, (AnsiLexerFiltersMixin, original_lexer), {})
-    locals()[new_name] = new_lexer
-    lexer_map[original_lexer] = new_lexer
+    new_lexer = globals().get(new_name)
+    if new_lexer is None:
+        new_lexer = AnsiSessionLexer(
+            new_name,
+            (AnsiLexerFiltersMixin, original_lexer),
+            {},
+        )
+        globals()[new_name] = new_lexer
+    return new_lexer
+
+
+def __getattr__(name: str):
+    """Create ANSI lexers and ``lexer_map`` on first access, then cache them in the
+    module namespace.
+
+    Implements :pep:`562`.
+    """
+    if name == "lexer_map":
+        lexer_map = {lexer: get_ansi_lexer(lexer) for lexer in collect_session_lexers()}
+        globals()[name] = lexer_map
+        return lexer_map
+
+    prefix = "Ansi"
+    index = session_lexers_index()
+    if name.startswith(prefix) and name[len(prefix) :] in index:
+        lexer_name = name[len(prefix) :]
+        return get_ansi_lexer(getattr(import_module(index[lexer_name]), lexer_name))
+
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+def __dir__() -> list[str]:
+    """Expose ANSI lexers to introspection, even if not created yet."""
+    return sorted(
+        set(globals()).union(
+            ["lexer_map"],
+            (f"Ansi{lexer_name}" for lexer_name in session_lexers_index()),
+        ),
+    )
 
 
 class AnsiHtmlFormatter(ExtendedColorHtmlFormatterMixin, HtmlFormatter):
@@ -0,0 +1,267 @@
+# Copyright Kevin Deldycke <kevin@deldycke.com> and contributors.
+#
+# This program is Free Software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+"""Persistent snapshot of a resolved command tree.
+
+A snapshot serializes the metadata of a CLI and all its subcommands needed to list
+them (names, aliases, help and sections). It allows some features to be served without
+importing the subcommands of an ``ExtraLazyGroup``:
+
+- the list of subcommands in the help screen of a group,
+- the highlighting of subcommand aliases in the help screen,
+- the completion of subcommand names.
+
+Snapshots are stored as JSON files, and are automatically invalidated whenever one of
+the modules the command tree was built from, the lazy subcommands of the CLI or the
+version of Click Extra change.
+
+.. note::
+    Parameters, environment variables, help records and option groups of commands
+    are not part of the snapshot. The help screen of a subcommand and
+    ``--show-params`` need the live parameters to resolve their values, so they
+    still import the subcommands they target.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+import click
+
+from . import __version__
+
+SNAPSHOT_FORMAT = 3
+"""Version of the snapshot's structure.
+
+Bump it each time the serialized structure changes, to invalidate existing
+snapshots.
+"""
+
+
+@dataclass(frozen=True)
+class CommandSnapshot:
+    """Frozen metadata of a command and its subcommands.
+
+    Mimics the attributes and methods of ``click.Command`` required to render the
+    list of subcommands of a group, so it can be used in place of a live command by
+    Cloup's ``Section``.
+    """
+
+    name: str | None
+    help: str | None = None
+    short_help: str | None = None
+    hidden: bool = False
+    deprecated: bool = False
+    aliases: tuple[str, ...] = ()
+    sections: tuple[tuple[str, bool, tuple[str, ...]], ...] = ()
+    """Sections of subcommands, as produced by Cloup's ``list_sections()``: their
+    title, whether they are sorted, and the names of their subcommands."""
+
+    commands: dict[str, CommandSnapshot] = field(default_factory=dict)
+    """Subcommands snapshots, indexed by the name they are registered with."""
+
+    def get_short_help_str(self, limit: int = 45) -> str:
+        """Same as ``click.Command.get_short_help_str()``."""
+        return click.Command.get_short_help_str(self, limit)  # type: ignore[arg-type]
+
+    def find(self, name: str) -> CommandSnapshot | None:
+        """Returns the subcommand registered as ``name``, or one of its aliases."""
+        if name in self.commands:
+            return self.commands[name]
+        for subcommand in self.commands.values():
+            if name in subcommand.aliases:
+                return subcommand
+        return None
+
+    @classmethod
+    def from_command(
+        cls,
+        cmd: click.Command,
+        ctx: click.Context,
+        name: str | None = None,
+    ) -> CommandSnapshot:
+        """Recursively extract metadata of a live command and all its subcommands.
+
+        Subcommands are resolved through the public ``list_commands()`` and
+        ``get_command()`` API, so lazily-loaded subcommands are included.
+        """
+        commands = {}
+        sections: tuple[tuple[str, bool, tuple[str, ...]], ...] = ()
+        if isinstance(cmd, click.MultiCommand):
+            for sub_id in cmd.list_commands(ctx):
+                sub_cmd = cmd.get_command(ctx, sub_id)
+                if sub_cmd is None:
+                    continue
+                sub_ctx = sub_cmd.context_class(
+                    sub_cmd,
+                    parent=ctx,
+                    info_name=sub_id,
+                    **sub_cmd.context_settings,
+                )
+                commands[sub_id] = cls.from_command(sub_cmd, sub_ctx, sub_id)
+            if hasattr(cmd, "list_sections"):
+                sections = tuple(
+                    (section.title, section.is_sorted, tuple(section.commands))
+                    for section in cmd.list_sections(ctx)
+                )
+
+        return cls(
+            name=name or cmd.name,
+            help=cmd.help,
+            short_help=cmd.short_help,
+            hidden=cmd.hidden,
+            deprecated=cmd.deprecated,
+            aliases=tuple(getattr(cmd, "aliases", ())),
+            sections=sections,
+            commands=commands,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CommandSnapshot:
+        """Restore a command tree from its JSON-serializable form."""
+        return cls(
+            name=data["name"],
+            help=data["help"],
+            short_help=data["short_help"],
+            hidden=data["hidden"],
+            deprecated=data["deprecated"],
+            aliases=tuple(data["aliases"]),
+            sections=tuple(
+                (title, is_sorted, tuple(names))
+                for title, is_sorted, names in data["sections"]
+            ),
+            commands={
+                sub_id: cls.from_dict(sub_data)
+                for sub_id, sub_data in data["commands"].items()
+            },
+        )
+
+
+def source_files(cmd: click.Command, ctx: click.Context) -> Iterator[Path]:
+    """Yields the source files of the live command tree.
+
+    These are the modules implementing the callback of each command, and the modules
+    named in the ``lazy_subcommands`` of each ``ExtraLazyGroup``, wherever they live.
+    Subcommands are resolved with ``get_command()``, so lazy ones get imported.
+    """
+    module_names = [getattr(cmd.callback or cmd, "__module__", None)]
+    for import_path in getattr(cmd, "lazy_subcommands", {}).values():
+        module_names.append(import_path.partition(":")[0])
+    for module_name in module_names:
+        file = getattr(sys.modules.get(module_name or ""), "__file__", None)
+        if file:
+            yield Path(file)
+
+    if isinstance(cmd, click.MultiCommand):
+        for sub_id in cmd.list_commands(ctx):
+            sub_cmd = cmd.get_command(ctx, sub_id)
+            if sub_cmd is None:
+                continue
+            sub_ctx = sub_cmd.context_class(
+                sub_cmd,
+                parent=ctx,
+                info_name=sub_id,
+                **sub_cmd.context_settings,
+            )
+            yield from source_files(sub_cmd, sub_ctx)
+
+
+def source_stats(paths: Iterable[str]) -> dict[str, list[int] | None]:
+    """Returns the modification time and size of each file in ``paths``, or ``None``
+    for missing files."""
+    stats: dict[str, list[int] | None] = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stats[path] = None
+        else:
+            stats[path] = [stat.st_mtime_ns, stat.st_size]
+    return stats
+
+
+def fingerprint(cmd: click.Command) -> str:
+    """Returns a digest of the lazy subcommands of the CLI, and the versions of Click
+    Extra and Python.
+
+    Changes to the source files of the command tree are tracked separately, by the
+    stats saved along the snapshot.
+    """
+    lazy_subcommands = sorted(getattr(cmd, "lazy_subcommands", {}).items())
+    return hashlib.sha256(
+        f"{SNAPSHOT_FORMAT}|{__version__}|{sys.version}|{lazy_subcommands}".encode(),
+    ).hexdigest()
+
+
+def load_snapshot(path: Path, expected_fingerprint: str) -> CommandSnapshot | None:
+    """Load a command tree from the ``path`` snapshot file.
+
+    Returns ``None`` if the snapshot is missing, unreadable, malformed or stale. A
+    snapshot is stale if its fingerprint differs from ``expected_fingerprint``, or if
+    any of the source files it was built from changed since.
+    """
+    logger = logging.getLogger("click_extra")
+    try:
+        content = json.loads(path.read_text(encoding="utf-8"))
+        sources = content["sources"]
+        if (
+            content["fingerprint"] != expected_fingerprint
+            or source_stats(sources) != sources
+        ):
+            logger.debug(f"Command tree snapshot {path} is stale")
+            return None
+        return CommandSnapshot.from_dict(content["tree"])
+    # Valid JSON of the wrong shape fails on the access to its items.
+    except (AttributeError, KeyError, OSError, TypeError, ValueError):
+        logger.debug(f"No usable command tree snapshot at {path}")
+        return None
+
+
+def save_snapshot(
+    path: Path,
+    fingerprint: str,
+    tree: CommandSnapshot,
+    sources: Iterable[Path],
+) -> None:
+    """Save the command tree to the ``path`` snapshot file, along with the stats of
+    the ``sources`` files it was built from.
+
+    The file is written atomically. Failures are logged and ignored, as the snapshot
+    is only an optimization.
+    """
+    logger = logging.getLogger("click_extra")
+    content = json.dumps(
+        {
+            "fingerprint": fingerprint,
+            "sources": source_stats(sorted({str(source) for source in sources})),
+            "tree": asdict(tree),
+        },
+    )
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError as ex:
+        logger.debug(f"Cannot save command tree snapshot to {path}: {ex}")
+    else:
+        logger.debug(f"Command tree snapshot saved to {path}")
@@ -0,0 +1,190 @@
+# Copyright Kevin Deldycke <kevin@deldycke.com> and contributors.
+#
+# This program is Free Software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from textwrap import dedent
+
+from click_extra.bench import (
+    INVOKE_CASES,
+    ImportRecord,
+    aggregate_imports,
+    bench,
+    config_fixture,
+    parse_importtime,
+)
+from click_extra.config import ConfigOption, Formats
+
+IMPORTTIME_OUTPUT = dedent(
+    """\
+    import time: self [us] | cumulative | imported package
+    import time:       100 |        100 | site
+    import time:        50 |         50 |       _collections_abc
+    import time:        20 |         20 |       click._compat
+    import time:       300 |        370 |     click
+    import time:        40 |         40 |       yaml.error
+    import time:       200 |        240 |     yaml
+    import time:       400 |       1010 |   click_extra.config
+    import time:       500 |       1510 | click_extra
+    """,
+)
+
+
+def test_parse_importtime():
+    records = parse_importtime(IMPORTTIME_OUTPUT)
+    assert records == [
+        ImportRecord("site", 0, 100, 100, None),
+        ImportRecord("_collections_abc", 3, 50, 50, "click"),
+        ImportRecord("click._compat", 3, 20, 20, "click"),
+        ImportRecord("click", 2, 300, 370, "click_extra.config"),
+        ImportRecord("yaml.error", 3, 40, 40, "yaml"),
+        ImportRecord("yaml", 2, 200, 240, "click_extra.config"),
+        ImportRecord("click_extra.config", 1, 400, 1010, "click_extra"),
+        ImportRecord("click_extra", 0, 500, 1510, None),
+    ]
+
+
+def test_aggregate_imports():
+    records = parse_importtime(IMPORTTIME_OUTPUT)
+    # Modules imported at startup by site are ignored, so is the standard library.
+    assert aggregate_imports(records, "click_extra") == {
+        "click": 370,
+        "click_extra": 1510,
+        "click_extra.config": 1010,
+        "yaml": 240,
+    }
+    assert aggregate_imports(records, "click_extra.config") == {
+        "click": 370,
+        "click_extra.config": 1010,
+        "yaml": 240,
+    }
+
+
+def test_aggregate_failed_imports():
+    # yaml probes for its optional C extension, which is not installed.
+    records = parse_importtime(
+        IMPORTTIME_OUTPUT.replace(
+            "yaml.error\n",
+            "yaml.error\nimport time:        10 |         10 |       _yaml\n",
+        ),
+    )
+    assert aggregate_imports(records)["_yaml"] == 10
+
+    loaded = {record.module for record in records} - {"_yaml"}
+    assert aggregate_imports(records, loaded=loaded) == {
+        "click": 370,
+        "click_extra": 1510,
+        "click_extra.config": 1010,
+        "yaml": 240,
+    }
+
+
+def test_imports_budget(invoke):
+    result = invoke(bench, "imports", "--runs", "1", "--budget", "100000")
+    assert result.exit_code == 0
+    assert "click_extra" in result.stdout
+    assert not result.stderr
+
+    result = invoke(bench, "imports", "--runs", "1", "--budget", "0")
+    assert result.exit_code == 1
+    assert "Error: click_extra import takes " in result.stderr
+    assert "ms, over 0.0 ms.\n" in result.stderr
+
+
+def test_imports_baseline(invoke):
+    baseline = Path("baseline.json").resolve()
+
+    result = invoke(
+        bench,
+        "imports",
+        "--runs",
+        "1",
+        "--baseline",
+        str(baseline),
+        "--save-baseline",
+    )
+    assert result.exit_code == 0
+    assert f"Baseline saved to {baseline}\n" in result.stdout
+    content = json.loads(baseline.read_text())
+    assert content["module"] == "click_extra"
+    assert content["timings"]["click_extra"] > 0
+
+    # Fake a baseline that can't be beaten.
+    content["timings"]["click_extra"] = 1
+    baseline.write_text(json.dumps(content))
+    result = invoke(bench, "imports", "--runs", "1", "--baseline", str(baseline))
+    assert result.exit_code == 1
+    assert "regressing by more than 10.0% over the 0.0 ms baseline." in result.stderr
+
+
+def test_save_baseline_requires_baseline(invoke):
+    for command in ("imports", "invoke", "config"):
+        result = invoke(bench, command, "--save-baseline")
+        assert result.exit_code == 2
+        assert not result.stdout
+        assert "Error: --save-baseline requires --baseline.\n" in result.stderr
+
+
+def test_invoke(invoke):
+    result = invoke(bench, "invoke", "--runs", "1", color=False)
+    assert result.exit_code == 0
+    assert not result.stderr
+    for args in INVOKE_CASES:
+        assert f"demo {' '.join(args)} " in result.stdout
+
+
+def test_config_fixture():
+    for conf_format in Formats:
+        content = config_fixture(conf_format, 3)
+        loader = getattr(ConfigOption(), ConfigOption.parsers[conf_format])
+        assert loader(content) == {
+            "demo": {"key_0": "value 0", "key_1": "value 1", "key_2": "value 2"},
+        }
+
+
+def test_config(invoke):
+    result = invoke(bench, "config", "--entries", "10", "--runs", "1", color=False)
+    assert result.exit_code == 0
+    assert not result.stderr
+    for conf_format in Formats:
+        assert f" {conf_format.name} " in result.stdout
+
+
+def test_yaml(invoke):
+    result = invoke(bench, "yaml", "--entries", "10", "--runs", "1", color=False)
+    assert result.exit_code == 0
+    assert not result.stderr
+    assert " SafeLoader " in result.stdout
+    assert " FullLoader " in result.stdout
+
+
+def test_snapshot(invoke):
+    result = invoke(bench, "snapshot", "--entries", "10", "--runs", "1", color=False)
+    assert result.exit_code == 0
+    assert not result.stderr
+    assert " Without snapshot (ms) " in result.stdout
+    for conf_format in ("TOML", "YAML", "JSON", "INI", "XML"):
+        assert f" {conf_format} " in result.stdout
+
+
+def test_trees(invoke):
+    result = invoke(bench, "trees", "--runs", "1", color=False)
+    assert result.exit_code == 0
+    assert not result.stderr
+    for size in (10, 100, 1000, 10000):
+        assert f" {size} " in result.stdout
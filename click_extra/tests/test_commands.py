@@ -21,6 +21,8 @@ from __future__ import annotations
 import ast
 import inspect
 import re
+import subprocess
+import sys
 from pathlib import Path
 from textwrap import dedent
 
@@ -29,7 +31,19 @@ import cloup
 import pytest
 from pytest_cases import fixture
 
-from click_extra import echo, option, option_group
+from click_extra import (
+    ColorOption,
+    ConfigOption,
+    HelpOption,
+    echo,
+    option,
+    option_group,
+)
+from click_extra.commands import (
+    ExtraLazyGroup,
+    default_extra_params,
+    search_fast_path,
+)
 from click_extra.decorators import extra_command, extra_group
 
 from .conftest import (
@@ -86,6 +100,72 @@ def test_module_root_declarations():
     assert expected_members == click_extra_members
 
 
+def test_lazy_root_import():
+    """A bare ``import click_extra`` must not load any heavy dependency.
+
+    Runs in a fresh interpreter, as the test session has already imported everything.
+    """
+    heavy_modules = (
+        "boltons.ecoutils",
+        "commentjson",
+        "pygments",
+        "requests",
+        "tabulate",
+        "unittest.mock",
+        "xmltodict",
+        "yaml",
+    )
+    code = dedent(
+        f"""
+        import sys
+        import click_extra
+        print(sorted(m for m in {heavy_modules!r} if m in sys.modules))
+        """,
+    )
+    result = subprocess.run(
+        (sys.executable, "-c", code),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout == "[]\n"
+
+
+def test_lazy_members():
+    import click_extra
+    from click_extra import commands, decorators
+
+    assert click_extra.ExtraCommand is commands.ExtraCommand
+    # Click's and Cloup's decorators are overridden by our own.
+    for name in ("command", "group", "help_option", "version_option"):
+        assert getattr(click_extra, name) is getattr(decorators, name)
+    assert set(click_extra.__all__).issubset(dir(click_extra))
+
+    with pytest.raises(AttributeError):
+        click_extra.unknown_member  # noqa: B018
+
+
+def test_lazy_submodules():
+    """Submodules are reachable after a bare import, before anything imports them."""
+    code = dedent(
+        """
+        import click_extra
+        print(click_extra.config.ConfigOption.__module__)
+        print(click_extra.decorators.extra_command.__module__)
+        print(click_extra.platforms.__name__)
+        """,
+    )
+    result = subprocess.run(
+        (sys.executable, "-c", code),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout == (
+        "click_extra.config\nclick_extra.decorators\nclick_extra.platforms\n"
+    )
+
+
 @fixture
 def all_command_cli():
     """A CLI that is mixing all variations and flavors of subcommands."""
@@ -260,6 +340,138 @@ def test_integrated_version_value(invoke, all_command_cli):
     assert result.stdout == "command-cli1, version 2021.10.08\n"
 
 
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    (
+        (("--help",), HelpOption.fast_path_dependencies),
+        (("default-subcommand", "-h"), HelpOption.fast_path_dependencies),
+        (("click-extra-subcommand", "--version"), (ColorOption,)),
+        (("default-subcommand",), None),
+        # Option values are not mistaken for flags.
+        (("--config", "--help", "default-subcommand"), None),
+        (("unknown-subcommand", "--help"), None),
+    ),
+)
+def test_search_fast_path(all_command_cli, args, expected):
+    assert search_fast_path(all_command_cli, "command-cli1", list(args)) == expected
+
+
+def test_fast_path_skips_config(invoke, monkeypatch):
+    loaded = []
+
+    def load_conf(self, ctx, param, path_pattern):
+        loaded.append(path_pattern)
+
+    monkeypatch.setattr(ConfigOption, "load_conf", load_conf)
+
+    @extra_group
+    def cli():
+        echo("Run cli...")
+
+    @extra_command(version="1.2.3")
+    def subcommand():
+        echo("Run subcommand...")
+
+    cli.add_command(subcommand)
+
+    result = invoke(cli, "subcommand", "--version", color=False)
+    assert result.exit_code == 0
+    assert result.stdout == "Run cli...\ncli, version 1.2.3\n"
+    assert not loaded
+
+    # Options explicitly set on the command line are still processed.
+    result = invoke(cli, "--config", "foo.toml", "subcommand", "--version")
+    assert result.exit_code == 0
+    assert loaded == ["foo.toml"]
+
+    # The help screen depends on the configuration to render defaults.
+    result = invoke(cli, "subcommand", "--help")
+    assert result.exit_code == 0
+    assert len(loaded) == 2
+
+    # Both the group and the subcommand load their own configuration.
+    result = invoke(cli, "subcommand")
+    assert result.exit_code == 0
+    assert len(loaded) == 4
+
+    # Informational options of the group itself are left to Click, which processes
+    # them first, so arguments are not pre-parsed.
+    searched = []
+    monkeypatch.setattr(
+        "click_extra.commands.search_fast_path",
+        lambda *args: searched.append(args),
+    )
+    for args in (("--help", "subcommand"), ("--version",)):
+        result = invoke(cli, args)
+        assert result.exit_code == 0
+    assert not searched
+    assert len(loaded) == 4
+
+
+def test_fast_path_help_defaults_from_config(invoke, create_config):
+    conf_path = create_config(
+        "cli.toml",
+        """
+        [cli.subcommand]
+        name = "bar"
+        """,
+    )
+
+    # The configuration file is not set on the command line, but found by default.
+    @extra_group(params=[ConfigOption(default=str(conf_path))])
+    def cli():
+        pass
+
+    @cli.command()
+    @option("--name", default="foo", show_default=True)
+    def subcommand(name):
+        echo(f"name is {name!r}")
+
+    result = invoke(cli, "subcommand", color=False)
+    assert result.exit_code == 0
+    assert result.stdout == "name is 'bar'\n"
+
+    result = invoke(cli, "subcommand", "--help", color=False)
+    assert result.exit_code == 0
+    assert "[default: bar]" in result.stdout
+    assert "[default: foo]" not in result.stdout
+
+
+def test_default_extra_params_copies():
+    first = default_extra_params()
+    second = default_extra_params()
+    assert [type(p) for p in first] == [type(p) for p in second]
+
+    for param_a, param_b in zip(first, second):
+        assert param_a is not param_b
+        assert param_a.opts == param_b.opts
+        assert param_a.opts is not param_b.opts
+        # Callbacks implemented as methods are bound to their own option.
+        callback = param_a.callback
+        if hasattr(callback, "__self__"):
+            assert callback.__self__ is param_a
+
+    # The dynamic default of the config option is bound to its own copy.
+    config_a = first[2]
+    assert isinstance(config_a, ConfigOption)
+    assert config_a.default.__self__ is config_a
+
+    # Customizing the options of a command does not leak to the others.
+    @extra_command(version="1.2.3")
+    def foo():
+        pass
+
+    @extra_command
+    def bar():
+        pass
+
+    foo_version = {p.name: p for p in foo.params}["version"]
+    bar_version = {p.name: p for p in bar.params}["version"]
+    assert foo_version.version == "1.2.3"
+    assert "version" not in bar_version.__dict__
+    assert foo_version.envvar != bar_version.envvar
+
+
 def test_no_option_leaks_between_subcommands(invoke):
     """As reported in https://github.com/kdeldycke/click-extra/issues/489."""
 
@@ -421,3 +633,133 @@ def test_show_envvar_parameter(invoke, cmd_decorator, ctx_settings, expected_hel
     assert result.exit_code == 0
     assert not result.stderr
     assert expected_help in result.stdout
+
+
+@pytest.fixture()
+def lazy_cli(tmp_path, monkeypatch):
+    """A lazy group whose subcommands are implemented in a temporary package."""
+    package = tmp_path / "lazy_cli_pkg"
+    package.mkdir()
+    package.joinpath("__init__.py").write_text("")
+    for name in ("backup", "restore"):
+        package.joinpath(f"{name}.py").write_text(
+            dedent(
+                f"""\
+                from click_extra import echo, option
+                from click_extra.commands import ExtraCommand
+                import click
+
+                @click.command(cls=ExtraCommand)
+                @option("--target", default="default-target")
+                @option("--retries", type=int, default=1)
+                def {name}(target, retries):
+                    \"\"\"Long help of {name}.\"\"\"
+                    echo(f"Run {name} to {{target}}")
+                """,
+            ),
+        )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    @extra_group(
+        cls=ExtraLazyGroup,
+        lazy_subcommands={
+            "backup": "lazy_cli_pkg.backup:backup",
+            "restore": "lazy_cli_pkg.restore:restore",
+        },
+        lazy_short_help={"backup": "Backup things."},
+    )
+    def lazy_cli():
+        echo("Run lazy CLI...")
+
+    yield lazy_cli
+
+    for module_id in list(sys.modules):
+        if module_id.startswith("lazy_cli_pkg"):
+            del sys.modules[module_id]
+
+
+def test_lazy_group_help(invoke, lazy_cli):
+    result = invoke(lazy_cli, "--help", color=False)
+    assert result.exit_code == 0
+    assert "\nCommands:\n  backup   Backup things.\n  restore\n" in result.stdout
+    assert "lazy_cli_pkg.backup" not in sys.modules
+    assert "lazy_cli_pkg.restore" not in sys.modules
+
+    result = invoke(lazy_cli, "--show-params", color=False)
+    assert result.exit_code == 0
+    assert "lazy-cli.config" in result.stdout
+    assert "lazy_cli_pkg.backup" not in sys.modules
+
+
+def test_lazy_group_invoke(invoke, lazy_cli, create_config):
+    conf_path = create_config(
+        "conf.toml",
+        """
+        [lazy-cli.backup]
+        target = "config-target"
+        """,
+    )
+    result = invoke(lazy_cli, "--config", str(conf_path), "backup", color=False)
+    assert result.exit_code == 0
+    assert result.stdout == "Run lazy CLI...\nRun backup to config-target\n"
+    assert "lazy_cli_pkg.backup" in sys.modules
+    assert "lazy_cli_pkg.restore" not in sys.modules
+
+    # Loaded subcommands are listed with their own help.
+    result = invoke(lazy_cli, "--help", color=False)
+    assert "\n  backup   Long help of backup.\n" in result.stdout
+
+
+@pytest.mark.parametrize("strict", (True, False))
+def test_lazy_group_config_validation(invoke, lazy_cli, create_config, strict):
+    conf_path = create_config(
+        "conf.toml",
+        """
+        [lazy-cli.backup]
+        retries = "many"
+        """,
+    )
+    config_option = next(p for p in lazy_cli.params if isinstance(p, ConfigOption))
+    config_option.strict = strict
+
+    result = invoke(lazy_cli, "--config", str(conf_path), "restore", color=False)
+    if strict:
+        # The section of the lazy subcommand is validated before running anything.
+        assert result.exit_code == 2
+        assert (
+            "lazy-cli.backup.retries: 'many' is not a valid integer." in result.stderr
+        )
+        assert not result.stdout
+        assert "lazy_cli_pkg.backup" in sys.modules
+    else:
+        assert result.exit_code == 0
+        assert result.stdout == "Run lazy CLI...\nRun restore to default-target\n"
+        assert "lazy_cli_pkg.backup" not in sys.modules
+
+    # Parameter trees include the subcommands imported since they were built, while
+    # the unloaded one still accepts any value.
+    loaded, unloaded = ("backup", "restore") if strict else ("restore", "backup")
+    template = config_option.params_template["lazy-cli"]
+    assert template[loaded] == {"target": None, "retries": None}
+    assert template[unloaded] is None
+    assert config_option.params_types["lazy-cli"][loaded]["retries"] is int
+
+
+def test_lazy_group_completion(lazy_cli):
+    ctx = lazy_cli.context_class(lazy_cli, info_name="lazy-cli")
+    items = lazy_cli.shell_complete(ctx, "")
+    assert [(i.value, i.help) for i in items][:2] == [
+        ("backup", "Backup things."),
+        ("restore", ""),
+    ]
+    assert "lazy_cli_pkg.backup" not in sys.modules
+
+
+def test_lazy_group_errors():
+    with pytest.raises(ValueError, match="is not of the module:attribute form"):
+        ExtraLazyGroup(lazy_subcommands={"foo": "click_extra.commands"})
+
+    group = ExtraLazyGroup(lazy_subcommands={"foo": "click_extra.commands:Path"})
+    ctx = group.context_class(group)
+    with pytest.raises(TypeError, match="click_extra.commands:Path is not a command"):
+        group.get_command(ctx, "foo")
@@ -16,8 +16,16 @@
 
 from __future__ import annotations
 
+import logging
+import marshal
+import os
+import pickle
 import re
+import subprocess
+import sys
+import threading
 from pathlib import Path
+from textwrap import dedent
 
 import click
 import pytest
@@ -43,9 +51,15 @@ from click_extra import (
     option,
 )
 from click_extra.colorize import escape_for_help_sceen
-from click_extra.config import ConfigOption
-from click_extra.decorators import config_option, extra_group
-from click_extra.parameters import search_params
+from click_extra.config import (
+    ConfigCacheOption,
+    ConfigOption,
+    Formats,
+    http_session,
+    search_files,
+)
+from click_extra.decorators import config_cache_option, config_option, extra_group
+from click_extra.parameters import ParamStructure, search_params
 
 from .conftest import (
     default_debug_uncolored_log_end,
@@ -275,6 +289,31 @@ def test_conf_not_exist(invoke, simple_config_cli):
     assert "critical: No configuration file found.\n" in result.stderr
 
 
+def test_conf_not_exist_fresh_process(tmp_path):
+    """The root logger is set up before eager options log anything, even in a
+    process in which no CLI was invoked before."""
+    conf_path = tmp_path / "dummy.toml"
+    code = dedent(
+        f"""
+        from click_extra import extra_command
+
+        @extra_command
+        def cli():
+            pass
+
+        cli(["--config", {str(conf_path)!r}])
+        """,
+    )
+    result = subprocess.run(
+        (sys.executable, "-c", code),
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 2
+    assert not result.stdout
+    assert "critical: No configuration file found.\n" in result.stderr
+
+
 def test_conf_not_file(invoke, simple_config_cli):
     conf_path = Path().parent
     result = invoke(
@@ -580,3 +619,928 @@ def test_conf_file_overrided_by_cli_param(
             "dummy_flag = False\nmy_list = ('super', 'wow')\nint_parameter = 15\n"
         )
         assert result.stderr == f"Load configuration matching {conf_path.resolve()}\n"
+
+
+def test_lazy_parser_backends():
+    """Parsing backends are only imported when their format is tried.
+
+    Runs in a fresh interpreter, as the test session has already imported everything.
+    """
+    code = dedent(
+        """
+        import sys
+        from click_extra.config import ConfigOption, Formats
+
+        conf = ConfigOption(formats=Formats.TOML).parse_conf("[cli]\\nflag = true")
+        assert conf == {"cli": {"flag": True}}, conf
+        conf = ConfigOption(formats=Formats.JSON).parse_conf('{"cli": {}}  // Empty')
+        assert conf == {"cli": {}}, conf
+        print(
+            sorted(
+                m
+                for m in ("commentjson", "requests", "xmltodict", "yaml")
+                if m in sys.modules
+            )
+        )
+        """,
+    )
+    result = subprocess.run(
+        (sys.executable, "-c", code),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout == "[]\n"
+
+
+@pytest.mark.parametrize("conf_format", tuple(Formats))
+def test_parser_registry(conf_format):
+    assert callable(getattr(ConfigOption(), ConfigOption.parsers[conf_format]))
+
+
+@pytest.mark.parametrize(
+    ("formats", "content", "location", "expected"),
+    (
+        (tuple(Formats), "a = 1", "conf.toml", [Formats.TOML]),
+        (tuple(Formats), "a = 1", "/remote/conf.YML", [Formats.YAML]),
+        (tuple(Formats), "a = 1", "C:\\Users\\conf.xml", [Formats.XML]),
+        # Unknown extensions and extension-less locations fall back to all formats.
+        (tuple(Formats), "a = 1", "conf.cfg", list(Formats)),
+        (tuple(Formats), "a = 1", None, list(Formats)),
+        # Content sniffing promotes the likeliest format.
+        (
+            tuple(Formats),
+            "\n  <cli></cli>",
+            None,
+            [Formats.XML, Formats.TOML, Formats.YAML, Formats.JSON, Formats.INI],
+        ),
+        (
+            tuple(Formats),
+            '{"cli": {}}',
+            "https://example.com/config",
+            [Formats.JSON, Formats.TOML, Formats.YAML, Formats.INI, Formats.XML],
+        ),
+        # Only formats supported by the option are considered.
+        ((Formats.TOML, Formats.YAML), "<cli></cli>", "conf.xml", list(Formats)[:2]),
+    ),
+)
+def test_candidate_formats(formats, content, location, expected):
+    assert ConfigOption(formats=formats).candidate_formats(content, location) == expected
+
+
+def test_parsed_config_cache(invoke, create_config, tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "click_extra.config.get_cache_dir",
+        lambda app_name: str(tmp_path / app_name),
+    )
+    cache_dir = tmp_path / "cache-cli" / "config"
+
+    parsed = []
+    original_parse_conf = ConfigOption.parse_conf
+
+    def parse_conf(self, conf_content, location=None):
+        parsed.append(location)
+        return original_parse_conf(self, conf_content, location)
+
+    monkeypatch.setattr(ConfigOption, "parse_conf", parse_conf)
+
+    @click.command
+    @option("--int-param", type=int, default=10)
+    @config_option
+    @config_cache_option(max_size=10_000)
+    def cache_cli(int_param):
+        echo(f"int_param = {int_param}")
+
+    conf_path = create_config("cache.yaml", "cache-cli:\n  int_param: 3\n")
+
+    def run(*args):
+        result = invoke(cache_cli, "--config", str(conf_path), *args)
+        assert result.exit_code == 0
+        return result.stdout
+
+    # First run parses the file and caches it.
+    assert run() == "int_param = 3\n"
+    assert len(parsed) == 1
+    entries = list(cache_dir.glob("*.pickle"))
+    assert len(entries) == 1
+
+    # Second run is served from the cache.
+    assert run() == "int_param = 3\n"
+    assert len(parsed) == 1
+
+    # The cache can be bypassed, even after the --config option.
+    assert run("--no-config-cache") == "int_param = 3\n"
+    assert len(parsed) == 2
+
+    # Editing the file invalidates its entry.
+    conf_path.write_text("cache-cli:\n  int_param: 42\n")
+    assert run() == "int_param = 42\n"
+    assert len(parsed) == 3
+    assert len(list(cache_dir.glob("*.pickle"))) == 2
+
+    # Corrupted entries are ignored.
+    for entry in cache_dir.glob("*.pickle"):
+        entry.write_bytes(b"garbage")
+    assert run() == "int_param = 42\n"
+    assert len(parsed) == 4
+
+    # Entries are specific to the settings of the configuration option.
+    conf_option = next(p for p in cache_cli.params if isinstance(p, ConfigOption))
+    monkeypatch.setattr(conf_option, "yaml_safe", False)
+    assert run() == "int_param = 42\n"
+    assert len(parsed) == 5
+    monkeypatch.setattr(conf_option, "strict", True)
+    assert run() == "int_param = 42\n"
+    assert len(parsed) == 6
+    assert run() == "int_param = 42\n"
+    assert len(parsed) == 6
+
+
+def test_parsed_config_cache_eviction(tmp_path):
+    conf = {"cli": {"payload": "x" * 50}}
+    size = len(pickle.dumps(conf, protocol=pickle.HIGHEST_PROTOCOL))
+    cache_option = ConfigCacheOption(max_size=size * 3)
+    entries = [tmp_path / f"{index}.pickle" for index in range(3)]
+    for index, entry in enumerate(entries):
+        cache_option.save(entry, conf)
+        # Ensure a deterministic order of use, whatever the resolution of mtimes.
+        os.utime(entry, ns=(index * 1_000_000_000, index * 1_000_000_000))
+    assert cache_option.load(entries[0]) == conf
+    assert entries[0].stat().st_mtime_ns > entries[2].stat().st_mtime_ns
+
+    # The new entry exceeds the size limit, so the least recently used goes away.
+    cache_option.save(tmp_path / "new.pickle", conf)
+    assert set(tmp_path.glob("*.pickle")) == {
+        entries[0],
+        entries[2],
+        tmp_path / "new.pickle",
+    }
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_yaml_loader():
+    import yaml
+
+    conf_option = ConfigOption()
+    if yaml.__with_libyaml__:
+        assert conf_option.yaml_loader is yaml.CSafeLoader
+    else:
+        assert conf_option.yaml_loader is yaml.SafeLoader
+
+    content = "cli:\n  my_tuple: !!python/tuple [1, 2]\n"
+    with pytest.raises(yaml.constructor.ConstructorError):
+        conf_option.load_yaml_config(content)
+
+    class FullYAMLConfigOption(ConfigOption):
+        yaml_safe = False
+
+    assert FullYAMLConfigOption().load_yaml_config(content) == {
+        "cli": {"my_tuple": (1, 2)},
+    }
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    (
+        ('{"cli": {"flag": true}}', {"cli": {"flag": True}}),
+        (
+            '{\n  # Comment\n  "cli": {"url": "https://a.b/#c", // Comment\n'
+            '  "path": "C:\\\\dir\\\\", "quote": "\\"//\\""}\n}',
+            {"cli": {"url": "https://a.b/#c", "path": "C:\\dir\\", "quote": '"//"'}},
+        ),
+    ),
+)
+def test_load_json_config(content, expected):
+    assert ConfigOption().load_json_config(content) == expected
+
+
+def test_load_json_config_fallback():
+    """Content rejected by the standard library is parsed by ``commentjson``."""
+    from lark.exceptions import LarkError
+
+    # Trailing commas are only tolerated by commentjson.
+    assert ConfigOption().load_json_config('{"cli": {"flag": true,}}') == {
+        "cli": {"flag": True},
+    }
+
+    with pytest.raises(LarkError):
+        ConfigOption().load_json_config('{"cli": ')
+
+
+def test_remote_config_cache(invoke, httpserver, tmp_path, monkeypatch, caplog):
+    monkeypatch.setattr(
+        "click_extra.config.get_cache_dir",
+        lambda app_name: str(tmp_path / app_name),
+    )
+    import requests
+    from werkzeug import Response
+
+    content = {"value": 3}
+
+    def handler(request):
+        if content["value"] is None:
+            return Response(status=503)
+        etag = f'"v{content["value"]}"'
+        if request.headers.get("If-None-Match") == etag:
+            return Response(status=304)
+        return Response(
+            f"remote-cli:\n  int_param: {content['value']}\n",
+            headers={"ETag": etag},
+        )
+
+    httpserver.expect_request("/config.yaml").respond_with_handler(handler)
+    url = httpserver.url_for("/config.yaml")
+
+    def run(ttl=0):
+        @click.command
+        @option("--int-param", type=int, default=10)
+        @config_option(default=url, remote_cache=True, remote_ttl=ttl)
+        def remote_cli(int_param):
+            echo(f"int_param = {int_param}")
+
+        result = invoke(remote_cli, color=False)
+        assert result.exit_code == 0
+        return result
+
+    # First download is cached.
+    assert run().stdout == "int_param = 3\n"
+    assert len(list((tmp_path / "remote-cli" / "remote").glob("*.json"))) == 1
+    request, response = httpserver.log[-1]
+    assert "If-None-Match" not in request.headers
+    assert response.status_code == 200
+
+    # Cached copy is revalidated.
+    assert run().stdout == "int_param = 3\n"
+    request, response = httpserver.log[-1]
+    assert request.headers["If-None-Match"] == '"v3"'
+    assert response.status_code == 304
+
+    # New content on the server is fetched.
+    content["value"] = 4
+    assert run().stdout == "int_param = 4\n"
+    assert httpserver.log[-1][1].status_code == 200
+
+    # No request is made while the cached copy is fresh.
+    requests_count = len(httpserver.log)
+    content["value"] = 5
+    assert run(ttl=60).stdout == "int_param = 4\n"
+    assert len(httpserver.log) == requests_count
+
+    # Cached copy is used if the server fails.
+    content["value"] = None
+    assert run().stdout == "int_param = 4\n"
+    assert f"Can't download {url}: SERVICE UNAVAILABLE" in caplog.text
+    assert f"Use cached copy of {url}" in caplog.text
+
+    # Or is unreachable.
+    caplog.clear()
+
+    def unreachable(*args, **kwargs):
+        assert kwargs["timeout"] == 10
+        raise requests.ConnectionError("Connection refused")
+
+    monkeypatch.setattr(requests.Session, "get", unreachable)
+    assert run().stdout == "int_param = 4\n"
+    assert f"Can't download {url}: Connection refused" in caplog.text
+    assert f"Use cached copy of {url}" in caplog.text
+
+
+def test_multiple_sources(invoke, create_config, httpserver, monkeypatch, caplog):
+    system_conf = create_config(
+        "system.toml",
+        "[multi-cli]\nint_param = 1\nflag = true\n\n[multi-cli.sub]\nname = 'a'\n",
+    )
+    user_conf = create_config("user.yaml", "multi-cli:\n  int_param: 2\n")
+    # Only the first parseable file matching a pattern is read.
+    create_config("user.yml", "multi-cli:\n  int_param: 3\n")
+    user_pattern = f"{user_conf.parent}/user.{{yaml,yml}}"
+    httpserver.expect_request("/project.json").respond_with_data(
+        '{"multi-cli": {"sub": {"name": "b"}}}',
+    )
+    remote_conf = httpserver.url_for("/project.json")
+    missing_conf = "/missing.ini"
+    sources = (system_conf, user_pattern, remote_conf, missing_conf)
+
+    # Sources are read concurrently: each thread waits for all the others.
+    barrier = threading.Barrier(len(sources), timeout=5)
+    original_search_and_read_conf = ConfigOption.search_and_read_conf
+    sessions = set()
+    read = []
+
+    def search_and_read_conf(self, pattern, ctx=None):
+        barrier.wait()
+        # Worker threads never enter the context.
+        assert click.get_current_context(silent=True) is None
+        sessions.add(id(http_session()))
+        for location, content in original_search_and_read_conf(self, pattern, ctx):
+            read.append(location)
+            yield location, content
+
+    monkeypatch.setattr(ConfigOption, "search_and_read_conf", search_and_read_conf)
+
+    @click.group(
+        invoke_without_command=True,
+        context_settings={"show_default": True},
+    )
+    @option("--int-param", type=int, default=10)
+    @option("--flag/--no-flag", default=False)
+    @config_option(multiple=True)
+    def multi_cli(int_param, flag):
+        echo(f"int_param = {int_param}, flag = {flag}")
+
+    @multi_cli.command()
+    @option("--name", default="default")
+    def sub(name):
+        echo(f"name = {name}")
+
+    args = []
+    for conf in sources:
+        args.extend(("--config", str(conf)))
+    with caplog.at_level(logging.DEBUG, logger="click_extra"):
+        result = invoke(multi_cli, *args, "sub", color=False)
+    assert result.exit_code == 0
+    # Later sources take precedence.
+    assert result.stdout == "int_param = 2, flag = True\nname = b\n"
+    assert result.stderr.startswith(
+        "".join(f"Load configuration matching {conf}\n" for conf in sources),
+    )
+    assert re.search(rf"Read {re.escape(user_pattern)} in \S+ seconds", caplog.text)
+    assert f"Nothing found at {missing_conf} in " in caplog.text
+    # Each thread downloads with its own HTTP session.
+    assert len(sessions) == len(sources)
+    assert sorted(read) == sorted((str(system_conf), str(user_conf), remote_conf))
+
+    # Default pattern is rendered in help screen.
+    result = invoke(multi_cli, "--help", color=False)
+    assert result.exit_code == 0
+    assert "*.{toml,yaml,yml,json,ini,xml}]" in result.stdout
+
+
+def test_search_files(tmp_path, monkeypatch, caplog):
+    files = ("a.toml", "B.TOML", "c.yaml", ".d/e.toml", "f/g/h.toml", "f/g/i/j.toml")
+    for path in files:
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).touch()
+    # A symlink loop.
+    (tmp_path / "f" / "g" / "loop").symlink_to(tmp_path / "f")
+
+    root = tmp_path.as_posix()
+    assert list(search_files(f"{root}/*.{{toml,yaml}}", 10, 100)) == [
+        f"{root}/B.TOML",
+        f"{root}/a.toml",
+        f"{root}/c.yaml",
+    ]
+    # Files are found before the content of sub-folders, and the loop is not followed.
+    assert list(search_files(f"{root}/**/*.toml", 10, 100)) == [
+        f"{root}/B.TOML",
+        f"{root}/a.toml",
+        f"{root}/.d/e.toml",
+        f"{root}/f/g/h.toml",
+        f"{root}/f/g/i/j.toml",
+    ]
+    assert list(search_files(f"{root}/**/*.toml", 2, 100)) == [
+        f"{root}/B.TOML",
+        f"{root}/a.toml",
+        f"{root}/.d/e.toml",
+        f"{root}/f/g/h.toml",
+    ]
+    assert list(search_files(f"{root}/a.toml", 0, 0)) == [f"{root}/a.toml"]
+    assert list(search_files(f"{root}/missing/*.toml", 10, 100)) == []
+
+    # The search is abandoned after too many files are checked, matching or not.
+    assert list(search_files(f"{root}/**/*.toml", 10, 3)) == [
+        f"{root}/B.TOML",
+        f"{root}/a.toml",
+    ]
+    assert "more than 3 files checked" in caplog.text
+
+    # Folders are only listed again after a change.
+    scanned = []
+    scandir = os.scandir
+
+    def tracked_scandir(path):
+        scanned.append(path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", tracked_scandir)
+    assert next(search_files(f"{root}/*.toml", 10, 100)) == f"{root}/B.TOML"
+    assert not scanned
+    (tmp_path / "0.toml").touch()
+    assert next(search_files(f"{root}/*.toml", 10, 100)) == f"{root}/0.toml"
+    assert scanned == [f"{root}/"]
+
+
+def test_repeated_invocations(create_config):
+    """Configuration of one invocation must not leak into the next ones."""
+
+    @click.group(invoke_without_command=True)
+    @option("--int-param", type=int, default=10)
+    @option("--str-param", default="default")
+    @config_option
+    def config_cli5(int_param, str_param):
+        return int_param, str_param
+
+    @config_cli5.command
+    @option("--flag/--no-flag")
+    def subcommand(flag):
+        pass
+
+    full_conf = create_config(
+        "full.toml",
+        """
+        [config-cli5]
+        int_param = 3
+        str_param = "custom"
+
+        [config-cli5.subcommand]
+        flag = true
+        """,
+    )
+    partial_conf = create_config("partial.toml", "[config-cli5]\nint_param = 5")
+    unrelated_conf = create_config("unrelated.toml", "[another-cli]\nint_param = 7")
+
+    for _ in range(3):
+        for conf_path, expected in (
+            (full_conf, (3, "custom")),
+            (partial_conf, (5, "default")),
+            (unrelated_conf, (10, "default")),
+        ):
+            args = ["--config", str(conf_path)]
+            assert config_cli5.main(args, standalone_mode=False) == expected
+
+    config_option_obj = search_params(config_cli5.params, ConfigOption)
+    template = {
+        "config-cli5": {
+            "int_param": None,
+            "str_param": None,
+            "subcommand": {"flag": None},
+        },
+    }
+    assert config_option_obj.params_template == template
+    with pytest.raises(TypeError):
+        config_option_obj.params_template["config-cli5"]["int_param"] = 1
+
+
+@pytest.mark.parametrize(
+    ("filename", "conf_file"),
+    (
+        (
+            "typed.xml",
+            """
+            <config-cli6>
+                <int_param> 3 </int_param>
+                <float_param>1.5</float_param>
+                <flag>yes</flag>
+                <str_param>42</str_param>
+                <my_list>pip</my_list>
+                <my_list>npm</my_list>
+            </config-cli6>
+            """,
+        ),
+        (
+            "typed.ini",
+            """
+            [config-cli6]
+            int_param = 3
+            float_param = 1.5
+            flag = yes
+            str_param = 42
+            my_list = ["pip", "npm"]
+            """,
+        ),
+        (
+            "typed.yaml",
+            """
+            config-cli6:
+              int_param: "3"
+              float_param: 1.5
+              flag: true
+              str_param: 42
+              my_list: [pip, npm]
+            """,
+        ),
+        # Integral floats and 0/1 integers are accepted for integers and booleans.
+        (
+            "numbers.yaml",
+            """
+            config-cli6:
+              int_param: 3.0
+              float_param: 1.5
+              flag: 1
+              str_param: 42
+              my_list: [pip, npm]
+            """,
+        ),
+        (
+            "numbers.json",
+            """
+            {
+                "config-cli6": {
+                    "int_param": 3.0,
+                    "float_param": 1.5,
+                    "flag": 1,
+                    "str_param": 42,
+                    "my_list": ["pip", "npm"]
+                }
+            }
+            """,
+        ),
+    ),
+)
+def test_conf_conversion(invoke, create_config, filename, conf_file):
+    @click.command
+    @option("--int-param", type=int)
+    @option("--float-param", type=float)
+    @option("--flag/--no-flag")
+    @option("--str-param")
+    @option("--my-list", multiple=True)
+    @config_option
+    @click.pass_context
+    def config_cli6(ctx, int_param, float_param, flag, str_param, my_list):
+        echo(repr(ctx.default_map))
+
+    conf_path = create_config(filename, conf_file)
+    result = invoke(config_cli6, "--config", str(conf_path), color=False)
+
+    assert result.exit_code == 0
+    assert result.stdout == (
+        "{'int_param': 3, 'float_param': 1.5, 'flag': True, 'str_param': '42', "
+        "'my_list': ['pip', 'npm']}\n"
+    )
+
+
+def test_conf_conversion_errors(invoke, create_config):
+    @click.command
+    @option("--int-param", type=int)
+    @option("--float-param", type=float)
+    @option("--flag/--no-flag")
+    @config_option
+    def config_cli7(int_param, float_param, flag):
+        echo("Works!")
+
+    conf_file = """
+        [config-cli7]
+        int_param = "three"
+        float_param = [1.5]
+        flag = true
+        """
+    conf_path = create_config("invalid.toml", conf_file)
+    result = invoke(config_cli7, "--config", str(conf_path), color=False)
+
+    assert result.exit_code == 2
+    assert not result.stdout
+    assert result.stderr.endswith(
+        "Error: Invalid value for '--config' / '-C': "
+        "config-cli7.int_param: 'three' is not a valid integer.\n"
+        "config-cli7.float_param: [1.5] is not a valid float.\n",
+    )
+
+
+def test_ini_json_values(invoke, create_config, monkeypatch):
+    """Types not natively supported by INI are decoded from JSON strings."""
+    monkeypatch.setattr(ParamStructure, "TYPE_MAP", dict(ParamStructure.TYPE_MAP))
+    monkeypatch.setattr(ParamStructure, "PARAM_TYPE_CONVERTERS", {})
+    monkeypatch.setattr(ParamStructure, "_type_dispatch", {})
+
+    class Mapping(click.ParamType):
+        name = "mapping"
+
+    class Members(click.ParamType):
+        name = "members"
+
+    ParamStructure.register_param_type(Mapping, dict)
+    ParamStructure.register_param_type(Members, set)
+
+    @click.command
+    @option("--mapping", type=Mapping())
+    @option("--members", type=Members())
+    @config_option
+    @click.pass_context
+    def config_cli10(ctx, mapping, members):
+        echo(repr(ctx.default_map))
+
+    conf_file = """
+        [config-cli10]
+        mapping = {"a": 1, "b": [2, 3]}
+        members = ["x", "x"]
+        """
+    conf_path = create_config("json-values.ini", conf_file)
+    result = invoke(config_cli10, "--config", str(conf_path), color=False)
+
+    assert result.exit_code == 0
+    assert result.stdout == "{'mapping': {'a': 1, 'b': [2, 3]}, 'members': {'x'}}\n"
+
+
+def test_custom_param_types(invoke, create_config, monkeypatch):
+    monkeypatch.setattr(ParamStructure, "TYPE_MAP", dict(ParamStructure.TYPE_MAP))
+    monkeypatch.setattr(ParamStructure, "PARAM_TYPE_CONVERTERS", {})
+    monkeypatch.setattr(ParamStructure, "_type_dispatch", {})
+
+    class Upper(click.types.StringParamType):
+        """Subclass of a registered type, resolved through its MRO."""
+
+    class Hexadecimal(click.ParamType):
+        name = "hexadecimal"
+
+        def convert(self, value, param, ctx):
+            return value if isinstance(value, int) else int(value, 16)
+
+    def convert_hex(value):
+        if isinstance(value, int):
+            return value
+        try:
+            return int(value, 16)
+        except (TypeError, ValueError):
+            msg = f"{value!r} is not a valid hexadecimal."
+            raise ValueError(msg) from None
+
+    class Unknown(click.ParamType):
+        name = "unknown"
+
+    ParamStructure.register_param_type(Hexadecimal, int, convert_hex)
+
+    @click.command
+    @option("--upper-param", type=Upper())
+    @option("--hex-param", type=Hexadecimal())
+    @config_option
+    @click.pass_context
+    def config_cli9(ctx, upper_param, hex_param):
+        echo(repr(ctx.default_map))
+
+    conf_file = """
+        [config-cli9]
+        upper_param = 42
+        hex_param = "ff"
+        """
+    conf_path = create_config("custom.toml", conf_file)
+    result = invoke(config_cli9, "--config", str(conf_path), color=False)
+
+    assert result.exit_code == 0
+    assert result.stdout == "{'upper_param': '42', 'hex_param': 255}\n"
+
+    config_option_obj = search_params(config_cli9.params, ConfigOption)
+    assert config_option_obj.params_types == {
+        "config-cli9": {"upper_param": str, "hex_param": int},
+    }
+    assert (ConfigOption, Hexadecimal) in ParamStructure._type_dispatch
+
+    with pytest.raises(ValueError, match="register_param_type"):
+        config_option_obj.dispatch_param_type(Unknown)
+
+
+def test_lazy_subcommand_sections(invoke, create_config, monkeypatch):
+    @click.group
+    @option("--int-param", type=int, default=10)
+    @config_option
+    def config_cli8(int_param):
+        echo(f"int_param is {int_param!r}")
+
+    @config_cli8.command
+    @option("--int-param", type=int, default=20)
+    def good(int_param):
+        echo(f"good.int_param is {int_param!r}")
+
+    @config_cli8.command
+    @option("--int-param", type=int, default=30)
+    def bad(int_param):
+        echo("Not reached.")
+
+    conf_file = """
+        [config-cli8]
+        int_param = 1
+
+        [config-cli8.good]
+        int_param = 2
+
+        [config-cli8.bad]
+        int_param = "not an integer"
+        """
+    conf_path = create_config("lazy.toml", conf_file)
+
+    merged_paths = []
+    merge_conf = ConfigOption.merge_conf
+
+    def tracked_merge_conf(self, user_conf, path=()):
+        merged_paths.append(path)
+        return merge_conf(self, user_conf, path)
+
+    monkeypatch.setattr(ConfigOption, "merge_conf", tracked_merge_conf)
+
+    # The section of the bad subcommand is never looked at.
+    result = invoke(config_cli8, "--config", str(conf_path), "good", color=False)
+    assert result.exit_code == 0
+    assert result.stdout == "int_param is 1\ngood.int_param is 2\n"
+    assert merged_paths == [(), ("config-cli8", "good")]
+
+    result = invoke(config_cli8, "--config", str(conf_path), "bad", color=False)
+    assert result.exit_code == 2
+    assert result.stdout == "int_param is 1\n"
+    assert result.stderr.endswith(
+        "Error: Invalid value for '--config' / '-C': "
+        "config-cli8.bad.int_param: 'not an integer' is not a valid integer.\n",
+    )
+
+
+def test_config_watcher(invoke, create_config, caplog):
+    conf_path = create_config("watched.toml", "[config-cli9]\nint_param = 1")
+    reloads = []
+    reloaded = threading.Event()
+
+    def subscriber(default_map):
+        reloads.append(dict(default_map))
+        reloaded.set()
+
+    @click.command
+    @option("--int-param", type=int, default=10)
+    @config_option
+    @click.pass_context
+    def config_cli9(ctx, int_param):
+        config_option_obj = search_params(ctx.command.params, ConfigOption)
+        watcher = config_option_obj.watch(subscriber, interval=0.01, debounce=0.05)
+
+        conf_path.write_text("[config-cli9]\nint_param = 2\n")
+        assert reloaded.wait(timeout=5)
+        reloaded.clear()
+        assert ctx.default_map == {"int_param": 2}
+
+        # Invalid configuration is reported, and the current one is kept.
+        conf_path.write_text("[config-cli9]\nint_param = 'three'\n")
+        for _ in range(200):
+            if "Can't reload configuration" in caplog.text:
+                break
+            reloaded.wait(timeout=0.05)
+        assert ctx.default_map == {"int_param": 2}
+
+        watcher.stop()
+        assert not watcher.is_alive()
+        echo(f"int_param is {int_param!r}")
+
+    result = invoke(config_cli9, "--config", str(conf_path), color=False)
+    assert result.exit_code == 0, result.exception
+    assert result.stdout == "int_param is 1\n"
+    assert reloads == [{"int_param": 2}]
+    assert (
+        "Can't reload configuration: "
+        "config-cli9.int_param: 'three' is not a valid integer." in caplog.text
+    )
+
+
+def test_config_watcher_subcommand(invoke, create_config):
+    conf_path = create_config(
+        "watched-group.toml",
+        "[config-cli11]\nint_param = 1\n\n[config-cli11.serve]\nport = 1",
+    )
+    reloads = []
+    reloaded = threading.Event()
+
+    def subscriber(default_map):
+        reloads.append(dict(default_map))
+        reloaded.set()
+
+    @click.group
+    @option("--int-param", type=int, default=10)
+    @config_option
+    def config_cli11(int_param):
+        pass
+
+    @config_cli11.command
+    @option("--port", type=int, default=80)
+    @click.pass_context
+    def serve(ctx, port):
+        config_option_obj = search_params(ctx.parent.command.params, ConfigOption)
+        watcher = config_option_obj.watch(subscriber, interval=0.01, debounce=0.05)
+        assert ctx.lookup_default("port") == 1
+
+        conf_path.write_text(
+            "[config-cli11]\nint_param = 2\n\n[config-cli11.serve]\nport = 2",
+        )
+        assert reloaded.wait(timeout=5)
+        watcher.stop()
+
+        # The subcommand gets its own section, not the one of the root command.
+        assert ctx.default_map == {"port": 2}
+        assert ctx.lookup_default("port") == 2
+        echo(f"port is {port!r}")
+
+    result = invoke(config_cli11, "--config", str(conf_path), "serve", color=False)
+    assert result.exit_code == 0, result.exception
+    assert result.stdout == "port is 1\n"
+    assert reloads == [{"port": 2}]
+
+
+def test_config_watcher_context(invoke, create_config, monkeypatch):
+    """The watcher thread reloads without entering the context of the command."""
+    conf_path = create_config("watched-scope.toml", "[config-cli12]\nint_param = 1")
+    reloaded = threading.Event()
+    watcher_contexts = []
+    closed = []
+
+    original_merge_conf = ConfigOption.merge_conf
+
+    def merge_conf(self, *args, **kwargs):
+        if threading.current_thread() is not threading.main_thread():
+            watcher_contexts.append(click.get_current_context(silent=True))
+        return original_merge_conf(self, *args, **kwargs)
+
+    monkeypatch.setattr(ConfigOption, "merge_conf", merge_conf)
+
+    @click.command
+    @option("--int-param", type=int, default=10)
+    @config_option
+    @click.pass_context
+    def config_cli12(ctx, int_param):
+        ctx.call_on_close(lambda: closed.append(True))
+        config_option_obj = search_params(ctx.command.params, ConfigOption)
+        watcher = config_option_obj.watch(
+            lambda default_map: reloaded.set(),
+            interval=0.01,
+            debounce=0.05,
+        )
+        # Reload while the main thread is inside the scope of the context.
+        with ctx.scope(cleanup=False):
+            depth = ctx._depth
+            conf_path.write_text("[config-cli12]\nint_param = 2\n")
+            assert reloaded.wait(timeout=5)
+            assert ctx._depth == depth
+            assert click.get_current_context() is ctx
+        watcher.stop()
+        assert ctx.default_map == {"int_param": 2}
+        echo(f"int_param is {int_param!r}")
+
+    result = invoke(config_cli12, "--config", str(conf_path), color=False)
+    assert result.exit_code == 0, result.exception
+    assert result.stdout == "int_param is 1\n"
+    assert watcher_contexts == [None]
+    # Close callbacks still run when the main scope exits.
+    assert closed == [True]
+
+
+def test_config_snapshot(invoke, create_config, monkeypatch):
+    @click.group
+    @option("--int-param", type=int, default=10)
+    @config_option(snapshot=True)
+    def config_cli10(int_param):
+        echo(f"int_param is {int_param!r}")
+
+    @config_cli10.command
+    @option("--str-param", default="default")
+    def subcommand(str_param):
+        echo(f"str_param is {str_param!r}")
+
+    conf_path = create_config(
+        "compiled.toml",
+        "[config-cli10]\nint_param = '3'\n\n[config-cli10.subcommand]\nstr_param = 4",
+    )
+    snapshot_path = conf_path.with_name("compiled.toml.snapshot")
+    args = ("--config", str(conf_path), "subcommand")
+
+    result = invoke(config_cli10, *args, color=False)
+    assert result.exit_code == 0
+    assert result.stdout == "int_param is 3\nstr_param is '4'\n"
+    assert snapshot_path.is_file()
+
+    # The snapshot is used as-is, without parsing nor merging.
+    def fail(*args, **kwargs):
+        raise AssertionError
+
+    monkeypatch.setattr(ConfigOption, "parse_conf", fail)
+    monkeypatch.setattr(ConfigOption, "merge_conf", fail)
+    result = invoke(config_cli10, *args, color=False)
+    assert result.exit_code == 0
+    assert result.stdout == "int_param is 3\nstr_param is '4'\n"
+    monkeypatch.undo()
+
+    # Changes to the configuration invalidate the snapshot.
+    conf_path.write_text("[config-cli10]\nint_param = 5")
+    result = invoke(config_cli10, *args, color=False)
+    assert result.exit_code == 0
+    assert result.stdout == "int_param is 5\nstr_param is 'default'\n"
+    _, conf = marshal.loads(snapshot_path.read_bytes())
+    assert conf == {"config-cli10": {"int_param": 5}}
+
+
+def test_config_snapshot_key(monkeypatch):
+    @click.command
+    @option("--int-param", type=int, default=10)
+    def cli(int_param):
+        pass
+
+    def key(**attrs):
+        config_opt = ConfigOption(snapshot=True)
+        for name, value in attrs.items():
+            setattr(config_opt, name, value)
+        cli.params.append(config_opt)
+        try:
+            with click.Context(cli):
+                return config_opt.snapshot_key("int_param = 3")
+        finally:
+            cli.params.remove(config_opt)
+
+    reference = key()
+    assert key() == reference
+    # Everything changing the parsed and merged configuration changes the key.
+    assert key(strict=True) != reference
+    assert key(formats=[Formats.TOML]) != reference
+    assert key(yaml_safe=False) != reference
+    monkeypatch.setitem(ParamStructure.TYPE_CONVERTERS, int, lambda value: value)
+    assert key() != reference
@@ -26,7 +26,13 @@ from pytest_cases import parametrize
 
 from click_extra import echo
 from click_extra.decorators import extra_command, verbosity_option
-from click_extra.logging import DEFAULT_LEVEL, LOG_LEVELS
+from click_extra.logging import (
+    DEFAULT_LEVEL,
+    LOG_LEVELS,
+    ExtraLogHandler,
+    VerbosityOption,
+    configure_root_logger,
+)
 
 from .conftest import (
     command_decorators,
@@ -54,6 +60,34 @@ def test_root_logger_defaults():
     assert logging.root.level == DEFAULT_LEVEL
 
 
+def test_deferred_root_logger_setup(invoke, monkeypatch, request):
+    """Root logger is only configured on first invocation, and only once."""
+    configure_root_logger.cache_clear()
+    # Handlers are restored on teardown: forget about our setup too.
+    request.addfinalizer(configure_root_logger.cache_clear)
+    sentinel = logging.NullHandler()
+    monkeypatch.setattr(logging.root, "handlers", [sentinel])
+
+    @extra_command
+    def cli():
+        echo("It works!")
+
+    VerbosityOption()
+    VerbosityOption(default_logger="my_logger")
+    assert logging.root.handlers == [sentinel]
+
+    result = invoke(cli, "--verbosity", "DEBUG", color=False)
+    assert result.exit_code == 0
+    assert "debug: Set <RootLogger root (DEBUG)> to DEBUG.\n" in result.stderr
+    handlers = logging.root.handlers.copy()
+    assert len(handlers) == 1
+    assert isinstance(handlers[0], ExtraLogHandler)
+
+    result = invoke(cli, color=False)
+    assert result.exit_code == 0
+    assert logging.root.handlers == handlers
+
+
 @pytest.mark.parametrize(
     ("cmd_decorator", "cmd_type"),
     command_decorators(with_types=True),
@@ -27,7 +27,16 @@ from tabulate import tabulate
 
 from click_extra import command, echo, get_app_dir, option, pass_context
 from click_extra.decorators import extra_command, extra_group, show_params_option
-from click_extra.parameters import ShowParamsOption, extend_envvars, normalize_envvar
+from click_extra.parameters import (
+    IndexedParam,
+    ShowParamsOption,
+    convert_to_bool,
+    convert_to_dict,
+    convert_to_int,
+    extend_envvars,
+    normalize_envvar,
+    search_params,
+)
 from click_extra.platforms import is_windows
 
 from .conftest import command_decorators
@@ -67,6 +76,32 @@ def test_normalize_envvar(env_name, normalized_env):
     assert normalize_envvar(env_name) == normalized_env
 
 
+@pytest.mark.parametrize(
+    ("converter", "value", "expected"),
+    (
+        (convert_to_int, 3, 3),
+        (convert_to_int, 3.0, 3),
+        (convert_to_int, " 3 ", 3),
+        (convert_to_int, 3.5, ValueError),
+        (convert_to_int, True, ValueError),
+        (convert_to_bool, True, True),
+        (convert_to_bool, 1, True),
+        (convert_to_bool, 0, False),
+        (convert_to_bool, "off", False),
+        (convert_to_bool, 2, ValueError),
+        (convert_to_dict, {"a": 1}, {"a": 1}),
+        (convert_to_dict, '{"a": [1, 2]}', {"a": [1, 2]}),
+        (convert_to_dict, "[1, 2]", ValueError),
+    ),
+)
+def test_converters(converter, value, expected):
+    if expected is ValueError:
+        with pytest.raises(ValueError):
+            converter(value)
+    else:
+        assert converter(value) == expected
+
+
 @pytest.mark.parametrize(
     ("cmd_decorator", "option_help"),
     (
@@ -451,3 +486,40 @@ def test_integrated_show_params_option(invoke, create_config):
     assert result.stdout == f"{output}\n"
 
     assert f"debug: click_extra.raw_args: {raw_args}" in result.stderr
+
+
+def test_params_index(invoke):
+    @extra_group(params=[])
+    @option("--int-param", type=int, envvar="MY_INT")
+    @show_params_option
+    def index_cli(int_param):
+        pass
+
+    @index_cli.command(params=[])
+    @option("--list-param", multiple=True)
+    def subcommand(list_param):
+        pass
+
+    result = invoke(index_cli, "--show-params")
+    assert result.exit_code == 0
+
+    show_params = search_params(index_cli.params, ShowParamsOption)
+    index = show_params.params_index
+    assert list(index) == [
+        ("index-cli", "int_param"),
+        ("index-cli", "show_params"),
+        ("index-cli", "subcommand", "list_param"),
+    ]
+    assert [entry.python_type for entry in index.values()] == [int, bool, list]
+    for path, entry in index.items():
+        assert isinstance(entry, IndexedParam)
+        assert entry.param is show_params.get_tree_value(
+            show_params.params_objects, *path
+        )
+        assert entry.python_type is show_params.get_tree_value(
+            show_params.params_types, *path
+        )
+    assert index["index-cli", "int_param"].envvars == (
+        "MY_INT",
+        "INDEX_CLI_INT_PARAM",
+    )
@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import functools
+import os
 from itertools import combinations
 
 import pytest
@@ -44,6 +45,7 @@ from click_extra.platforms import (
     NON_OVERLAPPING_GROUPS,
     OPENBSD,
     OTHER_UNIX,
+    PLATFORM_ENVVAR,
     SOLARIS,
     SUNOS,
     SYSTEM_V,
@@ -54,7 +56,9 @@ from click_extra.platforms import (
     WSL1,
     WSL2,
     Group,
+    Platform,
     current_os,
+    get_cache_dir,
     is_aix,
     is_cygwin,
     is_freebsd,
@@ -375,3 +379,80 @@ def test_unless_windows():
     assert not is_linux()
     assert not is_macos()
     assert is_windows()
+
+
+@pytest.fixture()
+def force_platform(monkeypatch):
+    """Returns a function forcing the current platform, and resets the cached
+    detection before and after the test."""
+
+    def clear_caches():
+        current_os.cache_clear()
+        for p in ALL_PLATFORMS:
+            getattr(platforms_module, f"is_{p.id}").cache_clear()
+
+    def _force_platform(platform_id):
+        monkeypatch.setenv(PLATFORM_ENVVAR, platform_id)
+        clear_caches()
+
+    yield _force_platform
+    monkeypatch.undo()
+    clear_caches()
+
+
+def test_lazy_platform_detection(force_platform):
+    # Heuristics are only run on first access to the current attribute.
+    platform = Platform("macos", "macOS")
+    assert "current" not in vars(platform)
+    force_platform("macos")
+    assert platform.current is True
+    assert vars(platform)["current"] is True
+    # Current flag is not part of the dataclass fields.
+    assert platform == MACOS
+    assert repr(platform) == "Platform(id='macos', name='macOS')"
+
+
+@pytest.mark.parametrize("forced_id", [p.id for p in ALL_PLATFORMS])
+def test_forced_platform(force_platform, forced_id):
+    force_platform(forced_id.upper())
+    assert current_os().id == forced_id
+    assert platforms_module.CURRENT_OS_ID == forced_id
+    assert {p.id for p in ALL_PLATFORMS if Platform(p.id, p.name).current} == {
+        forced_id,
+    }
+    # Heuristics agree with the forced platform.
+    assert {
+        p.id for p in ALL_PLATFORMS if getattr(platforms_module, f"is_{p.id}")()
+    } == {forced_id}
+
+
+def test_unrecognized_forced_platform(force_platform):
+    force_platform("amigaos")
+    with pytest.raises(ValueError, match="Unrecognized 'amigaos' platform ID"):
+        current_os()
+
+
+@unless_linux
+def test_get_cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert get_cache_dir("my-cli") == str(tmp_path / "my-cli")
+    monkeypatch.delenv("XDG_CACHE_HOME")
+    assert get_cache_dir("my-cli").endswith("/.cache/my-cli")
+
+
+@pytest.mark.parametrize(
+    ("forced_id", "expected"),
+    (
+        ("windows", ("local-app-data", "my-cli", "Cache")),
+        ("macos", ("Library", "Caches", "my-cli")),
+        ("linux", ("xdg-cache", "my-cli")),
+    ),
+)
+def test_forced_platform_cache_dir(
+    force_platform, monkeypatch, tmp_path, forced_id, expected
+):
+    force_platform(forced_id)
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "local-app-data"))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg-cache"))
+    monkeypatch.setenv("HOME", str(tmp_path))
+    assert get_cache_dir("my-cli") == os.path.join(tmp_path, *expected)
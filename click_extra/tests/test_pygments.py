@@ -27,6 +27,7 @@ if sys.version_info >= (3, 11):
 else:
     import tomli as tomllib  # type: ignore[import]
 
+import pytest
 import requests
 from boltons.strutils import camel2under
 from boltons.typeutils import issubclass
@@ -38,7 +39,14 @@ from pygments.lexer import Lexer
 from pygments.lexers import find_lexer_class_by_name, get_lexer_by_name
 
 from click_extra import pygments as extra_pygments
-from click_extra.pygments import DEFAULT_TOKEN_TYPE, collect_session_lexers
+from click_extra.pygments import (
+    DEFAULT_TOKEN_TYPE,
+    SESSION_LEXERS,
+    SESSION_LEXERS_PYGMENTS_VERSION,
+    collect_session_lexers,
+    find_session_lexers,
+    session_lexers_index,
+)
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
@@ -145,12 +153,59 @@ def test_ansi_lexers_candidates(tmp_path):
     assert lexer_classes.issubset(collect_session_lexers())
 
 
+def test_session_lexers_index():
+    """Check the static index of session lexers is in sync with installed Pygments.
+
+    If this test fails, regenerate the index with:
+
+    .. code-block:: shell-session
+
+        $ python -m click_extra.docs_update
+    """
+    found_lexers = {lexer.__name__: lexer.__module__ for lexer in find_session_lexers()}
+    assert found_lexers == SESSION_LEXERS, (
+        f"Index generated for Pygments {SESSION_LEXERS_PYGMENTS_VERSION} is outdated "
+        f"for Pygments {metadata.version('pygments')}."
+    )
+
+
+def test_session_lexers_index_version(monkeypatch):
+    """The static index is only used with the version of Pygments it was generated
+    for."""
+    monkeypatch.setattr(
+        extra_pygments.pygments, "__version__", SESSION_LEXERS_PYGMENTS_VERSION
+    )
+    session_lexers_index.cache_clear()
+    assert session_lexers_index() is SESSION_LEXERS
+
+    # Lexers are discovered with any other version.
+    monkeypatch.setattr(extra_pygments.pygments, "__version__", "0.0.0")
+    session_lexers_index.cache_clear()
+    index = session_lexers_index()
+    assert index is not SESSION_LEXERS
+    found_lexers = {lexer.__name__: lexer.__module__ for lexer in find_session_lexers()}
+    assert index == found_lexers
+
+    session_lexers_index.cache_clear()
+
+
+def test_lexer_map():
+    lexer_map = extra_pygments.lexer_map
+    # The map is built once, then cached.
+    assert extra_pygments.lexer_map is lexer_map
+    assert set(lexer_map) == set(collect_session_lexers())
+    for lexer, ansi_lexer in lexer_map.items():
+        assert ansi_lexer is getattr(extra_pygments, f"Ansi{lexer.__name__}")
+        assert issubclass(ansi_lexer, lexer)
+
+
 def collect_classes(klass, prefix="Ansi"):
     """Returns all classes defined in ``click_extra.pygments`` that are a
     subclass of ``klass``, and whose name starts with the provided ``prefix``.
     """
     klasses = {}
-    for name, var in extra_pygments.__dict__.items():
+    for name in dir(extra_pygments):
+        var = getattr(extra_pygments, name)
         if issubclass(var, klass) and name.startswith(prefix):
             klasses[name] = var
     return klasses
@@ -196,7 +251,8 @@ def test_lexer_entry_points():
     for lexer in collect_session_lexers():
         # Check an ANSI lexer variant is available for import from Click Extra.
         ansi_lexer_id = f"Ansi{lexer.__name__}"
-        assert ansi_lexer_id in extra_pygments.__dict__
+        assert ansi_lexer_id in dir(extra_pygments)
+        assert getattr(extra_pygments, ansi_lexer_id).__name__ == ansi_lexer_id
 
         # Transform ANSI lexer class ID into entry point ID.
         entry_id = "-".join(
@@ -0,0 +1,266 @@
+# Copyright Kevin Deldycke <kevin@deldycke.com> and contributors.
+#
+# This program is Free Software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from dataclasses import asdict
+from importlib.util import module_from_spec, spec_from_file_location
+from textwrap import dedent
+
+import pytest
+
+from click_extra import snapshot as snapshot_module
+from click_extra.commands import ExtraCommand, ExtraGroup, ExtraLazyGroup
+from click_extra.snapshot import CommandSnapshot, fingerprint, load_snapshot
+
+CLI_SOURCE = dedent(
+    """\
+    from click_extra import ExtraLazyGroup, argument, echo, extra_command, extra_group
+    from click_extra import option
+
+    @extra_group(
+        cls=ExtraLazyGroup,
+        snapshot={snapshot_path!r},
+        lazy_subcommands={{
+            "subcommand-a": "snapcli:subcommand_a",
+            "subcommand-b": "snapcli:subcommand_b",
+        }},
+    )
+    def snapcli():
+        pass
+
+    @extra_command(aliases=["sub-a"])
+    @option("--dummy-flag", is_flag=True)
+    def subcommand_a(dummy_flag):
+        \"\"\"First subcommand.\"\"\"
+        echo("a")
+
+    @extra_command(hidden=True)
+    @argument("path")
+    def subcommand_b(path):
+        \"\"\"Second subcommand.\"\"\"
+        echo("b")
+    """,
+)
+
+
+@pytest.fixture()
+def load_snapcli(tmp_path, monkeypatch):
+    """Returns a function loading a fresh CLI with snapshot enabled from a real source
+    file, whose lazy subcommands are not imported yet."""
+    snapshot_path = tmp_path / "cache" / "command-tree.json"
+    source = tmp_path / "snapcli.py"
+    source.write_text(CLI_SOURCE.format(snapshot_path=str(snapshot_path)))
+
+    def _load_snapcli():
+        spec = spec_from_file_location("snapcli", source)
+        module = module_from_spec(spec)
+        monkeypatch.setitem(sys.modules, "snapcli", module)
+        spec.loader.exec_module(module)
+        return module.snapcli
+
+    return _load_snapcli
+
+
+@pytest.fixture()
+def snapcli(load_snapcli):
+    return load_snapcli()
+
+
+def test_snapshot_help(invoke, snapcli, load_snapcli):
+    live = invoke(snapcli, "--help", color=False)
+    assert live.exit_code == 0
+    assert snapcli.snapshot_path.exists()
+    assert "subcommand-a (sub-a)  First subcommand." in live.stdout
+    assert "subcommand-b" not in live.stdout
+
+    # A new process with the same CLI serves the help screen from the snapshot, and
+    # doesn't import any subcommand.
+    fresh_cli = load_snapcli()
+
+    def forbidden(ctx, cmd_name):
+        raise AssertionError
+
+    fresh_cli.get_command = forbidden
+    result = invoke(fresh_cli, "--help", color=False)
+    assert result.exit_code == 0
+    assert result.stdout == live.stdout
+
+    # Once all subcommands are imported, live commands are used instead.
+    del fresh_cli.get_command
+    ctx = fresh_cli.context_class(fresh_cli, info_name="snapcli")
+    for name in fresh_cli.list_commands(ctx):
+        fresh_cli.get_command(ctx, name)
+    fresh_cli.get_command = forbidden
+    assert fresh_cli.command_tree(ctx) is None
+    result = invoke(fresh_cli, "--help", color=False)
+    assert result.stdout == live.stdout
+
+
+def test_snapshot_content(snapcli):
+    ctx = snapcli.context_class(snapcli, info_name="snapcli")
+    tree = snapcli.command_tree(ctx)
+    assert set(tree.commands) == {"subcommand-a", "subcommand-b"}
+
+    sub_a = tree.commands["subcommand-a"]
+    assert sub_a.aliases == ("sub-a",)
+    assert sub_a.help == "First subcommand."
+    assert tree.commands["subcommand-b"].hidden is True
+    assert tree.find("sub-a") is sub_a
+
+    # The tree survives a round-trip through JSON.
+    assert CommandSnapshot.from_dict(json.loads(json.dumps(asdict(tree)))) == tree
+
+
+def test_snapshot_completion(snapcli, load_snapcli):
+    ctx = snapcli.context_class(snapcli, info_name="snapcli")
+    snapcli.command_tree(ctx)
+
+    fresh_cli = load_snapcli()
+
+    def forbidden(ctx, cmd_name):
+        raise AssertionError
+
+    fresh_cli.get_command = forbidden
+    ctx = fresh_cli.context_class(fresh_cli, info_name="snapcli")
+    items = fresh_cli.shell_complete(ctx, "sub")
+    assert [(i.value, i.help) for i in items] == [
+        ("subcommand-a", "First subcommand."),
+    ]
+    assert "--help" in {i.value for i in fresh_cli.shell_complete(ctx, "--")}
+
+
+def test_dynamic_commands_completion():
+    """Subcommands not registered in sections are resolved with ``get_command()``."""
+
+    class DynamicGroup(ExtraGroup):
+        def list_commands(self, ctx):
+            return ["alpha", "beta"]
+
+        def get_command(self, ctx, cmd_name):
+            if cmd_name in ("alpha", "beta"):
+                return ExtraCommand(cmd_name, aliases=[f"{cmd_name[0]}"])
+            return None
+
+    cli = DynamicGroup("dynamic")
+    ctx = cli.context_class(cli, info_name="dynamic")
+    assert [item.value for item in cli.shell_complete(ctx, "")] == ["alpha", "beta"]
+    assert [item.value for item in cli.shell_complete(ctx, "b")] == ["beta"]
+
+
+def touch(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_snapshot_invalidation(snapcli, load_snapcli, monkeypatch):
+    source = snapcli.snapshot_path.parent.parent / "snapcli.py"
+    ctx = snapcli.context_class(snapcli, info_name="snapcli")
+    snapcli.command_tree(ctx)
+    digest = fingerprint(snapcli)
+    assert load_snapshot(snapcli.snapshot_path, digest)
+    content = json.loads(snapcli.snapshot_path.read_text())
+    assert list(content["sources"]) == [str(source)]
+
+    # Touching the source file of the CLI invalidates the snapshot.
+    touch(source)
+    assert fingerprint(snapcli) == digest
+    assert load_snapshot(snapcli.snapshot_path, digest) is None
+
+    # So does a new version of Click Extra.
+    monkeypatch.setattr(snapshot_module, "__version__", "999.0.0")
+    assert fingerprint(snapcli) != digest
+
+    # A stale snapshot is rebuilt and saved.
+    fresh_cli = load_snapcli()
+    ctx = fresh_cli.context_class(fresh_cli, info_name="snapcli")
+    fresh_cli.command_tree(ctx)
+    content = json.loads(fresh_cli.snapshot_path.read_text())
+    assert content["fingerprint"] == fingerprint(fresh_cli)
+    assert load_snapshot(fresh_cli.snapshot_path, fingerprint(fresh_cli))
+
+
+def test_snapshot_external_lazy_module(tmp_path, monkeypatch):
+    """Lazy subcommands living in another package invalidate the snapshot too."""
+    package = tmp_path / "otherpkg"
+    package.mkdir()
+    (package / "__init__.py").touch()
+    external = package / "external.py"
+    external.write_text(
+        "from click_extra import extra_command\n\n"
+        "@extra_command\n"
+        "def ext():\n"
+        "    \"\"\"External subcommand.\"\"\"\n",
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    snapshot_path = tmp_path / "command-tree.json"
+    cli = ExtraLazyGroup(
+        "extcli",
+        snapshot=snapshot_path,
+        lazy_subcommands={"ext": "otherpkg.external:ext"},
+    )
+    ctx = cli.context_class(cli, info_name="extcli")
+    assert cli.command_tree(ctx).commands["ext"].help == "External subcommand."
+    content = json.loads(snapshot_path.read_text())
+    assert str(external) in content["sources"]
+    assert load_snapshot(snapshot_path, fingerprint(cli))
+
+    touch(external)
+    assert load_snapshot(snapshot_path, fingerprint(cli)) is None
+
+    # Changing the lazy subcommands changes the fingerprint.
+    cli.lazy_subcommands["other"] = "otherpkg.external:ext"
+    assert fingerprint(cli) != content["fingerprint"]
+
+
+@pytest.mark.parametrize(
+    "content",
+    (
+        "{not json",
+        "[]",
+        "null",
+        '{"tree": {}}',
+        '{"fingerprint": "%s"}',
+        '{"fingerprint": "%s", "tree": {}}',
+        '{"fingerprint": "%s", "sources": [], "tree": {}}',
+        '{"fingerprint": "%s", "sources": {}, "tree": []}',
+        '{"fingerprint": "%s", "sources": {}, "tree": {"name": "snapcli"}}',
+        '{"fingerprint": "%s", "sources": {}, "tree": {"name": "snapcli", '
+        '"help": null, "short_help": null, "hidden": false, "deprecated": false, '
+        '"aliases": [], "sections": 1, "commands": {}}}',
+    ),
+)
+def test_corrupted_snapshot(snapcli, content):
+    if "%s" in content:
+        content %= fingerprint(snapcli)
+    snapcli.snapshot_path.parent.mkdir(parents=True)
+    snapcli.snapshot_path.write_text(content)
+    assert load_snapshot(snapcli.snapshot_path, fingerprint(snapcli)) is None
+
+    # The snapshot is rebuilt.
+    ctx = snapcli.context_class(snapcli, info_name="snapcli")
+    assert snapcli.command_tree(ctx) is not None
+    assert load_snapshot(snapcli.snapshot_path, fingerprint(snapcli))
+
+
+def test_snapshot_lazy_group_only():
+    """Snapshots only serve lazy subcommands: plain groups reject the parameter."""
+    with pytest.raises(TypeError, match="snapshot"):
+        ExtraGroup("plain", snapshot=True)
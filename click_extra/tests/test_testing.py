@@ -26,6 +26,7 @@ import pytest
 from pytest_cases import fixture, parametrize
 
 from click_extra import Style, command, echo, pass_context, secho, style
+from click_extra.logging import configure_root_logger
 from click_extra.platforms import is_windows
 from click_extra.testing import ExtraCliRunner, env_copy
 
@@ -94,6 +95,13 @@ def test_runner_empty_stderr(mix_stderr):
     assert result.stderr == ""
 
 
+@pytest.fixture(autouse=True)
+def root_logger():
+    """Plain Click commands do not set up the ``root`` logger: configure it as
+    ``VerbosityOption`` does, so log messages are rendered by ``ExtraLogHandler``."""
+    configure_root_logger()
+
+
 @click.command
 @pass_context
 def run_cli1(ctx):
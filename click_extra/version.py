@@ -27,7 +27,7 @@ from functools import cached_property
 from boltons.ecoutils import get_profile
 
 from . import Context, Parameter, Style, echo, get_current_context
-from .colorize import default_theme
+from .colorize import ColorOption, default_theme
 from .parameters import ExtraOption
 
 if TYPE_CHECKING:
@@ -202,6 +202,9 @@ class VersionOption(ExtraOption):
     def env_info(self) -> str:
         return str(get_profile(scrub=True))
 
+    fast_path_dependencies = (ColorOption,)
+    """Version string only depends on ``ColorOption`` to be rendered."""
+
     message: str = _("%(prog_name)s, version %(version)s")
     """Default message template used to render the version string."""
 